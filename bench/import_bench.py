@@ -0,0 +1,81 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# =============================
+# Import-time benchmark (core 패키지)
+# - 모듈마다 새 인터프리터에서 import 시간만 측정(다른 모듈 캐시 영향 없음), --repeat회 중앙값
+# - Streamlit이 딸려 들어오면 실패: core는 페이지 없이 CLI/HTTP API에서 써야 함
+# - 참고용으로 numpy 단독 import 시간도 같이 출력(대부분의 바닥값)
+# =============================
+MODULES = [
+    "core",
+    "core.resort_catalog",
+    "core.travel_time",
+    "core.traffic_profile",
+    "core.transit_router",
+    "core.group_planner",
+    "core.shoulder_content",
+    "core.shoulder_index",
+    "core.symptom_search",
+    "core.svg_sprite",
+    "core.service",
+    "core.http_api",
+]
+BUDGET_MS = 300.0  # numpy 포함 모듈 하나의 import 상한
+
+_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+import {module}
+t1 = time.perf_counter()
+print((t1 - t0) * 1000, int('streamlit' in sys.modules))
+"""
+
+
+def measure(module: str, repeat: int) -> Dict:
+    times: List[float] = []
+    streamlit = False
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stdout.split()
+        times.append(float(out[0]))
+        streamlit |= out[1] == "1"
+    return {"module": module, "median_ms": statistics.median(times), "min_ms": min(times), "streamlit": streamlit}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="core 모듈 import 시간 측정")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    floor = measure("numpy", args.repeat)
+    rows = [measure(m, args.repeat) for m in MODULES]
+    if args.json:
+        print(json.dumps({"numpy": floor, "modules": rows, "budget_ms": args.budget_ms}, ensure_ascii=False, indent=2))
+    else:
+        print(f"{'module':<24} {'median':>9} {'min':>9}  streamlit")
+        print(f"{'(numpy)':<24} {floor['median_ms']:>7.1f}ms {floor['min_ms']:>7.1f}ms")
+        for r in rows:
+            flag = "YES ❌" if r["streamlit"] else "no"
+            print(f"{r['module']:<24} {r['median_ms']:>7.1f}ms {r['min_ms']:>7.1f}ms  {flag}")
+
+    failed = [r["module"] for r in rows if r["streamlit"] or r["median_ms"] > args.budget_ms]
+    if failed:
+        print(f"실패: {', '.join(failed)} (Streamlit import 또는 {args.budget_ms:.0f}ms 초과)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,380 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+import streamlit
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+# =============================
+# Concurrent-session load test (실제 서버 + Streamlit 웹소켓 프로토콜)
+# - `streamlit run main.py`를 로컬 포트에 띄우고, N개의 가상 브라우저 세션이
+#   /_stcore/stream 에 접속해 BackMsg(rerun_script)를 보내고 script_finished까지의 시간을 잼
+#   (위젯 상태 누적 전송, fragment 위젯은 fragment_id로 부분 재실행, 캐시된 메시지 hash 보고 — 브라우저와 같은 방식)
+# - 시나리오: shoulder(증상 전환 + 레드플래그 체크박스), ski(max_minutes 슬라이더), mixed(세션별 번갈아)
+# - N 단계별: rerun 지연 p50/p95/p99, 처리량(rerun/s), 서버 RSS(최대) → 포화 곡선
+# - 결과는 bench/load_results.json, 저장된 곡선(bench/load_baseline.json)과 단계별 p95 비교
+#   `python bench/load_test.py --levels 1,2,4,8,16 --duration 10` / `--update-baseline`
+# =============================
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_PATH = BENCH_DIR / "load_results.json"
+BASELINE_PATH = BENCH_DIR / "load_baseline.json"
+
+# 기준 대비 이보다 커지면 회귀로 봄(같은 N에서 p95)
+P95_RATIO = 1.5
+# 시나리오별로 가장 적은 N에서의 p95 대비 이 배수를 넘는 첫 N을 포화점으로 표시
+SATURATION_FACTOR = 2.0
+
+CHECKBOX_KINDS = ("checkbox",)
+STRING_KINDS = ("selectbox", "text_input")
+
+
+# =============================
+# Server
+# =============================
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class AppServer:
+    """``streamlit run main.py`` on a free local port (network-dependent features off)."""
+
+    def __init__(self, port: Optional[int] = None):
+        self.port = port or _free_port()
+        self.proc: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> "AppServer":
+        env = dict(os.environ, APP_LINK_CHECK="off", APP_LIVE_STATUS="off")
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", "main.py",
+             "--server.headless", "true", "--server.port", str(self.port),
+             "--server.enableXsrfProtection", "false", "--browser.gatherUsageStats", "false"],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", self.port), 0.2).close()
+                return self
+            except OSError:
+                time.sleep(0.1)
+        self.__exit__()
+        raise RuntimeError("서버가 30초 안에 뜨지 않았어요")
+
+    def __exit__(self, *exc) -> None:
+        if self.proc is not None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+    def rss_mb(self) -> Optional[float]:
+        # Linux /proc 기준(psutil 없이)
+        try:
+            for line in Path(f"/proc/{self.proc.pid}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return None
+
+
+# =============================
+# Simulated browser session
+# =============================
+@dataclass
+class Widget:
+    id: str
+    kind: str
+    label: str
+    fragment_id: str
+    options: List[str]
+
+
+class Session:
+    def __init__(self, url: str):
+        self.url = url
+        self.ws = None
+        self.pages: Dict[str, str] = {}      # url_pathname → page_script_hash
+        self.page_hash = ""
+        self.widgets: Dict[str, Widget] = {}  # label → widget (현재 페이지)
+        self.states: Dict[str, WidgetState] = {}
+        self.cached: set = set()
+        self.bytes = 0
+
+    async def connect(self) -> None:
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self) -> None:
+        if self.ws is not None:
+            await self.ws.close()
+
+    def _handle(self, raw: bytes) -> Optional[int]:
+        self.bytes += len(raw)
+        msg = ForwardMsg()
+        msg.ParseFromString(raw)
+        if msg.hash and msg.metadata.cacheable:
+            self.cached.add(msg.hash)
+        kind = msg.WhichOneof("type")
+        if kind == "navigation":
+            self.pages = {p.url_pathname: p.page_script_hash for p in msg.navigation.app_pages}
+        elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            el = msg.delta.new_element
+            name = el.WhichOneof("type")
+            w = getattr(el, name, None)
+            if getattr(w, "id", ""):
+                self.widgets[w.label] = Widget(w.id, name, w.label, msg.delta.fragment_id, list(getattr(w, "options", [])))
+        elif kind == "script_finished":
+            return msg.script_finished
+        return None
+
+    async def rerun(self, fragment_id: str = "") -> float:
+        """Send one rerun request; seconds until the server reports the run finished."""
+        back = BackMsg()
+        cs = back.rerun_script
+        cs.query_string = ""
+        cs.page_script_hash = self.page_hash
+        cs.widget_states.widgets.extend(self.states.values())
+        cs.cached_message_hashes.extend(self.cached)
+        if fragment_id:
+            cs.fragment_id = fragment_id
+        t0 = time.perf_counter()
+        await self.ws.send(back.SerializeToString())
+        while True:
+            status = self._handle(await self.ws.recv())
+            if status is None or status == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                continue
+            if status == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                raise RuntimeError("스크립트 컴파일 오류")
+            return time.perf_counter() - t0
+
+    async def goto(self, pathname: str) -> float:
+        self.page_hash = self.pages.get(pathname, "")
+        self.widgets.clear()
+        self.states.clear()
+        return await self.rerun()
+
+    def find(self, label_prefix: str) -> Widget:
+        for label, w in self.widgets.items():
+            if label.startswith(label_prefix):
+                return w
+        raise KeyError(f"위젯 없음: {label_prefix}")
+
+    async def set(self, label_prefix: str, value) -> float:
+        w = self.find(label_prefix)
+        state = WidgetState(id=w.id)
+        if w.kind in CHECKBOX_KINDS:
+            state.bool_value = bool(value)
+        elif w.kind in STRING_KINDS:
+            state.string_value = str(value)
+        elif w.kind == "slider":
+            state.double_array_value.data.append(float(value))
+        else:
+            raise ValueError(f"지원하지 않는 위젯: {w.kind}")
+        self.states[w.id] = state
+        return await self.rerun(w.fragment_id)
+
+
+# =============================
+# Interaction scripts (세션 하나가 반복하는 행동)
+# =============================
+RED_FLAGS = ("🧨", "🌡️", "⚡")
+
+
+async def shoulder_script(s: Session, rng: random.Random) -> Callable:
+    await s.rerun()
+    symptoms = s.find("어떤 증상이").options
+    flags = {f: False for f in RED_FLAGS}
+
+    async def step() -> float:
+        if rng.random() < 0.5:
+            return await s.set("어떤 증상이", rng.choice(symptoms))
+        f = rng.choice(RED_FLAGS)
+        flags[f] = not flags[f]
+        return await s.set(f, flags[f])  # fragment 안 체크박스 → 부분 재실행
+
+    return step
+
+
+async def ski_script(s: Session, rng: random.Random) -> Callable:
+    await s.rerun()
+    await s.goto("ski")
+
+    async def step() -> float:
+        return await s.set("최대 소요시간", rng.randrange(60, 250, 10))
+
+    return step
+
+
+SCRIPTS = {"shoulder": shoulder_script, "ski": ski_script}
+
+
+# =============================
+# Levels
+# =============================
+def _pct(values: List[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    v = sorted(values)
+    return v[min(len(v) - 1, int(round(q * (len(v) - 1))))]
+
+
+async def _user(url: str, script: str, seed: int, stop_at: float, think: float,
+                latencies: Dict[str, List[float]], errors: List[str]) -> None:
+    rng = random.Random(seed)
+    s = Session(url)
+    try:
+        await s.connect()
+        step = await SCRIPTS[script](s, rng)
+        while time.monotonic() < stop_at:
+            latencies.setdefault(script, []).append(await step())
+            await asyncio.sleep(rng.uniform(0.5, 1.5) * think)
+    except Exception as e:  # 세션 하나의 실패는 기록만 하고 단계는 계속
+        errors.append(f"{script}: {type(e).__name__}: {e}")
+    finally:
+        await s.close()
+
+
+async def run_level(server: AppServer, n: int, scenario: str, duration: float, think: float, seed: int) -> Dict:
+    latencies: Dict[str, List[float]] = {}
+    errors: List[str] = []
+    rss: List[float] = []
+    stop_at = time.monotonic() + duration
+
+    async def sample_rss():
+        while time.monotonic() < stop_at:
+            r = server.rss_mb()
+            if r is not None:
+                rss.append(r)
+            await asyncio.sleep(0.25)
+
+    scripts = [scenario if scenario != "mixed" else ("shoulder", "ski")[i % 2] for i in range(n)]
+    t0 = time.monotonic()
+    await asyncio.gather(
+        sample_rss(),
+        *(_user(server.url, scripts[i], seed + i, stop_at, think, latencies, errors) for i in range(n)),
+    )
+    wall = time.monotonic() - t0
+    ms = [x * 1000 for xs in latencies.values() for x in xs]
+    return {
+        "sessions": n,
+        "reruns": len(ms),
+        "throughput_rps": len(ms) / wall if wall else 0.0,
+        "p50_ms": _pct(ms, 0.50),
+        "p95_ms": _pct(ms, 0.95),
+        "p99_ms": _pct(ms, 0.99),
+        "mean_ms": statistics.fmean(ms) if ms else float("nan"),
+        "by_script": {
+            name: {"reruns": len(xs), "p50_ms": _pct([x * 1000 for x in xs], 0.50), "p95_ms": _pct([x * 1000 for x in xs], 0.95)}
+            for name, xs in sorted(latencies.items())
+        },
+        "rss_mb": max(rss) if rss else None,
+        "errors": errors[:5],
+        "error_count": len(errors),
+    }
+
+
+def saturation_point(levels: List[Dict], factor: float = SATURATION_FACTOR) -> Optional[int]:
+    """First N where any script's p95 exceeds ``factor`` × its p95 at the lowest N it ran at (None if never)."""
+    base: Dict[str, float] = {}
+    for lv in levels:
+        for name, st in lv["by_script"].items():
+            if name not in base:
+                base[name] = st["p95_ms"]
+            elif st["p95_ms"] > base[name] * factor:
+                return lv["sessions"]
+    return None
+
+
+def compare(results: Dict, baseline: Dict) -> List[str]:
+    regressions = []
+    base = {(lv["sessions"]): lv for lv in baseline.get("levels", [])}
+    for lv in results["levels"]:
+        b = base.get(lv["sessions"])
+        if b and b["p95_ms"] and lv["p95_ms"] > b["p95_ms"] * P95_RATIO:
+            regressions.append(f"N={lv['sessions']}: p95 {b['p95_ms']:.0f} → {lv['p95_ms']:.0f} ms")
+    return regressions
+
+
+def _print_level(lv: Dict) -> None:
+    rss = f"{lv['rss_mb']:.0f} MB" if lv["rss_mb"] is not None else "—"
+    err = f"  ⚠️ 오류 {lv['error_count']}" if lv["error_count"] else ""
+    per = "  ".join(f"{name} p95 {st['p95_ms']:.0f}" for name, st in lv["by_script"].items())
+    print(f"N={lv['sessions']:>3}  reruns {lv['reruns']:>5}  {lv['throughput_rps']:6.1f} rerun/s  "
+          f"p50 {lv['p50_ms']:7.1f}  p95 {lv['p95_ms']:7.1f}  p99 {lv['p99_ms']:7.1f} ms  RSS {rss}  ({per}){err}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="동시 세션 부하 테스트(웹소켓)")
+    parser.add_argument("--levels", default="1,2,4,8,16", help="동시 세션 수(쉼표 구분, 오름차순)")
+    parser.add_argument("--scenario", choices=["mixed", *SCRIPTS], default="mixed")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--think", type=float, default=0.5, help="행동 사이 평균 대기(초), 0이면 쉬지 않고 재실행")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    levels = [int(x) for x in args.levels.split(",") if x.strip()]
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "cpus": os.cpu_count(),
+            "scenario": args.scenario,
+            "duration_s": args.duration,
+            "think_s": args.think,
+        },
+        "levels": [],
+    }
+    with AppServer() as server:
+        # 캐시 리소스(콘텐츠 팩/카탈로그 등) 워밍업: 세션 하나로 두 페이지를 한 번씩
+        asyncio.run(run_level(server, 2, "mixed", 1.0, 0.0, args.seed))
+        results["meta"]["rss_idle_mb"] = server.rss_mb()
+        for n in levels:
+            lv = asyncio.run(run_level(server, n, args.scenario, args.duration, args.think, args.seed))
+            results["levels"].append(lv)
+            _print_level(lv)
+
+    knee = saturation_point(results["levels"])
+    results["saturation_sessions"] = knee
+    print(f"포화점(시나리오별 최소 N p95의 {SATURATION_FACTOR:g}배 초과): {f'N={knee}' if knee else '측정 범위 안에서 없음'}")
+
+    RESULTS_PATH.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"📄 {RESULTS_PATH}")
+    if args.update_baseline:
+        BASELINE_PATH.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"✅ baseline 갱신: {BASELINE_PATH}")
+        return 0
+    if BASELINE_PATH.exists():
+        regressions = compare(results, json.loads(BASELINE_PATH.read_text(encoding="utf-8")))
+        for r in regressions:
+            print(f"  ⚠️ {r}")
+        print(f"기준 대비: 회귀 {len(regressions)}건")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
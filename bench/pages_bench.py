@@ -0,0 +1,232 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+# 링크 점검/실시간 현황(네트워크 상태)에 따라 카드 내용이 달라지지 않도록 끔
+os.environ.setdefault("APP_LINK_CHECK", "off")
+os.environ.setdefault("APP_LIVE_STATUS", "off")
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+from core.resort_catalog import DIFFICULTY_BUCKETS, MODES
+
+# =============================
+# Page benchmark (headless, AppTest)
+# - 시나리오마다: 스크립트 실행 시간(ms), 생성된 요소 수, 직렬화된 페이로드 bytes
+# - shoulder: 증상 전체 + 레드플래그 체크박스 조합 전체(증상별)
+# - ski: 이동수단 × 최대 소요시간 × 난이도 성향 (+ 표 보기)
+# - 결과는 bench/results.json, 저장된 기준(bench/baseline.json)과 비교
+#   `python bench/pages_bench.py` / `--update-baseline` / `--full`
+# =============================
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_PATH = BENCH_DIR / "results.json"
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+
+# 기준 대비 이보다 커지면 회귀로 봄
+TIME_RATIO = 1.25
+BYTES_RATIO = 1.02
+
+
+# AppTest는 실행이 끝나면 ForwardMsg를 트리로만 남기므로, 실행기에서 직접 집계
+_last_run: Dict[str, int] = {}
+_orig_run = LocalScriptRunner.run
+
+
+def _counting_run(self, *args, **kwargs):
+    tree = _orig_run(self, *args, **kwargs)
+    deltas = [m for m in self.forward_msgs() if m.WhichOneof("type") == "delta"]
+    _last_run["elements"] = sum(1 for m in deltas if m.delta.WhichOneof("type") == "new_element")
+    _last_run["bytes"] = sum(m.ByteSize() for m in deltas)
+    return tree
+
+
+LocalScriptRunner.run = _counting_run
+
+
+Scenario = Tuple[str, Callable[[AppTest], None]]
+
+
+def _measure(at: AppTest, step: Callable[[AppTest], None], repeat: int) -> Dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        step(at)
+        t0 = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - t0) * 1000)
+        if at.exception:
+            raise RuntimeError(f"script raised: {at.exception[0].value}")
+    return {"ms": round(statistics.median(times), 3), "elements": _last_run["elements"], "bytes": _last_run["bytes"]}
+
+
+def _app(path: str) -> AppTest:
+    return AppTest.from_file(str(ROOT / path), default_timeout=60)
+
+
+def _by_label(widgets, prefix: str):
+    return next(w for w in widgets if w.label.startswith(prefix))
+
+
+# =============================
+# Scenarios
+# =============================
+def shoulder_scenarios() -> Iterator[Scenario]:
+    from core.shoulder_content import load_pack
+
+    symptoms = list(load_pack().symptoms)
+    for i, name in enumerate(symptoms):
+        for combo in itertools.product((False, True), repeat=3):
+            flags = "".join("1" if c else "0" for c in combo)
+
+            def step(at, name=name, combo=combo):
+                _by_label(at.selectbox, "어떤 증상").set_value(name)
+                for box, value in zip(at.checkbox[:3], combo):
+                    box.set_value(value)
+
+            yield f"shoulder:symptom={i}|flags={flags}", step
+
+
+def ski_scenarios(full: bool, previews: bool) -> Iterator[Scenario]:
+    if full:
+        prefs = [list(c) for n in range(len(DIFFICULTY_BUCKETS) + 1)
+                 for c in itertools.combinations(DIFFICULTY_BUCKETS, n)]
+    else:
+        # 전체 / 하나씩 / 없음
+        prefs = [list(DIFFICULTY_BUCKETS)] + [[b] for b in DIFFICULTY_BUCKETS] + [[]]
+    for mode in MODES:
+        for max_minutes in range(60, 241, 10):
+            for pref in prefs:
+                diff = "+".join(str(DIFFICULTY_BUCKETS.index(b)) for b in pref) or "none"
+
+                def step(at, mode=mode, max_minutes=max_minutes, pref=pref, table=False):
+                    _by_label(at.toggle, "📊").set_value(table)
+                    box = _by_label(at.checkbox, "슬로프맵 미리보기")
+                    if not box.proto.disabled:  # 표 보기 중엔 비활성(값은 그대로 유지됨)
+                        box.set_value(previews)
+                    _by_label(at.selectbox, "이동수단").set_value(mode)
+                    _by_label(at.slider, "최대 소요시간").set_value(max_minutes)
+                    _by_label(at.multiselect, "선호 난이도").set_value(pref)
+
+                yield f"ski:mode={MODES.index(mode)}|max={max_minutes}|diff={diff}", step
+                # 표 보기(결과 전체를 st.dataframe 하나로)는 난이도 전체 선택일 때만 — 카드와 요소 수/bytes 비교용
+                if len(pref) == len(DIFFICULTY_BUCKETS):
+                    yield (f"ski:mode={MODES.index(mode)}|max={max_minutes}|diff={diff}|view=table",
+                           lambda at, step=step: step(at, table=True))
+
+
+PAGES = {
+    "shoulder": ("main.py", lambda args: shoulder_scenarios()),
+    "introduce": ("pages/00_introduce.py", lambda args: iter(())),
+    "ski": ("pages/01_ski.py", lambda args: ski_scenarios(args.full, args.previews)),
+}
+
+
+def run_page(page: str, args) -> Dict[str, Dict[str, float]]:
+    path, scenarios = PAGES[page]
+    results = {}
+    # 세션 첫 실행(콜드) → 이후 같은 세션에서 위젯만 바꿔 재실행(웜)
+    at = _app(path)
+    results[f"{page}:cold"] = _measure(at, lambda at: None, 1)
+    results[f"{page}:rerun"] = _measure(at, lambda at: None, args.repeat)
+    for name, step in scenarios(args):
+        results[name] = _measure(at, step, args.repeat)
+    return results
+
+
+# =============================
+# Baseline comparison
+# =============================
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict]) -> Tuple[List[str], Dict[str, float]]:
+    # 시간은 시나리오 하나(수십 ms)로는 흔들림이 커서 페이지별 중앙값 비율로 판정,
+    # bytes/요소 수는 결정적이므로 시나리오마다 비교
+    regressions = []
+    ratios: Dict[str, List[float]] = {}
+    for name, r in results.items():
+        b = baseline.get(name)
+        if not b:
+            continue
+        ratios.setdefault(name.split(":", 1)[0], []).append(r["ms"] / max(b["ms"], 1e-9))
+        if r["bytes"] > b["bytes"] * BYTES_RATIO:
+            regressions.append(f"{name}: {b['bytes']:,} → {r['bytes']:,} bytes")
+        if r["elements"] > b["elements"]:
+            regressions.append(f"{name}: {b['elements']} → {r['elements']} elements")
+    page_ratio = {page: round(statistics.median(rs), 3) for page, rs in ratios.items()}
+    for page, ratio in page_ratio.items():
+        if ratio > TIME_RATIO:
+            regressions.append(f"{page}: 실행 시간 중앙값 ×{ratio}")
+    summary = {
+        "compared": sum(len(rs) for rs in ratios.values()),
+        "missing": len(set(baseline) - set(results)),
+        "new": len(set(results) - set(baseline)),
+        "time_ratio_median": page_ratio,
+    }
+    return regressions, summary
+
+
+def _totals(results: Dict[str, Dict], page: str) -> str:
+    rows = [r for k, r in results.items() if k.startswith(f"{page}:")]
+    ms = sorted(r["ms"] for r in rows)
+    return (f"{page:<10} {len(rows):>4} scenarios  p50 {statistics.median(ms):7.1f} ms  "
+            f"max {ms[-1]:7.1f} ms  bytes/run {statistics.mean(r['bytes'] for r in rows):9,.0f}  "
+            f"elements/run {statistics.mean(r['elements'] for r in rows):5.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="페이지 벤치마크(AppTest)")
+    parser.add_argument("--pages", default=",".join(PAGES), help="쉼표 구분: " + ",".join(PAGES))
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복(중앙값)")
+    parser.add_argument("--full", action="store_true", help="ski 난이도 성향 조합 전체(2^5)")
+    parser.add_argument("--previews", action="store_true", help="ski 슬로프맵 미리보기 포함(네트워크)")
+    parser.add_argument("--out", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    results: Dict[str, Dict] = {}
+    for page in args.pages.split(","):
+        results.update(run_page(page.strip(), args))
+        print(_totals(results, page.strip()))
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "machine": platform.machine(),
+            "repeat": args.repeat,
+        },
+        "scenarios": results,
+    }
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+        print(f"✅ baseline 갱신: {args.baseline}")
+        return 0
+
+    status = 0
+    if args.baseline.is_file():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["scenarios"]
+        regressions, summary = compare(results, baseline)
+        report["comparison"] = {**summary, "regressions": regressions}
+        print(f"기준 대비: {summary['compared']}개 비교 · 페이지별 시간 비율 {summary['time_ratio_median']} · "
+              f"신규 {summary['new']} · 누락 {summary['missing']}")
+        for line in regressions:
+            print(f"  ⚠️ {line}")
+        status = 1 if regressions else 0
+    args.out.write_text(json.dumps(report, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    print(f"📄 {args.out}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,8 @@
+# =============================
+# core — Streamlit 없이 쓰는 도메인 로직
+# - resort_catalog / travel_time / traffic_profile / group_planner: 스키장 검색
+# - shoulder_content / shoulder_index / symptom_search / svg_sprite: 어깨 가이드
+# - service: 위 모듈을 묶은 SkiPlanner / ShoulderGuide (페이지, CLI, HTTP API 공용)
+# - `python -m core --help` (CLI), `python -m core serve` (로컬 JSON API)
+# 하위 모듈은 여기서 미리 import하지 않음 → `import core` 자체는 거의 비용 없음
+# =============================
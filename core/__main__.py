@@ -0,0 +1,131 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from core.group_planner import RANKINGS
+
+# =============================
+# CLI: python -m core <command> (결과는 JSON, 스크립트/대량 질의용)
+#   ski      --origin 잠실 --mode car --max 180 [--buckets 0,3] [--day weekend --depart 07:30] [--mix 20/50/30]
+#            --mode ktx --day weekend --depart 10:00 --arrive-by   (시간표 경로, 10시까지 도착)
+#   group    잠실 마포구 "분당구 정자동" --ranking fairness ...   (ski 옵션 공통)
+#   shoulder "증상 이름" ...                                  (추천 검사/운동)
+#   search   "밤에 아파요" [--limit 5]
+#   batch    < queries.jsonl   (한 줄에 {"path": "/ski", ...} → 한 줄에 결과)
+#   serve    [--host 127.0.0.1] [--port 8765]                 (로컬 JSON API)
+# - 하위 명령에 필요한 데이터만 로드(어깨 명령은 스키 데이터를 읽지 않음)
+# =============================
+
+
+def _ski_params(args) -> dict:
+    params = {"mode": [args.mode], "max": [str(args.max)], "ranking": [args.ranking]}
+    if args.origin:
+        params["origin"] = [args.origin]
+    if args.buckets:
+        params["buckets"] = [args.buckets]
+    if args.mix:
+        params["mix"] = [args.mix]
+    # 한쪽만 준 경우도 넘겨서 parse_departure가 오류로 알려 줌(조용히 무시하지 않음)
+    if args.day:
+        params["day"] = [args.day]
+    if args.depart:
+        params["depart"] = [args.depart]
+    if args.arrive_by:
+        params["arrive_by"] = ["1"]
+    if getattr(args, "origins", None):
+        params["group"] = list(args.origins)
+    return params
+
+
+def _print(payload, pretty: bool) -> None:
+    print(json.dumps(payload, ensure_ascii=False, indent=2 if pretty else None))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m core", description="스키장/어깨 가이드 질의(JSON 출력)")
+    parser.add_argument("--pretty", action="store_true", help="들여쓰기한 JSON")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def ski_options(p):
+        p.add_argument("--mode", default="car", help="0-2 또는 car/public/ktx")
+        p.add_argument("--max", type=int, default=180, help="최대 소요시간(분)")
+        p.add_argument("--buckets", default="", help="난이도 성향 인덱스(쉼표 구분, 생략 시 전체)")
+        p.add_argument("--day", choices=["weekday", "weekend"], help="출발 요일 구분(--depart와 함께)")
+        p.add_argument("--depart", help="출발 시각 HH:MM")
+        p.add_argument("--arrive-by", action="store_true", help="--depart를 도착 희망 시각으로(--mode ktx, 시간표 경로)")
+        p.add_argument("--mix", default="", help="목표 난이도 비율 초급/중급/상급(예: 20/50/30) → 가까운 순")
+        p.add_argument("--ranking", default="worst", choices=list(RANKINGS), help="그룹 순위 기준")
+
+    p = sub.add_parser("ski", help="출발지 기준 스키장 검색")
+    p.add_argument("--origin", default="", help="출발지(구/동/역 이름 또는 '위도, 경도')")
+    ski_options(p)
+
+    p = sub.add_parser("group", help="여러 출발지 모두가 도착 가능한 스키장")
+    p.add_argument("origins", nargs="+", help="출발지 목록")
+    p.set_defaults(origin="")
+    ski_options(p)
+
+    p = sub.add_parser("shoulder", help="증상 → 추천 검사/운동")
+    p.add_argument("symptoms", nargs="+", help="증상 이름")
+
+    p = sub.add_parser("search", help="증상 자유 검색")
+    p.add_argument("query")
+    p.add_argument("--limit", type=int, default=5)
+
+    sub.add_parser("batch", help="stdin JSON lines → stdout JSON lines")
+
+    p = sub.add_parser("serve", help="로컬 JSON HTTP API")
+    p.add_argument("--host", default=None)
+    p.add_argument("--port", type=int, default=None)
+
+    args = parser.parse_args(argv)
+    if args.command == "search" and args.limit < 1:
+        parser.error(f"--limit: 1 이상이어야 해요 ({args.limit})")
+
+    from core import http_api
+    from core.service import ShoulderGuide, SkiPlanner
+
+    if args.command == "serve":
+        host = args.host or http_api.DEFAULT_HOST
+        port = args.port or http_api.DEFAULT_PORT
+        print(f"core API: http://{host}:{port}/ (/ski, /shoulder, /search, /health)", file=sys.stderr)
+        try:
+            http_api.serve(host, port)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    # 같은 라우팅/검증을 HTTP 없이 그대로 사용 → CLI와 API 결과가 항상 같음
+    if args.command == "shoulder":
+        api = http_api.Api(guide=ShoulderGuide.load())
+        path, params = "/shoulder", {"symptom": args.symptoms}
+    elif args.command == "search":
+        api = http_api.Api(guide=ShoulderGuide.load())
+        path, params = "/search", {"q": [args.query], "limit": [str(args.limit)]}
+    elif args.command == "batch":
+        api = http_api.Api.load()
+        status = 0
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                params = http_api.params_from_json(line.encode("utf-8"))
+            except (ValueError, http_api.ApiError) as e:
+                code, payload = 400, {"error": f"잘못된 줄: {e}"}
+            else:
+                code, payload = api.handle(params.pop("path", ["/ski"])[-1], params)
+            status = status or int(code != 200)
+            _print(payload, args.pretty)
+        return status
+    else:
+        api = http_api.Api(planner=SkiPlanner.load())
+        path, params = "/ski", _ski_params(args)
+
+    code, payload = api.handle(path, params)
+    _print(payload, args.pretty)
+    return 0 if code == 200 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
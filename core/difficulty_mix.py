@@ -0,0 +1,45 @@
+from typing import Sequence
+
+import numpy as np
+
+# =============================
+# Target difficulty mix (초급/중급/상급 목표 비율 → 가까운 리조트 순)
+# - 리조트 프로필: ResortCatalog.profile [resort, 3] (합 1로 정규화, 숫자 정보 없으면 NaN)
+# - 거리: 비율 벡터 간 유클리드 거리, 카탈로그 전체를 한 번에 브로드캐스트
+#   (리조트 수십~수백 개 규모 3차원이면 KD-tree 구축/탐색보다 한 번의 벡터 연산이 더 빠름)
+# - 일치도(%) = 100 × (1 − 거리 / √2)  — √2는 두 꼭짓점(예: 100/0/0 ↔ 0/100/0) 사이 최대 거리
+# - fallback: 숫자 프로필이 없는 리조트는 모든 숫자 프로필 리조트 뒤에,
+#   들어온 순서(소요시간 순 또는 그룹 순위) 그대로 — 임의의 추정 비율을 만들지 않음
+# =============================
+MIX_LABELS = ["초급", "중급", "상급"]
+MAX_DISTANCE = float(np.sqrt(2.0))
+
+
+def normalize(mix: Sequence[float]) -> np.ndarray:
+    """``(beginner, intermediate, advanced)`` in any scale → shares summing to 1."""
+    v = np.asarray(mix, dtype=np.float64)
+    if v.shape != (3,) or not np.isfinite(v).all() or (v < 0).any() or v.sum() <= 0:
+        raise ValueError("난이도 비율은 음수가 아닌 세 값(초급/중급/상급)이어야 해요")
+    return v / v.sum()
+
+
+def distances(profile: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """[..., resort] distance to ``target`` ([3] or [T, 3] for several targets); NaN without a profile."""
+    target = np.asarray(target, dtype=np.float64)
+    diff = profile - target[..., None, :]
+    return np.sqrt(np.einsum("...rk,...rk->...r", diff, diff))
+
+
+def match_percent(dist: np.ndarray) -> np.ndarray:
+    return 100.0 * (1.0 - dist / MAX_DISTANCE)
+
+
+def rank_by_mix(idx: np.ndarray, dist: np.ndarray) -> np.ndarray:
+    """Reorder ``idx`` (already filtered, display order) by distance; no-profile resorts keep their order last."""
+    d = dist[idx]
+    missing = np.isnan(d)
+    return idx[np.lexsort((np.arange(len(idx)), np.where(missing, 0.0, d), missing))]
+
+
+def format_mix(mix: Sequence[float]) -> str:
+    return "/".join(f"{round(x * 100)}" for x in normalize(mix))
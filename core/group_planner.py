@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+# =========================
+# Group trip planner
+# - 여러 출발지 × 리조트 × 이동수단 소요시간 [origin, mode, resort]을 한 번에 요약
+#   최장(가장 먼 사람), 평균, 편차, 공정성 점수 = 평균 + FAIRNESS_WEIGHT × 표준편차
+# - 순위: "worst"(최장 시간이 짧은 순) 또는 "fairness"(공정성 점수 순)
+# - 필터: 모두가 max_minutes 이내(최장 기준) + 난이도 마스크 → 배열 연산만 사용
+# =========================
+FAIRNESS_WEIGHT = 1.0
+RANKINGS = {"worst": "최장 시간 기준(가장 먼 사람)", "fairness": "공정성 기준(평균 + 편차)"}
+
+
+@dataclass(slots=True)
+class GroupSummary:
+    best: np.ndarray      # [mode, resort] 그룹 내 가장 짧은 시간
+    worst: np.ndarray     # [mode, resort] 그룹 내 가장 긴 시간
+    mean: np.ndarray      # [mode, resort]
+    std: np.ndarray       # [mode, resort]
+    fairness: np.ndarray  # [mode, resort] 낮을수록 좋음
+    has: np.ndarray       # [mode, resort]
+
+
+def summarize(times: np.ndarray, has: np.ndarray, weight: float = FAIRNESS_WEIGHT) -> GroupSummary:
+    """``times`` [origin, mode, resort] minutes (upper bound or ETA) → per mode × resort stats."""
+    t = times.astype(np.float64)
+    mean = t.mean(axis=0)
+    std = t.std(axis=0)
+    return GroupSummary(
+        best=times.min(axis=0),
+        worst=times.max(axis=0),
+        mean=mean,
+        std=std,
+        fairness=mean + weight * std,
+        has=has,
+    )
+
+
+def rank(summary: GroupSummary, m: int, by: str, max_minutes: int,
+         allowed: Optional[np.ndarray] = None, name_rank: Optional[np.ndarray] = None) -> np.ndarray:
+    """Resort indices where everyone arrives within ``max_minutes``, best first."""
+    ok = summary.has[m] & (summary.worst[m] <= max_minutes)
+    if allowed is not None:
+        ok &= allowed
+    idx = np.flatnonzero(ok)
+    primary = summary.worst[m, idx] if by == "worst" else summary.fairness[m, idx]
+    secondary = summary.mean[m, idx] if by == "worst" else summary.worst[m, idx]
+    tie = name_rank[idx] if name_rank is not None else idx
+    return idx[np.lexsort((tie, secondary, primary))]
+
+
+if __name__ == "__main__":
+    import time
+
+    from core.resort_catalog import ResortCatalog
+    from core.service import SkiPlanner, SkiQuery
+    from core.traffic_profile import TrafficProfiles
+    from core.travel_time import OriginGazetteer, TravelTimeModel
+
+    # 큰 카탈로그 흉내: 리조트 목록을 n배로 복제한 카탈로그로 planner를 만들고, 공개 API(query)로 측정
+    scale = 2000
+    base = ResortCatalog.from_json()
+    catalog = ResortCatalog(base.resorts * scale, base.origin)
+    gazetteer = OriginGazetteer.from_json()
+    planner = SkiPlanner(catalog, gazetteer, TravelTimeModel(catalog, gazetteer.resolve(catalog.origin)),
+                         TrafficProfiles.from_json(catalog))
+    origins = np.random.default_rng(0).uniform((37.4, 126.8), (37.7, 127.2), size=(50, 2))
+    query = SkiQuery(group=tuple(f"{lat:.4f}, {lon:.4f}" for lat, lon in origins), ranking="fairness")
+
+    planner.query(query)  # 워밍업
+    t0 = time.perf_counter()
+    result = planner.query(query)
+    ms = (time.perf_counter() - t0) * 1000
+    print(f"출발지 {len(origins)} × 리조트 {len(catalog):,} × 이동수단 {catalog.lo.shape[0]}: {ms:.1f} ms "
+          f"(후보 {len(result.hits):,})")
@@ -0,0 +1,165 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from core.service import RANKINGS, ShoulderGuide, SkiPlanner, SkiQuery, parse_buckets, parse_departure, parse_mix, parse_mode
+
+# =============================
+# Local JSON HTTP API (표준 라이브러리만)
+# - GET /ski?origin=잠실&mode=car&max=180&buckets=0,3&day=weekend&depart=07:30
+# - GET /ski?origin=잠실&mix=20/50/30            (목표 난이도 비율에 가까운 순)
+# - GET /ski?mode=ktx&day=weekend&depart=10:00&arrive_by=1   (시간표 경로, 10시까지 도착)
+# - GET /ski?group=잠실&group=마포구&ranking=fairness   (group 반복 = 그룹 모드)
+# - GET /shoulder?symptom=...&symptom=...          (추천 검사/운동)
+# - GET /search?q=밤에 아파요&limit=5               (증상 자유 검색)
+# - GET /health
+# - POST는 같은 키를 JSON 본문으로(리스트 값 허용) → 스크립트에서 대량 질의용
+# - 기본 127.0.0.1 바인딩(로컬 전용), 서비스 객체는 프로세스에서 한 번만 로드
+# =============================
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+Params = Dict[str, List[str]]
+
+
+class ApiError(ValueError):
+    pass
+
+
+def _one(params: Params, key: str, default: str = "") -> str:
+    values = params.get(key)
+    return values[-1] if values else default
+
+
+def _int(params: Params, key: str, default: int) -> int:
+    try:
+        return int(_one(params, key, str(default)))
+    except ValueError:
+        raise ApiError(f"{key}: 정수가 필요해요") from None
+
+
+class Api:
+    def __init__(self, planner: Optional[SkiPlanner] = None, guide: Optional[ShoulderGuide] = None):
+        # CLI는 필요한 쪽만 로드해서 넘김(없는 쪽 경로는 404)
+        self.planner = planner
+        self.guide = guide
+        self.routes: Dict[str, Callable[[Params], Dict]] = {"/health": self.health}
+        if planner is not None:
+            self.routes["/ski"] = self.ski
+        if guide is not None:
+            self.routes.update({"/shoulder": self.shoulder, "/search": self.search})
+
+    @classmethod
+    def load(cls) -> "Api":
+        return cls(SkiPlanner.load(), ShoulderGuide.load())
+
+    def health(self, params: Params) -> Dict:
+        return {
+            "ok": True,
+            "resorts": len(self.planner.catalog.resorts) if self.planner else None,
+            "symptoms": len(self.guide.symptoms) if self.guide else None,
+        }
+
+    def ski(self, params: Params) -> Dict:
+        try:
+            mode = parse_mode(_one(params, "mode", "0"))
+            day, depart = parse_departure(_one(params, "day"), _one(params, "depart"))
+            buckets = parse_buckets(_one(params, "buckets"))
+            mix = parse_mix(_one(params, "mix"))
+        except (ValueError, IndexError) as e:
+            raise ApiError(str(e)) from None
+        ranking = _one(params, "ranking", "worst")
+        if ranking not in RANKINGS:
+            raise ApiError(f"ranking: {', '.join(RANKINGS)} 중 하나")
+        q = SkiQuery(
+            origin=_one(params, "origin"),
+            mode=mode,
+            max_minutes=_int(params, "max", 180),
+            buckets=buckets,
+            day=day,
+            depart=depart,
+            group=tuple(params.get("group", ())),
+            ranking=ranking,
+            mix=mix,
+            arrive_by=_one(params, "arrive_by").lower() in ("1", "true", "yes"),
+        )
+        try:
+            result = self.planner.query(q)
+        except ValueError as e:
+            raise ApiError(str(e)) from None
+        return {"query": self.planner.summary_record(result), "results": self.planner.records(result)}
+
+    def shoulder(self, params: Params) -> Dict:
+        selected = params.get("symptom", [])
+        if not self.guide.index.canonical(selected):
+            raise ApiError(f"symptom: 알 수 있는 증상이 없어요 ({', '.join(self.guide.symptoms)})")
+        return self.guide.records(selected)
+
+    def search(self, params: Params) -> Dict:
+        q = _one(params, "q")
+        limit = _int(params, "limit", 5)
+        if limit < 1:
+            raise ApiError(f"limit: 1 이상이어야 해요 ({limit})")
+        hits = self.guide.search(q, limit=limit)
+        return {"query": q, "results": [{"symptom": s, "score": round(score, 3)} for s, score in hits]}
+
+    def handle(self, path: str, params: Params) -> Tuple[int, Dict]:
+        route = self.routes.get(path.rstrip("/") or "/health")
+        if route is None:
+            return 404, {"error": f"없는 경로: {path}", "routes": sorted(self.routes)}
+        try:
+            return 200, route(params)
+        except ApiError as e:
+            return 400, {"error": str(e)}
+
+
+def params_from_json(raw: bytes) -> Params:
+    data = json.loads(raw or b"{}")
+    if not isinstance(data, dict):
+        raise ApiError("JSON 객체가 필요해요")
+    return {k: [str(x) for x in v] if isinstance(v, list) else [str(v)] for k, v in data.items()}
+
+
+def make_handler(api: Api):
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, payload: Dict) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            self._send(*api.handle(url.path, parse_qs(url.query)))
+
+        def do_POST(self):
+            url = urlsplit(self.path)
+            try:
+                params = params_from_json(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+            except (ValueError, ApiError) as e:
+                self._send(400, {"error": f"잘못된 본문: {e}"})
+                return
+            self._send(*api.handle(url.path, params))
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, api: Optional[Api] = None,
+          background: bool = False) -> ThreadingHTTPServer:
+    """Start the API; blocks unless ``background`` (then returns the running server)."""
+    server = ThreadingHTTPServer((host, port), make_handler(api or Api.load()))
+    if background:
+        threading.Thread(target=server.serve_forever, name="core-http-api", daemon=True).start()
+        return server
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+    return server
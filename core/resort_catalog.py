@@ -0,0 +1,176 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# =========================
+# Resort catalog (columnar)
+# - 리조트 목록은 data/resorts.json 에서 로드
+# - 이동수단별 소요시간/난이도 라벨을 NumPy 컬럼으로 보관
+# - 이동수단별로 "상한 소요시간" 기준 정렬 인덱스(TimeIndex)를 미리 만들어
+#   max_minutes 질의 = 이진탐색(searchsorted) + 난이도 마스크
+# - 기본 TimeIndex는 데이터의 출발지(옥수동) 기준 값,
+#   다른 출발지는 travel_time.py가 만든 TimeIndex를 query(..., times=)로 넘김
+# =========================
+DATA_PATH = Path(__file__).resolve().parent.parent / "data" / "resorts.json"
+
+MODES = ["자가용(운전)", "대중교통(버스/지하철)", "KTX/철도 연계"]
+MODE_FIELDS = ["car_min", "public_min", "ktx_min"]
+
+DIFFICULTY_BUCKETS = ["초급 친화 🟢", "중급 중심 🟦", "상급 비중 ↑ 🔥", "균형형 ⚖️", "정보 제한(정성 요약)"]
+
+
+@dataclass(slots=True)
+class Resort:
+    name: str
+    region: str
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    corridor: str = ""  # 주요 도로 축(정체 프로필 선택용)
+    highlights: List[str] = field(default_factory=list)
+    car_min: Optional[Tuple[int, int]] = None
+    public_min: Optional[Tuple[int, int]] = None
+    ktx_min: Optional[Tuple[int, int]] = None
+    note: str = ""
+
+    # Difficulty profile: values are percentages 0-100; can be None if unknown
+    beginner: Optional[int] = None
+    intermediate: Optional[int] = None
+    advanced: Optional[int] = None
+    difficulty_note: str = ""
+
+    # Slope map resources
+    slope_map_page: Optional[str] = None   # official page
+    slope_map_pdf: Optional[str] = None    # official pdf
+    slope_map_image: Optional[str] = None  # direct image if available
+
+
+def mode_index(mode: str) -> int:
+    if mode.startswith("자가용"):
+        return 0
+    if mode.startswith("대중교통"):
+        return 1
+    return 2
+
+
+def get_range_by_mode(r: Resort, mode: str) -> Optional[Tuple[int, int]]:
+    return getattr(r, MODE_FIELDS[mode_index(mode)])
+
+
+def within_minutes(rng: Optional[Tuple[int, int]], max_minutes: int) -> bool:
+    if not rng:
+        return False
+    # 보수적으로 상한(최대) 기준
+    return rng[1] <= max_minutes
+
+
+def difficulty_bucket(r: Resort) -> str:
+    # 사용자가 빠르게 이해할 수 있도록 “성향”을 라벨로
+    if r.beginner is None or r.intermediate is None or r.advanced is None:
+        return "정보 제한(정성 요약)"
+    b, i, a = r.beginner, r.intermediate, r.advanced
+    if b >= 50:
+        return "초급 친화 🟢"
+    if a >= 35:
+        return "상급 비중 ↑ 🔥"
+    if i >= 45:
+        return "중급 중심 🟦"
+    return "균형형 ⚖️"
+
+
+def _resort_from_dict(d: dict) -> Resort:
+    d = dict(d)
+    for key in MODE_FIELDS:
+        if d.get(key) is not None:
+            d[key] = tuple(d[key])
+    return Resort(**d)
+
+
+class TimeIndex:
+    """[mode, resort] time ranges for one origin, with per-mode (hi, lo, name) sort order."""
+
+    def __init__(self, lo: np.ndarray, hi: np.ndarray, has: np.ndarray, name_rank: np.ndarray):
+        self.lo = lo
+        self.hi = hi
+        self.has = has
+        self.name_rank = name_rank
+        self.order: List[np.ndarray] = []
+        self.sorted_hi: List[np.ndarray] = []
+        for m in range(len(lo)):
+            idx = np.flatnonzero(has[m])
+            idx = idx[np.lexsort((name_rank[idx], lo[m, idx], hi[m, idx]))]
+            self.order.append(idx)
+            self.sorted_hi.append(hi[m, idx])
+
+    def within(self, m: int, max_minutes: int) -> np.ndarray:
+        k = np.searchsorted(self.sorted_hi[m], max_minutes, side="right")
+        return self.order[m][:k]
+
+
+class ResortCatalog:
+    def __init__(self, resorts: List[Resort], origin: str = ""):
+        self.resorts = resorts
+        self.origin = origin  # 소요시간 컬럼이 측정된 출발지
+        n = len(resorts)
+
+        # 소요시간 컬럼: [mode, resort], 정보 없음은 has=False
+        self.lo = np.zeros((len(MODES), n), dtype=np.int32)
+        self.hi = np.zeros((len(MODES), n), dtype=np.int32)
+        self.has = np.zeros((len(MODES), n), dtype=bool)
+        for j, r in enumerate(resorts):
+            for m, key in enumerate(MODE_FIELDS):
+                rng = getattr(r, key)
+                if rng:
+                    self.lo[m, j], self.hi[m, j] = rng
+                    self.has[m, j] = True
+
+        self.bucket = np.array(
+            [DIFFICULTY_BUCKETS.index(difficulty_bucket(r)) for r in resorts], dtype=np.int8
+        )
+
+        # 좌표 컬럼(위도, 경도) — 없으면 NaN
+        self.coords = np.array(
+            [(np.nan if r.lat is None else r.lat, np.nan if r.lon is None else r.lon) for r in resorts],
+            dtype=np.float64,
+        ).reshape(n, 2)
+
+        # 난이도 비율 컬럼(초급, 중급, 상급 — 합 1로 정규화), 숫자 정보 없으면 NaN
+        raw = np.array(
+            [(r.beginner, r.intermediate, r.advanced) if r.beginner is not None
+             and r.intermediate is not None and r.advanced is not None else (np.nan,) * 3 for r in resorts],
+            dtype=np.float64,
+        ).reshape(n, 3)
+        total = raw.sum(axis=1, keepdims=True)
+        self.profile = np.divide(raw, total, out=np.full_like(raw, np.nan), where=total > 0)
+
+        # 이동수단별 정렬 인덱스: (상한, 하한, 이름) 순 → 화면 정렬 순서와 동일
+        self.name_rank = np.argsort(np.argsort(np.array([r.name for r in resorts], dtype=object)))
+        self.times = TimeIndex(self.lo, self.hi, self.has, self.name_rank)
+
+    @classmethod
+    def from_json(cls, path: Path = DATA_PATH) -> "ResortCatalog":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls([_resort_from_dict(d) for d in data["resorts"]], origin=data.get("origin", ""))
+
+    def __len__(self) -> int:
+        return len(self.resorts)
+
+    def query(self, mode: str, max_minutes: int, buckets: Sequence[str],
+              times: Optional[TimeIndex] = None) -> np.ndarray:
+        """Indices of resorts within ``max_minutes`` (upper bound), sorted for display."""
+        idx = (times or self.times).within(mode_index(mode), max_minutes)
+        return idx[self.bucket_mask(buckets)[idx]]
+
+    def bucket_mask(self, buckets: Sequence[str]) -> np.ndarray:
+        """[resort] True where the difficulty label is one of ``buckets``."""
+        allowed = np.zeros(len(DIFFICULTY_BUCKETS), dtype=bool)
+        allowed[[DIFFICULTY_BUCKETS.index(b) for b in buckets if b in DIFFICULTY_BUCKETS]] = True
+        return allowed[self.bucket]
+
+    def range_of(self, mode: str, i: int, times: Optional[TimeIndex] = None) -> Tuple[int, int]:
+        t = times or self.times
+        m = mode_index(mode)
+        return int(t.lo[m, i]), int(t.hi[m, i])
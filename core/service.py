@@ -0,0 +1,329 @@
+from dataclasses import dataclass, field
+from datetime import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.difficulty_mix import distances, format_mix, match_percent, normalize, rank_by_mix
+from core.group_planner import RANKINGS, GroupSummary, rank, summarize
+from core.resort_catalog import DIFFICULTY_BUCKETS, MODE_FIELDS, MODES, ResortCatalog, TimeIndex, mode_index
+from core.shoulder_content import PACK_PATH, ContentPack, load_pack
+from core.shoulder_index import SymptomIndex
+from core.symptom_search import SymptomSearch, build_documents
+from core.traffic_profile import DAY_TYPES, DepartureWindow, TrafficProfiles, bucket_label, bucket_of, departure_windows
+from core.transit_router import TRANSIT_MODE, Journey, TransitRouter, clock
+from core.travel_time import Origin, OriginGazetteer, TravelTimeModel
+
+# =============================
+# Services (페이지 · CLI · HTTP API 공용 진입점)
+# - SkiPlanner: 출발지 해석 → 출발지/그룹별 소요시간 → 필터/순위 → 결과(인덱스 + 범위)
+#   KTX/철도 연계 + 출발(또는 도착) 시각 지정 시 단일 출발지는 시간표 경로(transit_router) 기준
+# - ShoulderGuide: 증상 선택 → 추천 검사/운동(득표/점수), 자유 검색
+# - records(): JSON으로 바로 내보낼 수 있는 dict 목록
+# =============================
+
+
+# =============================
+# Ski
+# =============================
+@dataclass(slots=True)
+class SkiQuery:
+    origin: str = ""
+    mode: str = MODES[0]
+    max_minutes: int = 180
+    buckets: Sequence[str] = tuple(DIFFICULTY_BUCKETS)
+    day: Optional[int] = None        # 0: 평일, 1: 주말 (depart와 함께 지정하면 정체 프로필 적용)
+    depart: Optional[time] = None
+    group: Sequence[str] = ()        # 그룹 모드 출발지들(비어 있으면 단일 출발지)
+    ranking: str = "worst"           # group_planner.RANKINGS
+    mix: Optional[Sequence[float]] = None  # 목표 난이도 비율(초급, 중급, 상급) → 가까운 순 정렬
+    arrive_by: bool = False          # depart를 도착 희망 시각으로(KTX/철도 연계, 단일 출발지)
+
+    @property
+    def timed(self) -> bool:
+        return self.day is not None and self.depart is not None
+
+
+@dataclass(slots=True)
+class SkiResult:
+    query: SkiQuery
+    origin: Origin
+    origin_found: bool
+    times: TimeIndex                 # 단일 출발지 기준(정체 프로필 적용 전)
+    hits: np.ndarray                 # 표시 순서의 리조트 인덱스
+    ranges: List[Tuple[int, int]]    # hits별 (하한, 상한) 또는 그룹 (최단, 최장)
+    group_origins: List[Origin] = field(default_factory=list)
+    unresolved: List[str] = field(default_factory=list)
+    summary: Optional[GroupSummary] = None
+    group_times: Optional[np.ndarray] = None  # [origin, resort] (질의한 이동수단)
+    mix_match: Optional[np.ndarray] = None    # hits별 목표 비율 일치도(%), 숫자 프로필 없으면 NaN
+    journeys: Optional[Dict[int, Journey]] = None  # 리조트 인덱스 → 시간표 경로(KTX/철도 연계 + 시각 지정)
+
+    @property
+    def grouped(self) -> bool:
+        return self.summary is not None
+
+
+class SkiPlanner:
+    def __init__(self, catalog: ResortCatalog, gazetteer: OriginGazetteer,
+                 travel: TravelTimeModel, profiles: TrafficProfiles, transit: Optional[TransitRouter] = None):
+        self.catalog = catalog
+        self.gazetteer = gazetteer
+        self.travel = travel
+        self.profiles = profiles
+        self.transit = transit
+
+    @classmethod
+    def load(cls) -> "SkiPlanner":
+        catalog = ResortCatalog.from_json()
+        gazetteer = OriginGazetteer.from_json()
+        travel = TravelTimeModel(catalog, gazetteer.resolve(catalog.origin))
+        return cls(catalog, gazetteer, travel, TrafficProfiles.from_json(catalog), TransitRouter.from_gtfs(catalog))
+
+    @property
+    def default_origin(self) -> Origin:
+        return self.travel.calibration
+
+    def resolve(self, text: str) -> Tuple[Origin, bool]:
+        """Resolved origin and whether ``text`` was recognised (else the default origin)."""
+        origin = self.gazetteer.resolve(text) if text else None
+        return (origin, True) if origin is not None else (self.default_origin, not text)
+
+    def query(self, q: SkiQuery) -> SkiResult:
+        origin, found = self.resolve(q.origin)
+        times = self.travel.for_origin(origin)
+        m = mode_index(q.mode)
+        bucket = bucket_of(q.depart) if q.timed else None
+
+        members = [(text, self.gazetteer.resolve(text)) for text in q.group if text.strip()]
+        group_origins = [o for _, o in members if o is not None]
+        unresolved = [text.strip() for text, o in members if o is None]
+        if members and not group_origins:
+            # 단일 출발지로 조용히 바꾸지 않음(그룹 질의에 엉뚱한 답)
+            raise ValueError(f"그룹 출발지를 하나도 찾지 못했어요: {', '.join(unresolved)}")
+        if q.arrive_by and not (q.timed and m == TRANSIT_MODE and self.transit is not None and not group_origins):
+            raise ValueError("도착 시각 기준은 KTX/철도 연계 + 단일 출발지 + 요일/시각 지정에서만 쓸 수 있어요")
+
+        if group_origins:
+            # [origin, mode, resort] 한 번에 → 그룹 요약 → 순위
+            lo, hi = self.travel.matrix(np.array([[o.lat, o.lon] for o in group_origins]))
+            if q.timed:
+                hi = self.profiles.eta_batch(lo, hi, q.day, bucket)
+            summary = summarize(hi, self.travel.has)
+            hits = rank(summary, m, q.ranking, q.max_minutes,
+                        self.catalog.bucket_mask(q.buckets), self.catalog.name_rank)
+            hits, mix_match = self._by_mix(hits, q.mix)
+            ranges = [(int(summary.best[m, i]), int(summary.worst[m, i])) for i in hits]
+            return SkiResult(q, origin, found, times, hits, ranges, group_origins, unresolved,
+                             summary, hi[:, m, :], mix_match)
+
+        # 단일 출발지: 정렬 인덱스 이진탐색 + 난이도 마스크
+        view = self.profiles.at(times, q.day, bucket) if q.timed else times
+        journeys = None
+        if q.timed and m == TRANSIT_MODE and self.transit is not None:
+            journeys = self._journeys(origin, q)
+            view = _with_journeys(view, m, journeys)
+        hits, mix_match = self._by_mix(self.catalog.query(q.mode, q.max_minutes, q.buckets, view), q.mix)
+        ranges = [self.catalog.range_of(q.mode, i, view) for i in hits]
+        return SkiResult(q, origin, found, times, hits, ranges, unresolved=unresolved, mix_match=mix_match,
+                         journeys=journeys)
+
+    def _journeys(self, origin: Origin, q: SkiQuery) -> Dict[int, Journey]:
+        minute = q.depart.hour * 60 + q.depart.minute
+        if q.arrive_by:
+            return self.transit.latest_departure(origin, q.day, minute)
+        return self.transit.earliest_arrival(origin, q.day, minute)
+
+    def _by_mix(self, hits: np.ndarray, mix: Optional[Sequence[float]]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        # 소요시간 필터를 통과한 후보만 목표 비율과의 거리로 재정렬(동률/정보 없음은 기존 순서 유지)
+        if mix is None:
+            return hits, None
+        dist = distances(self.catalog.profile, normalize(mix))
+        hits = rank_by_mix(hits, dist)
+        return hits, match_percent(dist[hits])
+
+    def best_windows(self, result: SkiResult) -> DepartureWindow:
+        q = result.query
+        if result.journeys is not None:
+            # 시간표 경로: 하루 96칸 출발 시각 전체를 rRAPTOR 한 번으로
+            return departure_windows(self.transit.day_eta(result.origin, q.day or 0))
+        return self.profiles.best_windows(result.times, q.day or 0, mode_index(q.mode))
+
+    def records(self, result: SkiResult) -> List[Dict]:
+        out = []
+        m = mode_index(result.query.mode)
+        for k, i in enumerate(result.hits):
+            r = self.catalog.resorts[i]
+            row = {
+                "name": r.name,
+                "region": r.region,
+                "mode": MODE_FIELDS[m],
+                "minutes": list(result.ranges[k]),
+                "difficulty": DIFFICULTY_BUCKETS[self.catalog.bucket[i]],
+                "profile": None if r.beginner is None else [r.beginner, r.intermediate, r.advanced],
+                "mix_match": None if result.mix_match is None or np.isnan(result.mix_match[k])
+                else round(float(result.mix_match[k]), 1),
+                "highlights": r.highlights,
+                "note": r.note,
+                "slope_map_page": r.slope_map_page,
+                "slope_map_pdf": r.slope_map_pdf,
+            }
+            if result.journeys is not None and i in result.journeys:
+                row["journey"] = result.journeys[i].record()
+            if result.grouped:
+                s = result.summary
+                row["group"] = {
+                    "worst": int(s.worst[m, i]),
+                    "mean": round(float(s.mean[m, i]), 1),
+                    "std": round(float(s.std[m, i]), 1),
+                    "fairness": round(float(s.fairness[m, i]), 1),
+                    "per_origin": {o.name: int(t) for o, t in zip(result.group_origins, result.group_times[:, i])},
+                }
+            out.append(row)
+        return out
+
+    def summary_record(self, result: SkiResult) -> Dict:
+        q = result.query
+        return {
+            "origin": result.origin.name,
+            "origin_found": result.origin_found,
+            "mode": MODE_FIELDS[mode_index(q.mode)],
+            "max_minutes": q.max_minutes,
+            # 요청한 시각 그대로 보고, 정체 프로필이 실제로 쓴 15분 구간(BUCKET_MINUTES, 내림)은 따로
+            "departure": f"{DAY_TYPES[q.day]} {clock(q.depart.hour * 60 + q.depart.minute)}" if q.timed and not q.arrive_by else None,
+            "profile_slot": bucket_label(bucket_of(q.depart)) if q.timed and result.journeys is None else None,
+            "arrival": f"{DAY_TYPES[q.day]} {clock(q.depart.hour * 60 + q.depart.minute)}" if q.timed and q.arrive_by else None,
+            "timetable": result.journeys is not None,
+            "group": [o.name for o in result.group_origins],
+            "ranking": q.ranking if result.grouped else None,
+            "mix": format_mix(q.mix) if q.mix is not None else None,
+            "unresolved": result.unresolved,
+            "count": len(result.hits),
+        }
+
+
+def _with_journeys(view: TimeIndex, m: int, journeys: Dict[int, Journey]) -> TimeIndex:
+    """``view`` with mode ``m`` replaced by timetable door-to-door minutes (unreachable → excluded)."""
+    lo, hi, has = view.lo.copy(), view.hi.copy(), view.has.copy()
+    has[m] = False
+    for i, j in journeys.items():
+        lo[m, i] = hi[m, i] = j.minutes
+        has[m, i] = True
+    return TimeIndex(lo, hi, has, view.name_rank)
+
+
+# =============================
+# Shoulder
+# =============================
+class ShoulderGuide:
+    def __init__(self, pack: ContentPack):
+        self.pack = pack
+        self.index = SymptomIndex(pack.symptoms)
+        self._search: Optional[SymptomSearch] = None
+
+    @classmethod
+    def load(cls, path: Path = PACK_PATH) -> "ShoulderGuide":
+        return cls(load_pack(path))
+
+    @property
+    def symptoms(self) -> Dict[str, Dict]:
+        return self.pack.symptoms
+
+    def search(self, query: str, limit: int = 5) -> List[Tuple[str, float]]:
+        if self._search is None:
+            self._search = SymptomSearch(build_documents(self.pack.symptoms, self.pack.tests))
+        return self._search.search(query, limit=limit)
+
+    def recommend(self, selected: Sequence[str]) -> Dict[str, List[Tuple[str, int, float]]]:
+        """``{"tests"|"exercises": [(key, votes, score), ...]}`` for the selected symptoms."""
+        selected = self.index.canonical(selected)
+        if len(selected) == 1:
+            # 증상 하나: 작성자가 정한 순서 그대로
+            cfg = self.pack.symptoms[selected[0]]
+            return {kind: [(k, 1, 1.0) for k in cfg[kind]] for kind in ("tests", "exercises")}
+        return {kind: self.index.rank(selected, kind) for kind in ("tests", "exercises")}
+
+    def records(self, selected: Sequence[str]) -> Dict:
+        selected = self.index.canonical(selected)
+        ranked = self.recommend(selected)
+        tests = []
+        for key, votes, score in ranked["tests"]:
+            t = self.pack.tests[key]
+            tests.append({"key": key, "name": t.name, "target": t.target, "how": t.how,
+                          "positive": t.positive, "caution": t.caution, "votes": votes, "score": round(score, 3)})
+        exercises = []
+        for key, votes, score in ranked["exercises"]:
+            ex = self.pack.exercises[key]
+            exercises.append({"key": key, "name": ex.name, "goal": ex.goal, "steps": ex.steps,
+                              "dosage": ex.dosage, "cautions": ex.cautions, "votes": votes, "score": round(score, 3)})
+        return {
+            "symptoms": list(selected),
+            "tags": self.index.selected_tags(selected),
+            "tests": tests,
+            "exercises": exercises,
+        }
+
+
+def parse_mode(value: str) -> str:
+    """"0" / "car" / "car_min" / full label → MODES label."""
+    v = value.strip().lower()
+    if v.isdigit() and int(v) < len(MODES):
+        return MODES[int(v)]
+    for label, f in zip(MODES, MODE_FIELDS):
+        if v in (f, f.split("_")[0], label.lower()):
+            return label
+    raise ValueError(f"알 수 없는 이동수단: {value} (0-2, {', '.join(MODE_FIELDS)})")
+
+
+def parse_departure(day: Optional[str], depart: Optional[str]) -> Tuple[Optional[int], Optional[time]]:
+    """(day, "HH:MM") → (day index, time); both empty → no departure, only one given → ValueError."""
+    if not day and not depart:
+        return None, None
+    if not day:
+        raise ValueError(f"출발 시각({depart})에는 요일 구분(day: {', '.join(DAY_TYPES)})이 필요해요")
+    if not depart:
+        raise ValueError(f"요일 구분({day})에는 출발 시각(depart: HH:MM)이 필요해요")
+    d = day.strip().lower()
+    if d not in DAY_TYPES:
+        raise ValueError(f"알 수 없는 요일 구분: {day} ({', '.join(DAY_TYPES)})")
+    try:
+        hh, mm = depart.strip().split(":")
+        return DAY_TYPES.index(d), time(int(hh), int(mm))
+    except ValueError:
+        raise ValueError(f"출발 시각은 HH:MM(00:00–23:59)이어야 해요: {depart}") from None
+
+
+def parse_mix(value: Optional[str]) -> Optional[Tuple[float, float, float]]:
+    """"20/50/30" or "20,50,30" → shares; empty → None."""
+    if not value:
+        return None
+    parts = value.replace("/", ",").split(",")
+    if len(parts) != 3:
+        raise ValueError(f"난이도 비율은 초급/중급/상급 세 값이어야 해요: {value}")
+    return tuple(normalize([float(x) for x in parts]))
+
+
+def parse_buckets(value: Optional[str]) -> Tuple[str, ...]:
+    """Comma-separated bucket indices ("0,2") or empty for all."""
+    if not value:
+        return tuple(DIFFICULTY_BUCKETS)
+    last = len(DIFFICULTY_BUCKETS) - 1
+    buckets = []
+    for x in value.split(","):
+        if not x.strip():
+            continue
+        try:
+            i = int(x)
+        except ValueError:
+            raise ValueError(f"난이도 성향 인덱스는 0–{last} 정수여야 해요: {x.strip()}") from None
+        if not 0 <= i <= last:
+            raise ValueError(f"난이도 성향 인덱스 {i}: 0–{last} 범위여야 해요")
+        buckets.append(DIFFICULTY_BUCKETS[i])
+    return tuple(buckets)
+
+
+__all__ = [
+    "RANKINGS", "SkiPlanner", "SkiQuery", "SkiResult", "ShoulderGuide",
+    "parse_buckets", "parse_departure", "parse_mix", "parse_mode",
+]
@@ -0,0 +1,274 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional
+
+from core.svg_sprite import build_sprite, format_report
+
+# =============================
+# Shoulder content pack
+# - 원본(작성용): content/shoulder/{tests,exercises,symptoms}.json + svg/*.svg
+#   (symptoms의 aliases: 검색용 구어체 표현, 선택)
+# - 빌드: `python -m core.shoulder_content build` → 참조 검증 후 content/shoulder.pack 생성
+#   (운동 SVG는 빌드 때 최소화 + <symbol> 스프라이트로 분리 → 팩에는 스프라이트 1개 + 그림별 <use> 조각)
+# - 팩 = 헤더 JSON 한 줄(형식, 원본 해시, 증상 목록, 레코드별 [오프셋, 길이]) + 레코드 JSON을 이어 붙인 본문
+# - 로드: 헤더만 읽음. 검사/운동/스프라이트는 처음 접근할 때 해당 바이트만 읽어 디코딩(lazy)
+#   디코딩한 문자열은 sys.intern → 여러 레코드/증상에 반복되는 태그·주의 문구는 메모리에 하나만
+# - 팩의 hash = 원본(JSON + SVG) 해시 → 로드 때 원본이 있으면 다시 계산해 다르면 ContentError(다시 빌드)
+#   `check`도 원본 검증 + 커밋된 팩이 최신인지 확인
+# =============================
+CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+SOURCE_DIR = CONTENT_DIR / "shoulder"
+SVG_DIR = SOURCE_DIR / "svg"
+SOURCE_FILES = ("tests.json", "exercises.json", "symptoms.json")
+PACK_PATH = CONTENT_DIR / "shoulder.pack"
+PACK_FORMAT = 3
+
+
+# =============================
+# Models
+# =============================
+@dataclass(slots=True)
+class PhysicalTest:
+    name: str
+    target: str
+    how: str
+    positive: str
+    caution: Optional[str] = None
+
+@dataclass(slots=True)
+class Exercise:
+    name: str
+    goal: str
+    steps: List[str]
+    dosage: str
+    svg: str
+    cautions: Optional[str] = None
+
+
+class ContentError(ValueError):
+    pass
+
+
+# =============================
+# Build (validation happens here, once)
+# =============================
+def _read_json(path: Path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def validate(tests: dict, exercises: dict, symptoms: dict, svg_dir: Path = SVG_DIR) -> List[str]:
+    errors = []
+    for key, t in tests.items():
+        for f in ("name", "target", "how", "positive"):
+            if not t.get(f):
+                errors.append(f"tests[{key}]: '{f}' 누락")
+    for key, ex in exercises.items():
+        for f in ("name", "goal", "steps", "dosage", "svg"):
+            if not ex.get(f):
+                errors.append(f"exercises[{key}]: '{f}' 누락")
+        if ex.get("svg") and not (svg_dir / ex["svg"]).is_file():
+            errors.append(f"exercises[{key}]: SVG 파일 없음 ({ex['svg']})")
+    for name, cfg in symptoms.items():
+        for key in cfg.get("tests", []):
+            if key not in tests:
+                errors.append(f"symptoms[{name}]: 알 수 없는 검사 '{key}'")
+        for key in cfg.get("exercises", []):
+            if key not in exercises:
+                errors.append(f"symptoms[{name}]: 알 수 없는 운동 '{key}'")
+    return errors
+
+def source_hash(source_dir: Path = SOURCE_DIR) -> str:
+    """Hash of the authoring sources a pack is built from (JSON files + referenced SVGs)."""
+    h = hashlib.sha256()
+    for name in SOURCE_FILES:
+        h.update((source_dir / name).read_bytes())
+    for ex in _read_json(source_dir / "exercises.json").values():
+        h.update((source_dir / "svg" / ex["svg"]).read_bytes())
+    return h.hexdigest()[:16]
+
+def build_pack(source_dir: Path = SOURCE_DIR) -> dict:
+    tests = _read_json(source_dir / "tests.json")
+    exercises = _read_json(source_dir / "exercises.json")
+    symptoms = _read_json(source_dir / "symptoms.json")
+    svg_dir = source_dir / "svg"
+
+    errors = validate(tests, exercises, symptoms, svg_dir)
+    if errors:
+        raise ContentError("콘텐츠 검증 실패:\n- " + "\n- ".join(errors))
+
+    svgs = {key: (svg_dir / ex["svg"]).read_text(encoding="utf-8") for key, ex in exercises.items()}
+    sprite = build_sprite(svgs)
+
+    return {
+        "format": PACK_FORMAT,
+        "hash": source_hash(source_dir),
+        "tests": {
+            k: [t["name"], t["target"], t["how"], t["positive"], t.get("caution")]
+            for k, t in tests.items()
+        },
+        "exercises": {
+            k: [e["name"], e["goal"], e["steps"], e["dosage"], sprite.fragments[k], e.get("cautions")]
+            for k, e in exercises.items()
+        },
+        "symptoms": {
+            k: {
+                "tags": cfg.get("tags", []),
+                "aliases": cfg.get("aliases", []),
+                "tests": cfg.get("tests", []),
+                "exercises": cfg.get("exercises", []),
+            }
+            for k, cfg in symptoms.items()
+        },
+        "sprite": sprite.sprite,
+        "sprite_report": sprite.report,
+    }
+
+def _dumps(value) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def write_pack(pack: dict, path: Path = PACK_PATH) -> int:
+    body = bytearray()
+
+    def put(value) -> List[int]:
+        data = _dumps(value)
+        span = [len(body), len(data)]
+        body.extend(data)
+        return span
+
+    header = {
+        "format": pack["format"],
+        "hash": pack["hash"],
+        "symptoms": pack["symptoms"],
+        "sprite_report": pack["sprite_report"],
+        "sprite": put(pack["sprite"]),
+        "tests": {k: put(row) for k, row in pack["tests"].items()},
+        "exercises": {k: put(row) for k, row in pack["exercises"].items()},
+    }
+    data = _dumps(header) + b"\n" + bytes(body)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return len(data)
+
+
+# =============================
+# Load (lazy)
+# =============================
+class LazyRecords(Mapping):
+    """Read-only mapping that turns pack records into objects on first access."""
+
+    def __init__(self, rows: Dict[str, List[int]], make: Callable[[List[int]], object]):
+        self._rows = rows
+        self._make = make
+        self._cache: dict = {}
+
+    def __getitem__(self, key):
+        obj = self._cache.get(key)
+        if obj is None:
+            obj = self._make(self._rows[key])
+            self._cache[key] = obj
+        return obj
+
+    def __iter__(self) -> Iterator:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key) -> bool:
+        return key in self._rows
+
+
+def _intern(value):
+    """``value`` with every string (dict keys included) passed through ``sys.intern``."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern(x) for x in value]
+    if isinstance(value, dict):
+        return {sys.intern(k): _intern(v) for k, v in value.items()}
+    return value
+
+
+class ContentPack:
+    def __init__(self, path: Path):
+        # 파일은 열어 둔 채 레코드를 오프셋으로 읽음 → 다시 빌드(os.replace)돼도 이 팩은 원래 파일을 계속 읽음
+        self._file: BinaryIO = open(path, "rb")
+        self._lock = threading.Lock()
+        header = json.loads(self._file.readline())
+        self._base = self._file.tell()
+        if header.get("format") != PACK_FORMAT:
+            raise ContentError(f"지원하지 않는 팩 형식: {header.get('format')} (`python -m core.shoulder_content build`로 다시 빌드)")
+        self.hash: str = header["hash"]
+        self._sprite_span: List[int] = header["sprite"]
+        self.tests: Mapping = LazyRecords(header["tests"], lambda span: PhysicalTest(*self._record(span)))
+        self.exercises: Mapping = LazyRecords(header["exercises"], lambda span: Exercise(*self._record(span)))
+        # 증상 목록은 선택 상자에 바로 필요하므로 헤더에 둠(작은 데이터)
+        self.symptoms: Dict[str, Dict] = _intern(header["symptoms"])
+
+    def _record(self, span: List[int]):
+        offset, length = span
+        with self._lock:
+            self._file.seek(self._base + offset)
+            data = self._file.read(length)
+        return _intern(json.loads(data))
+
+    @cached_property
+    def sprite(self) -> str:
+        # 모든 운동 그림이 참조하는 공용 <symbol>/<style> (세션당 한 번 주입)
+        return self._record(self._sprite_span)
+
+
+def load_pack(path: Path = PACK_PATH, source_dir: Optional[Path] = SOURCE_DIR) -> ContentPack:
+    """Open the pack at ``path``; raise ``ContentError`` if it was built from other sources than ``source_dir``.
+
+    The staleness check is skipped when the sources are not shipped (``source_dir`` missing or ``None``).
+    """
+    pack = ContentPack(path)
+    if source_dir is not None and (source_dir / SOURCE_FILES[0]).is_file():
+        try:
+            current = source_hash(source_dir)
+        except (OSError, ValueError, KeyError) as e:
+            raise ContentError(f"원본 해시 계산 실패: {e}") from e
+        if current != pack.hash:
+            raise ContentError(
+                f"{Path(path).name}이 원본과 달라요(팩 {pack.hash} ≠ 원본 {current}) "
+                "— `python -m core.shoulder_content build`로 다시 빌드"
+            )
+    return pack
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="어깨 가이드 콘텐츠 팩 빌드/검증")
+    parser.add_argument("command", choices=["build", "check"])
+    args = parser.parse_args(argv)
+    try:
+        pack = build_pack()
+    except ContentError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if args.command == "build":
+        size = write_pack(pack)
+        print(f"✅ {PACK_PATH.name}: 검사 {len(pack['tests'])} · 운동 {len(pack['exercises'])} · "
+              f"증상 {len(pack['symptoms'])} · {size:,} bytes")
+        print(f"   {format_report(pack['sprite_report'])}")
+        return 0
+    try:
+        load_pack()
+    except (OSError, ValueError) as e:  # ContentError 포함
+        print(f"❌ 참조 검증은 통과, 팩 확인 실패: {e}", file=sys.stderr)
+        return 1
+    print("✅ 참조 검증 통과 · 팩이 원본과 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
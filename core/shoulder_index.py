@@ -0,0 +1,68 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# =============================
+# Symptom → Test/Exercise inverted index
+# - 증상×검사, 증상×운동, 증상×태그를 0/1 행렬로 미리 만들어 둠
+# - 여러 증상 선택 = 선택 벡터 × 행렬(OR/개수 세기)을 한 번에 계산
+# - 점수 = (추천한 증상 수) × (1 + 태그 겹침 비율)
+# =============================
+TAG_WEIGHT = 1.0
+
+
+def _ordered_unique(lists) -> List[str]:
+    return list(dict.fromkeys(x for xs in lists for x in xs))
+
+
+class SymptomIndex:
+    def __init__(self, symptoms: Dict[str, Dict]):
+        self.symptoms = list(symptoms)
+        self._pos = {name: i for i, name in enumerate(self.symptoms)}
+        self.tags = _ordered_unique(cfg["tags"] for cfg in symptoms.values())
+        self.keys = {
+            "tests": _ordered_unique(cfg["tests"] for cfg in symptoms.values()),
+            "exercises": _ordered_unique(cfg["exercises"] for cfg in symptoms.values()),
+        }
+
+        self.tag_matrix = self._matrix(symptoms, "tags", self.tags)
+        self.matrices = {kind: self._matrix(symptoms, kind, keys) for kind, keys in self.keys.items()}
+        # 항목별 태그 = 그 항목을 추천하는 증상들의 태그 합집합 (items × tags)
+        self.item_tags = {
+            kind: (m.T.astype(np.int32) @ self.tag_matrix) > 0 for kind, m in self.matrices.items()
+        }
+
+    def _matrix(self, symptoms: Dict[str, Dict], field: str, columns: List[str]) -> np.ndarray:
+        col = {k: j for j, k in enumerate(columns)}
+        m = np.zeros((len(symptoms), len(columns)), dtype=bool)
+        for i, cfg in enumerate(symptoms.values()):
+            m[i, [col[k] for k in cfg[field]]] = True
+        return m
+
+    def mask(self, selected: Sequence[str]) -> np.ndarray:
+        m = np.zeros(len(self.symptoms), dtype=bool)
+        m[[self._pos[s] for s in selected if s in self._pos]] = True
+        return m
+
+    def canonical(self, selected: Sequence[str]) -> Tuple[str, ...]:
+        """Selected symptoms in catalog order (stable cache key)."""
+        return tuple(self.symptoms[i] for i in np.flatnonzero(self.mask(selected)))
+
+    def selected_tags(self, selected: Sequence[str]) -> List[str]:
+        sel = self.mask(selected).astype(np.int32) @ self.tag_matrix
+        return [self.tags[j] for j in np.flatnonzero(sel)]
+
+    def rank(self, selected: Sequence[str], kind: str) -> List[Tuple[str, int, float]]:
+        """(key, votes, score) for every test/exercise recommended by the selection."""
+        m = self.mask(selected).astype(np.int32)
+        votes = m @ self.matrices[kind]
+        sel_tags = (m @ self.tag_matrix) > 0
+        n_tags = max(int(sel_tags.sum()), 1)
+        overlap = self.item_tags[kind].astype(np.int32) @ sel_tags
+        score = votes * (1.0 + TAG_WEIGHT * overlap / n_tags)
+
+        hit = np.flatnonzero(votes)
+        # 점수 내림차순, 동점이면 원래 카탈로그 순서
+        hit = hit[np.lexsort((hit, -score[hit]))]
+        keys = self.keys[kind]
+        return [(keys[j], int(votes[j]), float(score[j])) for j in hit]
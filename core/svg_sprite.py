@@ -0,0 +1,161 @@
+import re
+import xml.etree.ElementTree as ET
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from xml.sax.saxutils import escape, quoteattr
+
+# =============================
+# SVG sprite builder
+# - 운동 그림 SVG들을 최소화(minify)
+# - 여러 그림에 반복되는 도형(배경 rect, 머리 circle, 분홍 화살촉 polygon 등)은
+#   위치를 뺀 모양 기준으로 묶어 <symbol> 하나로 → 각 그림은 <use x y>로 참조
+# - 반복되는 표현 속성(fill/stroke/글꼴 등)은 CSS 클래스로 치환
+# - 스프라이트(<symbol> + <style>)는 세션당 한 번 주입, 그림은 작은 조각만 전송
+# =============================
+PREFIX = "xs"
+SPRITE_ID = f"{PREFIX}-sprite"
+STYLE_ATTRS = ("fill", "stroke", "stroke-width", "stroke-linecap", "stroke-dasharray",
+               "opacity", "font-size", "font-weight")
+PX_ATTRS = ("font-size", "stroke-width")
+
+
+@dataclass
+class SpriteBuild:
+    sprite: str
+    fragments: Dict[str, str]
+    report: Dict[str, int] = field(default_factory=dict)
+
+
+def _parse(svg: str) -> ET.Element:
+    # 인라인 SVG에는 xmlns가 필요 없으므로 제거 후 파싱(ns0: 접두어 방지)
+    return ET.fromstring(re.sub(r'\sxmlns="[^"]*"', "", svg.strip()))
+
+
+def _num(v: float) -> str:
+    return f"{v:g}"
+
+
+def _serialize(tag: str, attrs: Dict[str, str], text: Optional[str] = None) -> str:
+    a = "".join(f" {k}={quoteattr(v)}" for k, v in attrs.items())
+    if text:
+        return f"<{tag}{a}>{escape(text)}</{tag}>"
+    return f"<{tag}{a}/>"
+
+
+def minify_svg(svg: str) -> str:
+    root = _parse(svg)
+    body = "".join(_serialize(el.tag, dict(el.attrib), (el.text or "").strip()) for el in root)
+    head = "".join(f" {k}={quoteattr(v)}" for k, v in root.attrib.items())
+    return f"<svg{head}>{body}</svg>"
+
+
+def _shape(el: ET.Element) -> Tuple[Optional[tuple], float, float, Dict[str, str]]:
+    """(shape key without position, x, y, attrs at origin) — key None if not movable."""
+    attrs = dict(el.attrib)
+    if el.tag == "circle":
+        x, y = float(attrs.pop("cx", 0)), float(attrs.pop("cy", 0))
+    elif el.tag == "rect":
+        x, y = float(attrs.pop("x", 0)), float(attrs.pop("y", 0))
+    elif el.tag == "polygon":
+        pts = [tuple(map(float, p.split(","))) for p in attrs["points"].split()]
+        x, y = pts[0]
+        attrs["points"] = " ".join(f"{_num(px - x)},{_num(py - y)}" for px, py in pts)
+    else:
+        return None, 0.0, 0.0, attrs
+    return (el.tag, tuple(sorted(attrs.items()))), x, y, attrs
+
+
+def _css(attrs: Tuple[Tuple[str, str], ...]) -> str:
+    return ";".join(f"{k}:{v}px" if k in PX_ATTRS else f"{k}:{v}" for k, v in attrs)
+
+
+def build_sprite(svgs: Dict[str, str]) -> SpriteBuild:
+    roots = {name: _parse(svg) for name, svg in svgs.items()}
+
+    # 1) 위치만 다른 반복 도형 → <symbol>
+    shape_count = Counter(
+        _shape(el)[0] for root in roots.values() for el in root if _shape(el)[0] is not None
+    )
+    symbols: Dict[tuple, str] = {}
+    symbol_markup = []
+    for key, n in shape_count.items():
+        if n < 2:
+            continue
+        sid = f"{PREFIX}-s{len(symbols)}"
+        symbols[key] = sid
+        tag, attrs = key[0], dict(key[1])
+        symbol_markup.append(f"<symbol id={quoteattr(sid)} overflow=\"visible\">{_serialize(tag, attrs)}</symbol>")
+
+    # 2) 반복되는 표현 속성 묶음 → CSS 클래스
+    def style_of(el):
+        return tuple((k, el.attrib[k]) for k in STYLE_ATTRS if k in el.attrib)
+
+    style_count = Counter(
+        style_of(el) for root in roots.values() for el in root
+        if _shape(el)[0] not in symbols and style_of(el)
+    )
+    classes = {s: f"{PREFIX}-c{i}" for i, (s, n) in enumerate(style_count.most_common()) if n >= 2}
+    css = "".join(f".{c}{{{_css(s)}}}" for s, c in classes.items())
+
+    fragments = {}
+    for name, root in roots.items():
+        parts = []
+        for el in root:
+            key, x, y, _ = _shape(el)
+            if key in symbols:
+                attrs = {"href": f"#{symbols[key]}"}
+                if x:
+                    attrs["x"] = _num(x)
+                if y:
+                    attrs["y"] = _num(y)
+                parts.append(_serialize("use", attrs))
+                continue
+            attrs = dict(el.attrib)
+            style = style_of(el)
+            if style in classes:
+                for k, _ in style:
+                    attrs.pop(k)
+                attrs["class"] = classes[style]
+            parts.append(_serialize(el.tag, attrs, (el.text or "").strip()))
+        head = "".join(f" {k}={quoteattr(v)}" for k, v in root.attrib.items())
+        fragments[name] = f"<svg{head}>{''.join(parts)}</svg>"
+
+    sprite = (
+        f"<svg id=\"{SPRITE_ID}\" width=\"0\" height=\"0\" aria-hidden=\"true\" "
+        f"style=\"position:absolute;width:0;height:0;overflow:hidden\">"
+        f"<style>{css}</style>{''.join(symbol_markup)}</svg>"
+    )
+
+    report = {
+        "original_bytes": sum(len(s.encode("utf-8")) for s in svgs.values()),
+        "minified_bytes": sum(len(minify_svg(s).encode("utf-8")) for s in svgs.values()),
+        "fragment_bytes": sum(len(f.encode("utf-8")) for f in fragments.values()),
+        "sprite_bytes": len(sprite.encode("utf-8")),
+        "symbols": len(symbols),
+        "classes": len(classes),
+    }
+    return SpriteBuild(sprite=sprite, fragments=fragments, report=report)
+
+
+def format_report(report: Dict[str, int]) -> str:
+    orig = report["original_bytes"]
+    frag = report["fragment_bytes"]
+    first = frag + report["sprite_bytes"]
+    return (
+        f"SVG bytes: 원본 {orig:,} → 최소화 {report['minified_bytes']:,} → "
+        f"재실행당 조각 {frag:,} ({100 * (orig - frag) / max(orig, 1):.0f}% 감소), "
+        f"세션 첫 실행 +스프라이트 {report['sprite_bytes']:,} = {first:,} "
+        f"(symbol {report['symbols']} · class {report['classes']})"
+    )
+
+
+if __name__ == "__main__":
+    from core.shoulder_content import SOURCE_DIR, SVG_DIR, _read_json
+
+    exercises = _read_json(SOURCE_DIR / "exercises.json")
+    sources = {k: (SVG_DIR / ex["svg"]).read_text(encoding="utf-8") for k, ex in exercises.items()}
+    build = build_sprite(sources)
+    print(format_report(build.report))
+    for k in sources:
+        print(f"  {k:<18} {len(sources[k].encode('utf-8')):>6,} → {len(build.fragments[k].encode('utf-8')):>6,} bytes")
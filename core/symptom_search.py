@@ -0,0 +1,183 @@
+import argparse
+import math
+import statistics
+import sys
+import time
+import unicodedata
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# =============================
+# Korean free-text symptom search
+# - 이모지/기호 제거 → 한글 음절을 자모로 분해 → 자모 2/3-gram 역색인
+# - 자모 단위라 입력 중인 음절("아ㅍ")이나 오타 1~2개에도 부분 일치
+# - 검색 대상: 증상 문장 + 별칭(aliases) + 태그 + 관련 검사 target
+# - 쿼리 gram은 희귀한 것(idf 높은 것)부터 처리하고, 시간 예산을 넘기면 중단
+# =============================
+NGRAM_SIZES = (2, 3)
+DEFAULT_BUDGET_MS = 15.0
+FIELD_WEIGHTS = {"name": 1.0, "alias": 1.0, "tag": 0.8, "target": 0.6}
+
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+         "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+_SYLLABLE_BASE, _SYLLABLE_LAST = 0xAC00, 0xD7A3
+
+
+def to_jamo(text: str) -> str:
+    """Lower-case, drop emoji/punctuation/spaces and split Hangul syllables into jamo."""
+    out = []
+    for ch in text.lower():
+        code = ord(ch)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            n = code - _SYLLABLE_BASE
+            out.append(_CHO[n // 588])
+            out.append(_JUNG[(n % 588) // 28])
+            out.append(_JONG[n % 28])
+        elif unicodedata.category(ch)[0] in "LN":
+            out.append(ch)
+    return "".join(out)
+
+
+def ngrams(jamo: str) -> List[str]:
+    if len(jamo) < min(NGRAM_SIZES):
+        return [jamo] if jamo else []
+    return [jamo[i:i + n] for n in NGRAM_SIZES for i in range(len(jamo) - n + 1)]
+
+
+def build_documents(symptoms: Mapping[str, Dict], tests: Mapping) -> Dict[str, List[Tuple[str, float]]]:
+    """Searchable (text, weight) fields for every symptom."""
+    docs = {}
+    for name, cfg in symptoms.items():
+        fields = [(name, FIELD_WEIGHTS["name"])]
+        fields += [(a, FIELD_WEIGHTS["alias"]) for a in cfg.get("aliases", [])]
+        fields += [(t, FIELD_WEIGHTS["tag"]) for t in cfg.get("tags", [])]
+        fields += [(tests[k].target, FIELD_WEIGHTS["target"]) for k in cfg.get("tests", [])]
+        docs[name] = fields
+    return docs
+
+
+class SymptomSearch:
+    def __init__(self, docs: Mapping[str, Sequence[Tuple[str, float]]]):
+        self.names = list(docs)
+        # gram → {doc: 가장 높은 필드 가중치}
+        postings: Dict[str, Dict[int, float]] = {}
+        for d, fields in enumerate(docs.values()):
+            for text, weight in fields:
+                for g in set(ngrams(to_jamo(text))):
+                    p = postings.setdefault(g, {})
+                    if weight > p.get(d, 0.0):
+                        p[d] = weight
+
+        # 평탄화된 포스팅 배열(CSR 형태)
+        self._gram_id = {g: i for i, g in enumerate(postings)}
+        n_docs = max(len(self.names), 1)
+        self._idf = np.array([math.log(1.0 + n_docs / len(p)) for p in postings.values()])
+        sizes = [len(p) for p in postings.values()]
+        self._offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self._docs = np.fromiter((d for p in postings.values() for d in p), dtype=np.int32, count=sum(sizes))
+        self._weights = np.fromiter((w for p in postings.values() for w in p.values()), dtype=np.float32, count=sum(sizes))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 5,
+        min_score: float = 0.35,
+        budget_ms: float = DEFAULT_BUDGET_MS,
+    ) -> List[Tuple[str, float]]:
+        """Ranked ``(symptom, score)`` pairs; stops adding evidence once over ``budget_ms``."""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        grams = set(ngrams(to_jamo(query)))
+        if not grams:
+            return []
+
+        # 색인에 없는 gram도 분모(쿼리 전체 정보량)에는 포함 → 엉뚱한 부분 일치 억제
+        max_idf = float(self._idf.max()) if len(self._idf) else 1.0
+        ids = [self._gram_id[g] for g in grams if g in self._gram_id]
+        total = sum(float(self._idf[i]) for i in ids) + max_idf * (len(grams) - len(ids))
+
+        scores = np.zeros(len(self.names), dtype=np.float32)
+        for i in sorted(ids, key=lambda i: -self._idf[i]):
+            a, b = self._offsets[i], self._offsets[i + 1]
+            scores[self._docs[a:b]] += self._weights[a:b] * self._idf[i]
+            if time.perf_counter() > deadline:
+                break
+
+        scores /= total
+        top = np.argsort(-scores, kind="stable")[:limit]
+        return [(self.names[d], float(scores[d])) for d in top if scores[d] >= min_score]
+
+
+# =============================
+# Per-keystroke latency benchmark
+# =============================
+def keystrokes(text: str) -> Iterable[str]:
+    """Intermediate IME states while typing ``text`` (e.g. ㅂ → 바 → 밤 → 밤ㅇ → 밤에)."""
+    typed = ""
+    for ch in text:
+        code = ord(ch)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            n = code - _SYLLABLE_BASE
+            cho, jung, jong = n // 588, (n % 588) // 28, n % 28
+            yield typed + _CHO[cho]
+            yield typed + chr(_SYLLABLE_BASE + (cho * 21 + jung) * 28)
+            if jong:
+                yield typed + ch
+        else:
+            yield typed + ch
+        typed += ch
+
+
+def benchmark(docs: Mapping[str, Sequence[Tuple[str, float]]], queries: Sequence[str],
+              scale: int = 100, budget_ms: float = DEFAULT_BUDGET_MS) -> Dict[str, float]:
+    big = {f"{name} #{k}": fields for k in range(scale) for name, fields in docs.items()}
+    t0 = time.perf_counter()
+    index = SymptomSearch(big)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    lat = []
+    for q in queries:
+        for state in keystrokes(q):
+            t = time.perf_counter()
+            index.search(state, budget_ms=budget_ms)
+            lat.append((time.perf_counter() - t) * 1000)
+    lat.sort()
+    return {
+        "docs": len(big),
+        "build_ms": build_ms,
+        "keystrokes": len(lat),
+        "p50_ms": statistics.median(lat),
+        "p95_ms": lat[int(0.95 * (len(lat) - 1))],
+        "max_ms": lat[-1],
+        "budget_ms": budget_ms,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from core.shoulder_content import load_pack
+
+    parser = argparse.ArgumentParser(description="증상 검색(자모 n-gram)")
+    parser.add_argument("query", nargs="?", help="검색어(생략 시 --bench)")
+    parser.add_argument("--bench", action="store_true", help="키 입력 단위 지연시간 측정")
+    parser.add_argument("--scale", type=int, default=100, help="벤치마크 코퍼스 배수")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    pack = load_pack()
+    docs = build_documents(pack.symptoms, pack.tests)
+    if args.query and not args.bench:
+        for name, score in SymptomSearch(docs).search(args.query, budget_ms=args.budget_ms):
+            print(f"{score:.2f}  {name}")
+        return 0
+
+    queries = ["밤에 아파요", "팔 저림", "힘이 빠져요", "어깨 앞쪽", "빠질것같아", "오십견", "쇄골 끝"]
+    r = benchmark(docs, queries, scale=args.scale, budget_ms=args.budget_ms)
+    print(f"docs={r['docs']} build={r['build_ms']:.1f}ms keystrokes={r['keystrokes']} "
+          f"p50={r['p50_ms']:.3f}ms p95={r['p95_ms']:.3f}ms max={r['max_ms']:.3f}ms (budget {r['budget_ms']}ms)")
+    return 0 if r["p95_ms"] <= r["budget_ms"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import json
+from dataclasses import dataclass
+from datetime import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from core.resort_catalog import MODE_FIELDS, ResortCatalog, TimeIndex
+
+# =========================
+# Time-dependent ETA profiles
+# - data/traffic_profiles.json: 이동수단 × 도로 축(corridor) × 평일/주말 정체 계수 기준점
+#   → 15분 단위 96칸으로 선형 보간해 [profile, day, bucket] 배열 하나로 보관
+# - 리조트×이동수단마다 프로필 번호 [mode, resort] (없으면 이동수단 기본 "*")
+# - ETA = 하한 + (상한 - 하한) × 정체 계수  → 출발 시각 조회는 배열 인덱싱 한 번
+# - 하루 전체(96칸)를 한 번에 계산해 리조트별 최적 출발 시간대를 찾음(departure_windows는 시간표 ETA에도 사용)
+# =========================
+PROFILES_PATH = Path(__file__).resolve().parent.parent / "data" / "traffic_profiles.json"
+BUCKET_MINUTES = 15
+N_BUCKETS = 24 * 60 // BUCKET_MINUTES
+DAY_TYPES = ["weekday", "weekend"]
+DAY_LABELS = ["평일", "주말"]
+WINDOW_TOLERANCE = 10  # 최적 ETA + 이 값(분) 이내면 같은 "좋은 시간대"로 봄
+DEPARTURE_HOURS = (5, 21)  # 최적 시간대를 찾는 출발 시각 범위(새벽 0시 출발 같은 답은 제외)
+
+
+def bucket_of(t: time) -> int:
+    return (t.hour * 60 + t.minute) // BUCKET_MINUTES
+
+
+def bucket_label(b: int) -> str:
+    m = (int(b) % N_BUCKETS) * BUCKET_MINUTES
+    return f"{m // 60:02d}:{m % 60:02d}"
+
+
+def expand(keypoints: Dict[str, float]) -> np.ndarray:
+    """"HH:MM" → value keypoints to ``N_BUCKETS`` values, linear and wrapping past midnight."""
+    xs = np.array([int(k[:2]) * 60 + int(k[3:]) for k in keypoints], dtype=np.float64)
+    ys = np.array(list(keypoints.values()), dtype=np.float64)
+    order = np.argsort(xs)
+    xs, ys = xs[order], ys[order]
+    grid = np.arange(N_BUCKETS) * BUCKET_MINUTES
+    return np.interp(grid, xs, ys, period=24 * 60)
+
+
+@dataclass(slots=True)
+class DepartureWindow:
+    best_bucket: np.ndarray  # [resort]
+    best_eta: np.ndarray     # [resort]
+    start: np.ndarray        # [resort] 창 시작 bucket
+    end: np.ndarray          # [resort] 창 끝 bucket(포함)
+    eta: np.ndarray          # [resort, bucket]
+
+
+class TrafficProfiles:
+    def __init__(self, names: List[str], table: np.ndarray, assign: np.ndarray):
+        self.names = names    # "car_min:영동" 등
+        self.table = table    # [profile, day, bucket]
+        self.assign = assign  # [mode, resort] → profile
+
+    @classmethod
+    def from_json(cls, catalog: ResortCatalog, path: Path = PROFILES_PATH) -> "TrafficProfiles":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("bucket_minutes", BUCKET_MINUTES) != BUCKET_MINUTES:
+            raise ValueError(f"bucket_minutes는 {BUCKET_MINUTES}분이어야 합니다")
+
+        names, rows = [], []
+        for field, corridors in data["profiles"].items():
+            for corridor, days in corridors.items():
+                names.append(f"{field}:{corridor}")
+                rows.append([expand(days[d]) for d in DAY_TYPES])
+        pos = {name: i for i, name in enumerate(names)}
+
+        assign = np.zeros((len(MODE_FIELDS), len(catalog)), dtype=np.int32)
+        for m, field in enumerate(MODE_FIELDS):
+            for j, r in enumerate(catalog.resorts):
+                key = f"{field}:{r.corridor}"
+                assign[m, j] = pos.get(key, pos.get(f"{field}:*", 0))
+        return cls(names, np.array(rows, dtype=np.float64), assign)
+
+    @staticmethod
+    def _eta(lo: np.ndarray, hi: np.ndarray, congestion: np.ndarray) -> np.ndarray:
+        return np.rint(lo + (hi - lo).astype(np.float64) * congestion).astype(np.int32)
+
+    def eta(self, times: TimeIndex, day: int, bucket: int) -> np.ndarray:
+        """ETA minutes [mode, resort] for one departure bucket."""
+        return self._eta(times.lo, times.hi, self.table[self.assign, day, bucket])
+
+    def eta_all(self, times: TimeIndex, day: int) -> np.ndarray:
+        """ETA minutes [mode, resort, bucket] for the whole day."""
+        return self._eta(times.lo[..., None], times.hi[..., None], self.table[self.assign, day, :])
+
+    def eta_batch(self, lo: np.ndarray, hi: np.ndarray, day: int, bucket: int) -> np.ndarray:
+        """ETA minutes [origin, mode, resort] from ``TravelTimeModel.matrix`` output."""
+        return self._eta(lo, hi, self.table[self.assign, day, bucket][None])
+
+    def at(self, times: TimeIndex, day: int, bucket: int) -> TimeIndex:
+        """TimeIndex whose range is the single ETA at this departure (lo == hi)."""
+        eta = self.eta(times, day, bucket)
+        return TimeIndex(eta, eta, times.has, times.name_rank)
+
+    def best_windows(self, times: TimeIndex, day: int, m: int,
+                     tolerance: int = WINDOW_TOLERANCE, hours=DEPARTURE_HOURS) -> DepartureWindow:
+        return departure_windows(self.eta_all(times, day)[m], tolerance, hours)
+
+
+def departure_windows(eta: np.ndarray, tolerance: int = WINDOW_TOLERANCE, hours=DEPARTURE_HOURS) -> DepartureWindow:
+    """Best departure bucket and the contiguous good window around it from ETA [resort, bucket]."""
+    idx = np.arange(N_BUCKETS)
+    allowed = (idx >= hours[0] * 60 // BUCKET_MINUTES) & (idx <= hours[1] * 60 // BUCKET_MINUTES)
+    masked = np.where(allowed, eta, np.iinfo(np.int32).max)
+    best_bucket = np.argmin(masked, axis=1)
+    best_eta = eta[np.arange(len(eta)), best_bucket]
+    ok = allowed & (eta <= best_eta[:, None] + tolerance)
+    # 최적 bucket을 포함하는 연속 구간: 왼쪽/오른쪽으로 가장 가까운 "나쁜" bucket
+    left_bad = np.maximum.accumulate(np.where(ok, -1, idx), axis=1)
+    right_bad = np.minimum.accumulate(np.where(ok, N_BUCKETS, idx)[:, ::-1], axis=1)[:, ::-1]
+    rows = np.arange(len(eta))
+    start = left_bad[rows, best_bucket] + 1
+    end = right_bad[rows, best_bucket] - 1
+    return DepartureWindow(best_bucket, best_eta, start, end, eta)
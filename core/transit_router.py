@@ -0,0 +1,505 @@
+import csv
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.resort_catalog import MODE_FIELDS, ResortCatalog
+from core.traffic_profile import BUCKET_MINUTES, DAY_TYPES, N_BUCKETS
+from core.travel_time import Origin, haversine_km
+
+# =========================
+# Timetable routing (KTX/철도 연계 + 전철 + 시외버스 + 리조트 셔틀)
+# - data/gtfs/: GTFS 형식 부분집합(stops, routes, trips, stop_times, frequencies, calendar, transfers)
+#   stops.txt 확장 컬럼: access(도심 출발지에서 바로 가는 거점역/터미널), resort(카탈로그 리조트 이름)
+#   → 현재 파일은 노선 구조를 본뜬 표본 시간표, 공식 피드로 바꿔 넣으면 그대로 동작
+# - 요일 구분(평일/주말)별로 운행하는 trip만 모아 패턴(같은 정류장 순서) 단위 배열로 컴파일
+#   패턴마다 [정류장 위치, trip] 도착/출발(분) int32 배열, 각 행은 오름차순(추월 trip은 패턴 분리)
+# - RAPTOR(라운드 = 탑승 횟수): 라운드마다 개선된 정류장을 지나는 패턴만 한 번씩 훑음
+#   earliest_arrival: 출발 시각 → 리조트별 가장 이른 도착 / latest_departure: 역방향 RAPTOR
+#   day_eta: 하루 96칸 출발 시각을 늦은 시각부터 라벨을 재사용하며(rRAPTOR) 한 번에
+# - 출발지 → 거점역 접근 시간은 거리 기반 추정(도심 전철/도보), 환승 여유 CHANGE_MINUTES
+# =========================
+GTFS_DIR = Path(__file__).resolve().parent.parent / "data" / "gtfs"
+TRANSIT_MODE = MODE_FIELDS.index("ktx_min")  # 시간표 경로를 쓰는 이동수단
+
+ROUNDS = 4                   # 최대 탑승 횟수(환승 3회)
+CHANGE_MINUTES = 3           # 하차 후 다른 차량 탑승까지 최소 여유
+ACCESS_BASE_MINUTES = 10.0   # 출발지 → 거점역: 기본 + km당 시간(도심 전철 평균)
+ACCESS_MINUTES_PER_KM = 2.5
+ACCESS_MAX_KM = 35.0
+NO_ROUTE = np.iinfo(np.int32).max // 2  # day_eta에서 당일 경로 없음
+
+_INF = 1 << 30
+_ACCESS, _RIDE, _WALK = 0, 1, 2
+_SERVICE_DAY = {"weekday": "monday", "weekend": "saturday"}  # 요일 구분 → calendar.txt 대표 요일
+
+
+def clock(minutes: int) -> str:
+    return f"{minutes // 60 % 24:02d}:{minutes % 60:02d}"
+
+
+def _minutes(hms: str) -> int:
+    h, m, s = (int(x) for x in hms.strip().split(":"))
+    return h * 60 + m + s // 60
+
+
+def _read(path: Path) -> List[Dict[str, str]]:
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+# =========================
+# Compiled network (요일 구분 하나)
+# =========================
+@dataclass(slots=True)
+class Pattern:
+    route: int
+    stops: List[int]   # 위치 → 정류장
+    arr: np.ndarray    # [위치, trip] 도착(분)
+    dep: np.ndarray    # [위치, trip] 출발(분), 행마다 오름차순
+
+    @property
+    def n_trips(self) -> int:
+        return self.dep.shape[1]
+
+
+@dataclass(slots=True)
+class Network:
+    stop_ids: List[str]
+    names: List[str]
+    coords: np.ndarray                           # [stop, 2] 위도/경도
+    access: np.ndarray                           # [stop] 출발지에서 바로 접근 가능한 거점
+    resort: Dict[int, str]                       # 정류장 → 리조트 이름
+    routes: List[Tuple[str, str]]                # (짧은 이름, 노선 이름)
+    patterns: List[Pattern]
+    stop_patterns: List[List[Tuple[int, int]]]   # 정류장 → (패턴, 위치)
+    walks: List[List[Tuple[int, int]]]           # 정류장 → (도착 정류장, 분)
+    walks_in: List[List[Tuple[int, int]]]        # 정류장 → (출발 정류장, 분)
+    # 탐색 루프용 사본: 패턴별 [위치][trip] 파이썬 리스트(이 크기에선 bisect가 numpy 스칼라 접근보다 빠름)
+    dep_rows: List[List[List[int]]] = field(default_factory=list)
+    arr_rows: List[List[List[int]]] = field(default_factory=list)
+
+
+def _split_fifo(trips: List[Tuple[List[int], List[int]]]) -> List[List[Tuple[List[int], List[int]]]]:
+    """Group trips (sorted by first departure) so no trip overtakes another within a group."""
+    groups: List[List[Tuple[List[int], List[int]]]] = []
+    for trip in trips:
+        for g in groups:
+            last = g[-1]
+            if all(a >= b for a, b in zip(trip[1], last[1])) and all(a >= b for a, b in zip(trip[0], last[0])):
+                g.append(trip)
+                break
+        else:
+            groups.append([trip])
+    return groups
+
+
+def compile_network(path: Path, day: int) -> Network:
+    stops = _read(path / "stops.txt")
+    stop_ids = [s["stop_id"] for s in stops]
+    index = {sid: i for i, sid in enumerate(stop_ids)}
+    routes_raw = _read(path / "routes.txt")
+    route_index = {r["route_id"]: i for i, r in enumerate(routes_raw)}
+    weekday = _SERVICE_DAY[DAY_TYPES[day]]
+    services = {c["service_id"] for c in _read(path / "calendar.txt") if c.get(weekday) == "1"}
+    trip_route = {t["trip_id"]: route_index[t["route_id"]] for t in _read(path / "trips.txt") if t["service_id"] in services}
+
+    rows: Dict[str, List[Tuple[int, int, int, int]]] = {}
+    for st in _read(path / "stop_times.txt"):
+        if st["trip_id"] in trip_route:
+            rows.setdefault(st["trip_id"], []).append(
+                (int(st["stop_sequence"]), index[st["stop_id"]], _minutes(st["arrival_time"]), _minutes(st["departure_time"]))
+            )
+    freqs: Dict[str, List[Tuple[int, int, int]]] = {}
+    freq_path = path / "frequencies.txt"
+    for fr in _read(freq_path) if freq_path.exists() else []:
+        freqs.setdefault(fr["trip_id"], []).append(
+            (_minutes(fr["start_time"]), _minutes(fr["end_time"]), max(1, int(fr["headway_secs"]) // 60))
+        )
+
+    # (노선, 정류장 순서) → trip 목록; frequencies.txt가 있는 trip은 배차 간격대로 펼침
+    grouped: Dict[Tuple[int, Tuple[int, ...]], List[Tuple[List[int], List[int]]]] = {}
+    for trip_id, seq in rows.items():
+        seq.sort()
+        key = (trip_route[trip_id], tuple(s for _, s, _, _ in seq))
+        arr = [a for _, _, a, _ in seq]
+        dep = [d for _, _, _, d in seq]
+        starts = [(arr, dep)]
+        if trip_id in freqs:
+            starts = []
+            for begin, end, headway in freqs[trip_id]:
+                for t0 in range(begin, end, headway):
+                    shift = t0 - dep[0]
+                    starts.append(([a + shift for a in arr], [d + shift for d in dep]))
+        grouped.setdefault(key, []).extend(starts)
+
+    patterns: List[Pattern] = []
+    for (route, seq), trips in sorted(grouped.items()):
+        trips.sort(key=lambda t: t[1][0])
+        for g in _split_fifo(trips):
+            patterns.append(Pattern(
+                route,
+                list(seq),
+                np.array([t[0] for t in g], dtype=np.int32).T.copy(),
+                np.array([t[1] for t in g], dtype=np.int32).T.copy(),
+            ))
+
+    n = len(stop_ids)
+    stop_patterns: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+    for p, pat in enumerate(patterns):
+        for pos, s in enumerate(pat.stops):
+            stop_patterns[s].append((p, pos))
+    walks: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+    walks_in: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+    tr_path = path / "transfers.txt"
+    for tr in _read(tr_path) if tr_path.exists() else []:
+        a, b = index[tr["from_stop_id"]], index[tr["to_stop_id"]]
+        if a != b:
+            w = -(-int(tr.get("min_transfer_time") or 0) // 60)
+            walks[a].append((b, w))
+            walks_in[b].append((a, w))
+
+    net = Network(
+        stop_ids=stop_ids,
+        names=[s["stop_name"] for s in stops],
+        coords=np.array([(float(s["stop_lat"]), float(s["stop_lon"])) for s in stops], dtype=np.float64),
+        access=np.array([s.get("access") == "1" for s in stops], dtype=bool),
+        resort={i: s["resort"] for i, s in enumerate(stops) if s.get("resort")},
+        routes=[(r["route_short_name"], r["route_long_name"]) for r in routes_raw],
+        patterns=patterns,
+        stop_patterns=stop_patterns,
+        walks=walks,
+        walks_in=walks_in,
+    )
+    net.dep_rows = [p.dep.tolist() for p in patterns]
+    net.arr_rows = [p.arr.tolist() for p in patterns]
+    return net
+
+
+# =========================
+# Journeys
+# =========================
+@dataclass(slots=True)
+class Leg:
+    kind: str       # access / ride / walk
+    route: str      # 짧은 노선 이름(KTX, 셔틀, ...) — access/walk는 빈 문자열
+    board: str
+    alight: str
+    depart: int     # 분(자정 기준, 24시 넘으면 다음 날)
+    arrive: int
+
+
+@dataclass(slots=True)
+class Journey:
+    legs: List[Leg]
+
+    @property
+    def depart(self) -> int:
+        return self.legs[0].depart
+
+    @property
+    def arrive(self) -> int:
+        return self.legs[-1].arrive
+
+    @property
+    def minutes(self) -> int:
+        return self.arrive - self.depart
+
+    @property
+    def rides(self) -> int:
+        return sum(1 for leg in self.legs if leg.kind == "ride")
+
+    def describe(self) -> str:
+        parts = []
+        for leg in self.legs:
+            if leg.kind == "access":
+                parts.append(f"{clock(leg.depart)} 출발 → {leg.alight}({leg.arrive - leg.depart}분)")
+            elif leg.kind == "walk":
+                parts.append(f"도보 {leg.arrive - leg.depart}분 → {leg.alight}")
+            else:
+                parts.append(f"{leg.route} {clock(leg.depart)} {leg.board} → {clock(leg.arrive)} {leg.alight}")
+        return " · ".join(parts)
+
+    def record(self) -> Dict:
+        return {
+            "depart": clock(self.depart),
+            "arrive": clock(self.arrive),
+            "minutes": self.minutes,
+            "legs": [{"kind": leg.kind, "route": leg.route, "from": leg.board, "to": leg.alight,
+                      "depart": clock(leg.depart), "arrive": clock(leg.arrive)} for leg in self.legs],
+        }
+
+
+class _Labels:
+    """Per-round arrival (or departure, backward) times plus parent pointers for journey rebuild."""
+
+    def __init__(self, n_stops: int, rounds: int, fill: int):
+        self.tau = [[fill] * n_stops for _ in range(rounds + 1)]
+        self.best = [fill] * n_stops
+        self.parent: List[Dict[int, tuple]] = [{} for _ in range(rounds + 1)]
+
+    def first_round(self, s: int) -> int:
+        # 탐색이 일찍 끝나면 뒤 라운드는 비어 있음 → 최종 라벨을 처음 얻은 라운드부터 역추적
+        return next(k for k, tau in enumerate(self.tau) if tau[s] == self.best[s])
+
+    def round_of(self, s: int, k: int) -> int:
+        # 복사된 라벨이면 실제로 갱신된(더 낮은) 라운드로 내려감
+        while k > 0 and self.tau[k - 1][s] == self.tau[k][s]:
+            k -= 1
+        return k
+
+
+# =========================
+# Router
+# =========================
+class TransitRouter:
+    def __init__(self, networks: Sequence[Network], catalog: ResortCatalog,
+                 rounds: int = ROUNDS, change: int = CHANGE_MINUTES):
+        self.networks = list(networks)   # 요일 구분(DAY_TYPES) 순서
+        self.rounds = rounds
+        self.change = change
+        pos = {r.name: i for i, r in enumerate(catalog.resorts)}
+        # 정류장 → 카탈로그 리조트 인덱스(카탈로그에 없는 리조트 정류장은 무시)
+        self.targets = [{s: pos[name] for s, name in net.resort.items() if name in pos} for net in self.networks]
+        self.n_resorts = len(catalog)
+
+    @classmethod
+    def from_gtfs(cls, catalog: ResortCatalog, path: Path = GTFS_DIR) -> "TransitRouter":
+        return cls([compile_network(path, d) for d in range(len(DAY_TYPES))], catalog)
+
+    def access(self, net: Network, origin: Origin) -> Dict[int, int]:
+        """Access stop → minutes from ``origin`` (distance-based estimate, within ``ACCESS_MAX_KM``)."""
+        idx = np.flatnonzero(net.access)
+        km = haversine_km(np.array([[origin.lat, origin.lon]]), net.coords[idx])[0]
+        near = km <= ACCESS_MAX_KM
+        minutes = np.rint(ACCESS_BASE_MINUTES + ACCESS_MINUTES_PER_KM * km[near]).astype(int)
+        return {int(s): int(m) for s, m in zip(idx[near], minutes)}
+
+    # ---------- forward RAPTOR ----------
+    def _forward(self, net: Network, seeds: Dict[int, int], lab: _Labels) -> None:
+        marked = set()
+        for s, t in seeds.items():
+            if t < lab.best[s]:
+                lab.tau[0][s] = lab.best[s] = t
+                lab.parent[0][s] = (_ACCESS,)
+                marked.add(s)
+        self._walk_forward(net, lab, 0, marked)
+
+        for k in range(1, self.rounds + 1):
+            if not marked:
+                break
+            prev, cur = lab.tau[k - 1], lab.tau[k]
+            for s, t in enumerate(prev):
+                if t < cur[s]:
+                    cur[s] = t
+            queue: Dict[int, int] = {}
+            for s in marked:
+                for p, pos in net.stop_patterns[s]:
+                    if pos < queue.get(p, _INF):
+                        queue[p] = pos
+            marked = set()
+            change = self.change if k > 1 else 0
+            for p, start in queue.items():
+                stops, arr, dep = net.patterns[p].stops, net.arr_rows[p], net.dep_rows[p]
+                trip = board = -1
+                for pos in range(start, len(stops)):
+                    s = stops[pos]
+                    if trip >= 0:
+                        a = arr[pos][trip]
+                        if a < lab.best[s]:
+                            cur[s] = lab.best[s] = a
+                            lab.parent[k][s] = (_RIDE, p, trip, board, pos)
+                            marked.add(s)
+                    if prev[s] < _INF:
+                        ready = prev[s] + change
+                        if trip < 0 or ready <= dep[pos][trip]:
+                            t = bisect_left(dep[pos], ready)
+                            if t < len(dep[pos]) and (trip < 0 or t < trip):
+                                trip, board = t, pos
+            self._walk_forward(net, lab, k, marked)
+
+    @staticmethod
+    def _walk_forward(net: Network, lab: _Labels, k: int, marked: set) -> None:
+        for s in list(marked):
+            for to, w in net.walks[s]:
+                t = lab.tau[k][s] + w
+                if t < lab.best[to]:
+                    lab.tau[k][to] = lab.best[to] = t
+                    lab.parent[k][to] = (_WALK, s, w)
+                    marked.add(to)
+
+    def _rebuild_forward(self, net: Network, lab: _Labels, target: int, origin: Origin,
+                         access: Dict[int, int]) -> Journey:
+        legs: List[Leg] = []
+        s, k = target, lab.first_round(target)
+        while True:
+            entry = lab.parent[k][s]
+            t = lab.tau[k][s]
+            if entry[0] == _ACCESS:
+                legs.append(Leg("access", "", origin.name, net.names[s], t - access[s], t))
+                break
+            if entry[0] == _WALK:
+                _, frm, w = entry
+                legs.append(Leg("walk", "", net.names[frm], net.names[s], t - w, t))
+                s, k = frm, lab.round_of(frm, k)
+                continue
+            _, p, trip, board, pos = entry
+            pat = net.patterns[p]
+            b = pat.stops[board]
+            legs.append(Leg("ride", net.routes[pat.route][0], net.names[b], net.names[s],
+                            net.dep_rows[p][board][trip], net.arr_rows[p][pos][trip]))
+            s, k = b, lab.round_of(b, k - 1)
+        return Journey(legs[::-1])
+
+    def earliest_arrival(self, origin: Origin, day: int, depart: int) -> Dict[int, Journey]:
+        """Resort index → earliest-arrival journey leaving ``origin`` at ``depart`` (minutes after midnight)."""
+        net = self.networks[day]
+        access = self.access(net, origin)
+        lab = _Labels(len(net.stop_ids), self.rounds, _INF)
+        self._forward(net, {s: depart + m for s, m in access.items()}, lab)
+        out = {}
+        for s, i in self.targets[day].items():
+            if lab.best[s] < _INF:
+                out[i] = self._rebuild_forward(net, lab, s, origin, access)
+        return out
+
+    def day_eta(self, origin: Origin, day: int) -> np.ndarray:
+        """[resort, bucket] door-to-door minutes for every departure bucket of the day (NO_ROUTE if none).
+
+        Range RAPTOR: buckets are scanned latest first and labels are kept, since an arrival
+        reachable by leaving later is also reachable by leaving earlier and waiting.
+        """
+        net = self.networks[day]
+        access = self.access(net, origin)
+        lab = _Labels(len(net.stop_ids), self.rounds, _INF)
+        eta = np.full((self.n_resorts, N_BUCKETS), NO_ROUTE, dtype=np.int32)
+        targets = self.targets[day]
+        for b in range(N_BUCKETS - 1, -1, -1):
+            t0 = b * BUCKET_MINUTES
+            self._forward(net, {s: t0 + m for s, m in access.items()}, lab)
+            for s, i in targets.items():
+                if lab.best[s] < _INF:
+                    eta[i, b] = lab.best[s] - t0
+        return eta
+
+    # ---------- backward RAPTOR (도착 시각 기준) ----------
+    def _backward(self, net: Network, target: int, arrive_by: int, lab: _Labels) -> None:
+        lab.tau[0][target] = lab.best[target] = arrive_by
+        lab.parent[0][target] = (_ACCESS,)
+        marked = {target}
+        self._walk_backward(net, lab, 0, marked)
+
+        for k in range(1, self.rounds + 1):
+            if not marked:
+                break
+            prev, cur = lab.tau[k - 1], lab.tau[k]
+            for s, t in enumerate(prev):
+                if t > cur[s]:
+                    cur[s] = t
+            queue: Dict[int, int] = {}
+            for s in marked:
+                for p, pos in net.stop_patterns[s]:
+                    if pos > queue.get(p, -1):
+                        queue[p] = pos
+            marked = set()
+            change = self.change if k > 1 else 0
+            for p, start in queue.items():
+                stops, arr, dep = net.patterns[p].stops, net.arr_rows[p], net.dep_rows[p]
+                trip = alight = -1
+                for pos in range(start, -1, -1):
+                    s = stops[pos]
+                    if trip >= 0:
+                        d = dep[pos][trip]
+                        if d > lab.best[s]:
+                            cur[s] = lab.best[s] = d
+                            lab.parent[k][s] = (_RIDE, p, trip, pos, alight)
+                            marked.add(s)
+                    if prev[s] > -_INF:
+                        ready = prev[s] - change
+                        if trip < 0 or ready >= arr[pos][trip]:
+                            t = bisect_right(arr[pos], ready) - 1
+                            if t > trip:
+                                trip, alight = t, pos
+            self._walk_backward(net, lab, k, marked)
+
+    @staticmethod
+    def _walk_backward(net: Network, lab: _Labels, k: int, marked: set) -> None:
+        for s in list(marked):
+            for frm, w in net.walks_in[s]:
+                t = lab.tau[k][s] - w
+                if t > lab.best[frm]:
+                    lab.tau[k][frm] = lab.best[frm] = t
+                    lab.parent[k][frm] = (_WALK, s, w)
+                    marked.add(frm)
+
+    def _rebuild_backward(self, net: Network, lab: _Labels, start: int, origin: Origin, access: int) -> Journey:
+        s, k = start, lab.first_round(start)
+        t = lab.tau[k][s]
+        legs = [Leg("access", "", origin.name, net.names[s], t - access, t)]
+        while True:
+            entry = lab.parent[k][s]
+            if entry[0] == _ACCESS:
+                break
+            if entry[0] == _WALK:
+                _, to, w = entry
+                t = legs[-1].arrive
+                legs.append(Leg("walk", "", net.names[s], net.names[to], t, t + w))
+                s, k = to, lab.round_of(to, k)
+                continue
+            _, p, trip, board, pos = entry
+            pat = net.patterns[p]
+            a = pat.stops[pos]
+            legs.append(Leg("ride", net.routes[pat.route][0], net.names[s], net.names[a],
+                            net.dep_rows[p][board][trip], net.arr_rows[p][pos][trip]))
+            s, k = a, lab.round_of(a, k - 1)
+        return Journey(legs)
+
+    def latest_departure(self, origin: Origin, day: int, arrive_by: int) -> Dict[int, Journey]:
+        """Resort index → journey leaving ``origin`` as late as possible and arriving by ``arrive_by``."""
+        net = self.networks[day]
+        access = self.access(net, origin)
+        out = {}
+        for target, i in self.targets[day].items():
+            lab = _Labels(len(net.stop_ids), self.rounds, -_INF)
+            self._backward(net, target, arrive_by, lab)
+            reached = [(lab.best[s] - m, s) for s, m in access.items() if lab.best[s] > -_INF]
+            if reached:
+                _, s = max(reached)
+                out[i] = self._rebuild_backward(net, lab, s, origin, access[s])
+        return out
+
+
+if __name__ == "__main__":
+    import time
+
+    from core.travel_time import OriginGazetteer
+
+    catalog = ResortCatalog.from_json()
+    gazetteer = OriginGazetteer.from_json()
+    t0 = time.perf_counter()
+    router = TransitRouter.from_gtfs(catalog)
+    t1 = time.perf_counter()
+    n_patterns = sum(len(net.patterns) for net in router.networks)
+    n_trips = sum(p.n_trips for net in router.networks for p in net.patterns)
+    print(f"시간표 컴파일: 패턴 {n_patterns}개 · trip {n_trips}개 · {(t1 - t0) * 1000:.1f} ms")
+
+    origin = gazetteer.resolve(catalog.origin)
+    for day in range(len(DAY_TYPES)):
+        print(f"[{DAY_TYPES[day]}] {origin.name} 07:00 출발")
+        for i, j in sorted(router.earliest_arrival(origin, day, 7 * 60).items(), key=lambda ij: ij[1].arrive):
+            print(f"  {catalog.resorts[i].name}: {j.minutes}분 · {j.describe()}")
+    print(f"[weekend] 10:00까지 도착")
+    for i, j in sorted(router.latest_departure(origin, 1, 10 * 60).items(), key=lambda ij: -ij[1].depart):
+        print(f"  {catalog.resorts[i].name}: {clock(j.depart)} 출발 · {j.describe()}")
+
+    for name, fn in [
+        ("earliest_arrival", lambda: router.earliest_arrival(origin, 1, 7 * 60)),
+        ("latest_departure", lambda: router.latest_departure(origin, 1, 10 * 60)),
+        (f"day_eta({N_BUCKETS}칸)", lambda: router.day_eta(origin, 1)),
+    ]:
+        t0 = time.perf_counter()
+        fn()
+        print(f"{name}: {(time.perf_counter() - t0) * 1000:.2f} ms")
@@ -0,0 +1,179 @@
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.resort_catalog import MODES, ResortCatalog, TimeIndex
+
+# =========================
+# Travel-time engine
+# - 출발지/리조트 좌표 → 대권거리(haversine) 행렬 [origin, resort]
+# - 이동수단별 거리 모델: 시간 = a + b × 거리 (하한/상한 각각), 데이터의 기준 출발지 값으로 최소제곱 적합
+# - 리조트×이동수단별 도로 계수 = 관측값 / 모델값 → 우회 도로, 역 접근성 등 경로 특성을 반영
+#   (기준 출발지에서는 원래 값 그대로 재현)
+# - origin × mode × resort 시간 범위를 NumPy 한 번에 계산, 출발지별 TimeIndex는 모델 인스턴스마다 캐시(LRU)
+# - '위도, 경도' 입력은 범위(위도 ±90, 경도 ±180)를 벗어나면 찾지 못한 것으로 처리
+# =========================
+ORIGINS_PATH = Path(__file__).resolve().parent.parent / "data" / "origins.json"
+EARTH_RADIUS_KM = 6371.0
+ROUND_MINUTES = 5
+INDEX_CACHE_SIZE = 256  # 출발지(좌표 소수 4자리)별 TimeIndex 캐시 상한
+
+_LATLON = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*$")
+
+
+@dataclass(slots=True)
+class Origin:
+    name: str
+    lat: float
+    lon: float
+    aliases: List[str] = field(default_factory=list)
+    level: int = 1  # 1: 구/시, 2: 동/역(더 구체적)
+
+
+def _norm(text: str) -> str:
+    return re.sub(r"\s+", "", text)
+
+
+class OriginGazetteer:
+    """Resolve free-text origins ("성동구 옥수동", "잠실", "37.51, 127.10") to coordinates."""
+
+    def __init__(self, origins: Sequence[Origin]):
+        self.origins = list(origins)
+        # (정규화된 이름/별칭, 구체성, 길이) — 가장 구체적이고 긴 일치를 우선
+        self._keys = sorted(
+            ((_norm(k), o) for o in self.origins for k in [o.name, *o.aliases]),
+            key=lambda ko: (-ko[1].level, -len(ko[0])),
+        )
+
+    @classmethod
+    def from_json(cls, path: Path = ORIGINS_PATH) -> "OriginGazetteer":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls([Origin(**d) for d in data["origins"]])
+
+    def resolve(self, text: str) -> Optional[Origin]:
+        m = _LATLON.match(text)
+        if m:
+            lat, lon = float(m.group(1)), float(m.group(2))
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                return None
+            return Origin(name=f"{lat:.4f}, {lon:.4f}", lat=lat, lon=lon, level=3)
+        q = _norm(text)
+        if not q:
+            return None
+        for key, origin in self._keys:
+            if key in q:
+                return origin
+        return None
+
+
+def haversine_km(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Great-circle distances between (N, 2) and (M, 2) lat/lon arrays → (N, M)."""
+    a = np.radians(np.asarray(a, dtype=np.float64))[:, None, :]
+    b = np.radians(np.asarray(b, dtype=np.float64))[None, :, :]
+    dlat = b[..., 0] - a[..., 0]
+    dlon = b[..., 1] - a[..., 1]
+    h = np.sin(dlat / 2) ** 2 + np.cos(a[..., 0]) * np.cos(b[..., 0]) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(h))
+
+
+def _fit_line(d: np.ndarray, t: np.ndarray) -> Tuple[float, float]:
+    """Least-squares t = a + b·d with b ≥ 0 (falls back to a constant for < 2 points)."""
+    if len(d) == 0:
+        return 0.0, 0.0
+    if len(d) >= 2 and np.ptp(d) > 0:
+        b, a = np.polyfit(d, t, 1)
+        if b >= 0:
+            return float(a), float(b)
+    return float(np.mean(t)), 0.0
+
+
+class TravelTimeModel:
+    def __init__(self, catalog: ResortCatalog, calibration: Origin):
+        self.catalog = catalog
+        self.calibration = calibration
+        self.coords = catalog.coords
+        d0 = haversine_km(np.array([[calibration.lat, calibration.lon]]), self.coords)[0]
+
+        # 이동수단별 [a_lo, b_lo, a_hi, b_hi]
+        n_modes = len(MODES)
+        self.coef = np.zeros((n_modes, 4))
+        for m in range(n_modes):
+            has = catalog.has[m] & np.isfinite(d0)
+            self.coef[m, :2] = _fit_line(d0[has], catalog.lo[m, has].astype(np.float64))
+            self.coef[m, 2:] = _fit_line(d0[has], catalog.hi[m, has].astype(np.float64))
+
+        # 도로 계수 [mode, resort] — 기준 출발지에서 관측/모델 비율
+        base_lo, base_hi = self._base(d0[None, :])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.factor_lo = np.where(catalog.has, catalog.lo / base_lo[0], 1.0)
+            self.factor_hi = np.where(catalog.has, catalog.hi / base_hi[0], 1.0)
+        self.has = catalog.has & np.isfinite(self.coords).all(axis=1)[None, :]
+        # (lat, lon) → TimeIndex, 삽입 순서 = 사용 순서(LRU)
+        self._indexes: Dict[Tuple[float, float], TimeIndex] = {}
+        self._indexes_lock = threading.Lock()
+
+    def _base(self, dist: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """dist (O, R) → model minutes (O, M, R) for lower/upper bounds."""
+        d = dist[:, None, :]
+        c = self.coef[None, :, :, None]
+        return c[:, :, 0] + c[:, :, 1] * d, c[:, :, 2] + c[:, :, 3] * d
+
+    def matrix(self, origins: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(O, 2) lat/lon → lo, hi minutes as int32 arrays of shape (O, mode, resort)."""
+        base_lo, base_hi = self._base(haversine_km(origins, self.coords))
+        lo = base_lo * self.factor_lo[None]
+        hi = base_hi * self.factor_hi[None]
+        lo = np.maximum(np.rint(lo / ROUND_MINUTES) * ROUND_MINUTES, ROUND_MINUTES)
+        hi = np.maximum(np.rint(hi / ROUND_MINUTES) * ROUND_MINUTES, lo)
+        mask = self.has[None]
+        return np.where(mask, lo, 0).astype(np.int32), np.where(mask, hi, 0).astype(np.int32)
+
+    def for_origin(self, origin: Origin) -> TimeIndex:
+        key = (round(origin.lat, 4), round(origin.lon, 4))
+        with self._indexes_lock:
+            times = self._indexes.pop(key, None)
+            if times is not None:
+                self._indexes[key] = times
+                return times
+        lo, hi = self.matrix(np.array([key]))
+        times = TimeIndex(lo[0], hi[0], self.has, self.catalog.name_rank)
+        with self._indexes_lock:
+            self._indexes[key] = times
+            while len(self._indexes) > INDEX_CACHE_SIZE:
+                del self._indexes[next(iter(self._indexes))]
+        return times
+
+
+def calibration_report(model: TravelTimeModel, gazetteer: OriginGazetteer) -> List[str]:
+    lines = []
+    for m, mode in enumerate(MODES):
+        a_lo, b_lo, a_hi, b_hi = model.coef[m]
+        lines.append(f"{mode:<18} 하한 {a_lo:6.1f} + {b_lo:.3f}·km  상한 {a_hi:6.1f} + {b_hi:.3f}·km")
+    origins = np.array([[o.lat, o.lon] for o in gazetteer.origins])
+    lo, hi = model.matrix(origins)
+    names = [r.name for r in model.catalog.resorts]
+    # 자가용 기준 몇몇 출발지 예시
+    for o, origin in enumerate(gazetteer.origins[:5]):
+        row = " · ".join(f"{names[j].split()[0]} {lo[o, 0, j]}–{hi[o, 0, j]}" for j in range(len(names)))
+        lines.append(f"  {origin.name}: {row}")
+    return lines
+
+
+if __name__ == "__main__":
+    import time
+
+    catalog = ResortCatalog.from_json()
+    gazetteer = OriginGazetteer.from_json()
+    model = TravelTimeModel(catalog, gazetteer.resolve(catalog.origin))
+    print("\n".join(calibration_report(model, gazetteer)))
+
+    origins = np.random.default_rng(0).uniform((37.4, 126.8), (37.7, 127.2), size=(1000, 2))
+    t0 = time.perf_counter()
+    model.matrix(origins)
+    print(f"행렬 {len(origins)}×{len(MODES)}×{len(catalog)}: {(time.perf_counter() - t0) * 1000:.2f} ms")
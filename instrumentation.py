@@ -0,0 +1,242 @@
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# =============================
+# Section instrumentation (Prometheus text format)
+# - 페이지의 이름 붙은 구간(section)마다: 실행 시간, 내보낸 요소 수, 전송 bytes
+# - 요소/bytes는 ScriptRunContext의 _enqueue를 감싸서, 현재 열린 구간에 집계
+#   (브라우저 캐시 참조로 바뀐 메시지는 실제로 나간 크기로 셈)
+# - 페이지×구간별 히스토그램 → Prometheus 텍스트 형식
+#   APP_METRICS=file → APP_METRICS_PATH(기본 .cache/metrics.prom)에 주기적으로 기록
+#   APP_METRICS=http → 127.0.0.1:APP_METRICS_PORT(기본 9464)/metrics
+# - 꺼져 있으면(기본) section()은 공유 nullcontext를 돌려줄 뿐 → 오버헤드 거의 없음
+# - 내보내기 실패(포트 사용 중 등)는 한 번만 로그 남기고 계측을 끔, 파일 기록 실패는 로그 후 다음 주기에 재시도
+# - Streamlit 내부(_enqueue)가 바뀌어 없으면 요소/bytes 집계 없이 시간만 잼
+# =============================
+MODE = os.environ.get("APP_METRICS", "").strip().lower()
+ENABLED = MODE in ("file", "http")
+METRICS_PATH = Path(os.environ.get("APP_METRICS_PATH", ".cache/metrics.prom"))
+METRICS_PORT = int(os.environ.get("APP_METRICS_PORT", "9464"))
+FLUSH_SECONDS = 10.0
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+ELEMENT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+BYTES_BUCKETS = (0, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+_NOOP = nullcontext()
+_log = logging.getLogger(__name__)
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float]):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, page: str, section: str, value: float) -> None:
+        with self._lock:
+            s = self._series.get((page, section))
+            if s is None:
+                # [bucket counts..., +Inf count, sum]
+                s = self._series[(page, section)] = [0.0] * (len(self.buckets) + 2)
+            s[bisect.bisect_left(self.buckets, value)] += 1
+            s[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {k: list(v) for k, v in self._series.items()}
+        for (page, section), s in sorted(series.items()):
+            labels = f'page="{page}",section="{section}"'
+            cum = 0.0
+            for le, n in zip(self.buckets, s):
+                cum += n
+                lines.append(f'{self.name}_bucket{{{labels},le="{le:g}"}} {cum:g}')
+            cum += s[len(self.buckets)]
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {cum:g}')
+            lines.append(f"{self.name}_sum{{{labels}}} {s[-1]:g}")
+            lines.append(f"{self.name}_count{{{labels}}} {cum:g}")
+        return lines
+
+
+SECONDS = Histogram("app_section_seconds", "Wall time spent in a page section per run.", SECONDS_BUCKETS)
+ELEMENTS = Histogram("app_section_elements", "Elements emitted by a page section per run.", ELEMENT_BUCKETS)
+BYTES = Histogram("app_section_bytes", "Serialized ForwardMsg bytes sent by a page section per run.", BYTES_BUCKETS)
+
+
+def render_prometheus() -> str:
+    return "\n".join(SECONDS.render() + ELEMENTS.render() + BYTES.render()) + "\n"
+
+
+# =============================
+# Sections
+# =============================
+_local = threading.local()
+_enqueue_warned = False
+
+
+def _counting_enqueue(enqueue):
+    def wrapper(msg):
+        stack = getattr(_local, "stack", None)
+        if stack and msg.WhichOneof("type") == "delta":
+            top = stack[-1]
+            if msg.delta.WhichOneof("type") in ("new_element", "add_block"):
+                top.elements += 1
+            top.bytes += msg.ByteSize()
+        return enqueue(msg)
+
+    wrapper.counting = True
+    return wrapper
+
+
+def _patch_enqueue(ctx) -> None:
+    # _enqueue는 Streamlit 비공개 속성 → 없으면 집계 없이 진행(시간만 기록)
+    global _enqueue_warned
+    if not hasattr(ctx, "_enqueue"):
+        if not _enqueue_warned:
+            _enqueue_warned = True
+            _log.warning("ScriptRunContext has no _enqueue; section element/byte counts disabled")
+        return
+    if not getattr(ctx._enqueue, "counting", False):
+        ctx._enqueue = _counting_enqueue(ctx._enqueue)
+
+
+class _Section:
+    __slots__ = ("page", "name", "elements", "bytes", "_t0")
+
+    def __init__(self, page: str, name: str):
+        self.page = page
+        self.name = name
+        self.elements = 0
+        self.bytes = 0
+
+    def __enter__(self):
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None:
+            _patch_enqueue(ctx)
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._t0
+        _local.stack.pop()
+        SECONDS.observe(self.page, self.name, elapsed)
+        ELEMENTS.observe(self.page, self.name, self.elements)
+        BYTES.observe(self.page, self.name, self.bytes)
+        return False
+
+
+def section(page: str, name: str):
+    """``with section("ski", "render"):`` — times the block and counts what it sends."""
+    if not ENABLED:
+        return _NOOP
+    _start_exporter()
+    if _exporter_disabled:
+        return _NOOP
+    return _Section(page, name)
+
+
+# =============================
+# Export (file / local endpoint), started once per process
+# =============================
+_exporter_lock = threading.Lock()
+_exporter_started = False
+_exporter_disabled = False  # 내보내기를 시작하지 못함 → section()은 계측 없이 진행
+
+
+def write_metrics(path: Path = METRICS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(render_prometheus(), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _flush_loop() -> None:
+    failing = False
+    while True:
+        time.sleep(FLUSH_SECONDS)
+        try:
+            write_metrics()
+        except Exception:
+            # 실패가 이어지는 동안은 한 번만 로그, 다음 주기에 다시 시도
+            if not failing:
+                _log.exception("writing metrics to %s failed; retrying every %gs", METRICS_PATH, FLUSH_SECONDS)
+            failing = True
+        else:
+            failing = False
+
+
+def _start_exporter() -> None:
+    global _exporter_started, _exporter_disabled
+    if _exporter_started:
+        return
+    with _exporter_lock:
+        if _exporter_started:
+            return
+        if MODE == "http":
+            try:
+                server = ThreadingHTTPServer(("127.0.0.1", METRICS_PORT), _MetricsHandler)
+            except OSError as e:
+                _log.warning("metrics endpoint 127.0.0.1:%d unavailable (%s); section metrics disabled", METRICS_PORT, e)
+                _exporter_disabled = True
+            else:
+                threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        else:
+            threading.Thread(target=_flush_loop, name="metrics-file", daemon=True).start()
+        _exporter_started = True
+
+
+def overhead(n: int = 200_000) -> Dict[str, float]:
+    """Per-call cost (ns) of an empty ``with section(...)`` block, disabled vs. enabled."""
+    global ENABLED
+
+    def loop(factory) -> float:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            with factory("bench", "noop"):
+                pass
+        return (time.perf_counter() - t0) / n * 1e9
+
+    saved, ENABLED = ENABLED, False
+    try:
+        disabled = loop(section)
+    finally:
+        ENABLED = saved
+    return {"disabled_ns": disabled, "enabled_ns": loop(_Section)}
+
+
+if __name__ == "__main__":
+    r = overhead()
+    print(f"section() 오버헤드: 꺼짐 {r['disabled_ns']:.0f} ns · 켜짐 {r['enabled_ns']:.0f} ns (구간당)")
+    print(render_prometheus(), end="")
@@ -0,0 +1,291 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import urllib3
+
+# =========================
+# Link health (슬로프맵 페이지/PDF/이미지 URL 점검)
+# - asyncio + urllib3 PoolManager(호스트별 연결 재사용), 요청은 asyncio.to_thread로 병렬
+# - 전체 동시 요청 상한 + 호스트별 상한(같은 리조트 서버에 몰리지 않게), 연결/읽기 타임아웃
+# - HEAD 먼저, 실패(405/403 등)하면 GET으로 첫 바이트만 받아 재확인
+# - 결과는 TTL 캐시(정상 12시간, 실패 30분 후 재시도) + 디스크(.cache/link_health.json)에 저장
+# - 페이지는 refresh()로 백그라운드 점검만 걸고(프로세스당 ttl_broken마다 한 번), 이미 아는 결과로 링크를 표시/대체
+#   ok(): 점검해서 정상인 것만 True / broken(): 점검해서 실패한 것만 True
+#   usable(): 알려진 불량이 아니면 True → 점검 전 링크도 그대로 보여 줌(점검 때문에 화면이 멈추지 않음)
+# - APP_LINK_CHECK=off 이면 점검하지 않음(벤치마크/오프라인 환경)
+# - `python link_health.py` 전체 점검, `--self-test` 로컬 대역 서버로 동작 확인
+# =========================
+ENABLED = os.environ.get("APP_LINK_CHECK", "on").strip().lower() not in ("0", "off", "false", "no")
+USER_AGENT = "Mozilla/5.0 (compatible; ski-guide-link-check)"
+
+OK, BROKEN, TIMEOUT = "ok", "broken", "timeout"
+RETRY_WITH_GET = (400, 403, 405, 406, 429, 500, 501, 502, 503)
+
+
+@dataclass
+class LinkStatus:
+    url: str
+    state: str                   # ok / broken / timeout
+    code: Optional[int] = None   # 최종 HTTP 상태 코드(연결 실패면 None)
+    error: str = ""
+    elapsed_ms: float = 0.0
+    checked_at: float = 0.0
+
+    @property
+    def broken(self) -> bool:
+        return self.state != OK
+
+
+class LinkHealth:
+    def __init__(
+        self,
+        cache_path: Optional[Path] = Path(".cache/link_health.json"),
+        ttl_ok: float = 12 * 3600,
+        ttl_broken: float = 30 * 60,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 5.0,
+        max_concurrency: int = 8,
+        per_host: int = 2,
+    ):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl_ok = ttl_ok
+        self.ttl_broken = ttl_broken
+        self.max_concurrency = max_concurrency
+        self.per_host = per_host
+        self._timeout = urllib3.Timeout(connect=connect_timeout, read=read_timeout)
+        self._deadline = connect_timeout + read_timeout + 1.0
+        self._http = urllib3.PoolManager(
+            num_pools=32,
+            maxsize=per_host,
+            headers={"User-Agent": USER_AGENT},
+            timeout=self._timeout,
+            retries=urllib3.Retry(total=None, connect=1, read=0, redirect=5, status=0,
+                                  raise_on_redirect=False, raise_on_status=False),
+        )
+        self._results: Dict[str, LinkStatus] = self._load() if ENABLED else {}
+        self._inflight: set = set()
+        self._refresh_after = 0.0  # 이 시각 전에는 refresh()가 아무것도 하지 않음
+        self._lock = threading.Lock()
+
+    # ---------- cache ----------
+    def _load(self) -> Dict[str, LinkStatus]:
+        if self.cache_path is None:
+            return {}
+        try:
+            rows = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            return {r["url"]: LinkStatus(**r) for r in rows}
+        except (OSError, ValueError, TypeError, KeyError):
+            return {}
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+        with self._lock:
+            rows = [asdict(s) for s in self._results.values()]
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_path.with_name(f"{self.cache_path.name}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(rows, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.cache_path)
+
+    def _is_fresh(self, s: Optional[LinkStatus]) -> bool:
+        ttl = self.ttl_broken if s is not None and s.broken else self.ttl_ok
+        return s is not None and time.time() - s.checked_at < ttl
+
+    # ---------- network ----------
+    def _request(self, url: str) -> LinkStatus:
+        t0 = time.perf_counter()
+        try:
+            resp = self._http.request("HEAD", url)
+            code = resp.status
+            if code in RETRY_WITH_GET or code >= 400:
+                # HEAD를 막아두는 서버가 많음 → 본문 첫 바이트만 GET
+                resp = self._http.request("GET", url, preload_content=False, headers={"Range": "bytes=0-0"})
+                resp.read(1)
+                resp.release_conn()
+                code = resp.status
+            state = OK if code < 400 else BROKEN
+            error = "" if state == OK else f"HTTP {code}"
+        except (urllib3.exceptions.HTTPError, OSError, ValueError) as e:
+            # 재시도 소진은 MaxRetryError로 감싸져 옴 → 원인으로 분류
+            cause = getattr(e, "reason", None) or e
+            # NewConnectionError(DNS 실패/연결 거부)는 urllib3에서 ConnectTimeoutError의 하위 클래스 → 먼저 제외
+            timed_out = (not isinstance(cause, urllib3.exceptions.NewConnectionError)
+                         and isinstance(cause, (urllib3.exceptions.TimeoutError, TimeoutError)))
+            code, state, error = None, TIMEOUT if timed_out else BROKEN, type(cause).__name__
+        return LinkStatus(url, state, code, error, (time.perf_counter() - t0) * 1000, time.time())
+
+    async def _check(self, url: str, overall: asyncio.Semaphore, hosts: Dict[str, asyncio.Semaphore]) -> LinkStatus:
+        host = hosts.setdefault(urlsplit(url).netloc, asyncio.Semaphore(self.per_host))
+        async with overall, host:
+            try:
+                return await asyncio.wait_for(asyncio.to_thread(self._request, url), self._deadline)
+            except asyncio.TimeoutError:
+                return LinkStatus(url, TIMEOUT, None, "deadline", self._deadline * 1000, time.time())
+
+    async def check_all(self, urls: Iterable[str], force: bool = False) -> Dict[str, LinkStatus]:
+        """Check ``urls`` concurrently (cached results reused unless ``force``); returns url → status."""
+        urls = list(dict.fromkeys(u for u in urls if u))
+        with self._lock:
+            todo = [u for u in urls if force or not self._is_fresh(self._results.get(u))]
+        if todo:
+            overall = asyncio.Semaphore(self.max_concurrency)
+            hosts: Dict[str, asyncio.Semaphore] = {}
+            checked = await asyncio.gather(*(self._check(u, overall, hosts) for u in todo))
+            with self._lock:
+                self._results.update((s.url, s) for s in checked)
+                self._inflight.difference_update(todo)
+            self._save()
+        with self._lock:
+            return {u: self._results[u] for u in urls}
+
+    def check_all_sync(self, urls: Iterable[str], force: bool = False) -> Dict[str, LinkStatus]:
+        return asyncio.run(self.check_all(urls, force=force))
+
+    # ---------- page API ----------
+    def refresh(self, urls: Iterable[str]) -> None:
+        """Start a background check of stale/unknown ``urls`` (non-blocking, deduplicated).
+
+        Runs at most once per ``ttl_broken`` (the shorter TTL) per instance; calls in between return at once.
+        """
+        if not ENABLED:
+            return
+        now = time.time()
+        with self._lock:
+            if now < self._refresh_after:
+                return
+            self._refresh_after = now + self.ttl_broken
+            stale = [u for u in dict.fromkeys(u for u in urls if u)
+                     if u not in self._inflight and not self._is_fresh(self._results.get(u))]
+            self._inflight.update(stale)
+        if stale:
+            threading.Thread(target=self.check_all_sync, args=(stale,), name="link-health", daemon=True).start()
+
+    def status(self, url: Optional[str]) -> Optional[LinkStatus]:
+        """Last check result for ``url``; ``None`` if empty or never checked."""
+        if not url:
+            return None
+        with self._lock:
+            return self._results.get(url)
+
+    def ok(self, url: Optional[str]) -> bool:
+        """True only if ``url`` was checked and answered (never checked → False)."""
+        s = self.status(url)
+        return s is not None and not s.broken
+
+    def broken(self, url: Optional[str]) -> bool:
+        """True only if the last check of ``url`` failed (never checked → False)."""
+        s = self.status(url)
+        return s is not None and s.broken
+
+    def usable(self, url: Optional[str]) -> bool:
+        """True unless ``url`` is empty or known to be broken — what the page shows while checks run."""
+        return bool(url) and not self.broken(url)
+
+
+def catalog_urls(resorts) -> List[str]:
+    urls = []
+    for r in resorts:
+        urls += [u for u in (r.slope_map_page, r.slope_map_pdf, r.slope_map_image) if u]
+    return list(dict.fromkeys(urls))
+
+
+# =========================
+# CLI / self-test against a local stand-in server
+# =========================
+def _self_test() -> int:
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    class StandIn(BaseHTTPRequestHandler):
+        def _route(self, head: bool):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            try:
+                path = self.path
+                if path.startswith("/slow"):
+                    time.sleep(1.5)
+                if path.startswith("/missing"):
+                    self.send_error(404)
+                    return
+                if path.startswith("/nohead") and head:
+                    self.send_error(405)
+                    return
+                if path.startswith("/moved"):
+                    self.send_response(302)
+                    self.send_header("Location", "/ok")
+                    self.end_headers()
+                    return
+                time.sleep(0.05)
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                if not head:
+                    self.wfile.write(b"ok")
+            finally:
+                with lock:
+                    active["now"] -= 1
+
+        def do_HEAD(self):
+            self._route(head=True)
+
+        def do_GET(self):
+            self._route(head=False)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    expected = {f"{base}/ok": OK, f"{base}/missing": BROKEN, f"{base}/nohead": OK,
+                f"{base}/moved": OK, f"{base}/slow": TIMEOUT, "http://127.0.0.1:9/refused": BROKEN}
+    expected.update({f"{base}/ok?{i}": OK for i in range(8)})
+
+    checker = LinkHealth(cache_path=None, connect_timeout=0.5, read_timeout=0.5, per_host=2)
+    t0 = time.perf_counter()
+    results = checker.check_all_sync(expected)
+    elapsed = time.perf_counter() - t0
+    server.shutdown()
+
+    failures = [f"{u}: {results[u].state} (기대 {want})" for u, want in expected.items() if results[u].state != want]
+    if active["peak"] > checker.per_host:
+        failures.append(f"호스트별 동시 요청 {active['peak']} > {checker.per_host}")
+    for line in failures:
+        print(f"❌ {line}")
+    print(f"{len(expected)}개 URL · {elapsed:.2f}s · 호스트 최대 동시 {active['peak']} · "
+          f"{'통과' if not failures else '실패'}")
+    return 1 if failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="슬로프맵 링크 점검")
+    parser.add_argument("--self-test", action="store_true", help="로컬 대역 서버로 점검 로직 확인")
+    parser.add_argument("--force", action="store_true", help="캐시 무시하고 다시 점검")
+    args = parser.parse_args(argv)
+    if args.self_test:
+        return _self_test()
+
+    from core.resort_catalog import ResortCatalog
+
+    results = LinkHealth().check_all_sync(catalog_urls(ResortCatalog.from_json().resorts), force=args.force)
+    for s in sorted(results.values(), key=lambda s: (not s.broken, s.url)):
+        mark = "✅" if not s.broken else "❌"
+        print(f"{mark} {s.state:<7} {s.code or '-':>4} {s.elapsed_ms:7.0f}ms  {s.url}  {s.error}")
+    return 0 if not any(s.broken for s in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
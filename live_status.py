@@ -0,0 +1,328 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import urllib3
+
+# =========================
+# Live resort status (운영 슬로프 수 · 야간 운영 · 적설/설질)
+# - 소스 설정: data/live_sources.json (리조트별 url/format/fields)
+#   url의 {base}는 base_url 또는 APP_LIVE_STATUS_BASE로 치환 → 로컬 대역 서버로 교체 가능
+# - 백그라운드 스레드 하나가 자체 이벤트 루프에서 주기적으로 폴링
+#   urllib3 PoolManager(연결 재사용) + asyncio.to_thread, 호스트별 동시 요청 상한
+# - 결과는 프로세스 전체가 공유하는 캐시 하나(모든 세션 공용), TTL 지나면 표시 안 함
+#   폴링 실패 시 직전 값 유지(TTL 안에서만) → 일시 장애에도 화면이 깜빡이지 않음
+#   소스 하나의 예외(이상한 값, 잘못된 정규식 등)는 errors()에 기록만 하고 폴링은 계속
+# - 페이지는 get()으로 캐시만 읽음(네트워크 호출 없음) → 리조트 사이트가 느려도 화면 지연 없음
+# - APP_LIVE_STATUS=off 이면 폴러를 띄우지 않음
+# - `python live_status.py --stand-in` 대역 서버, `--once` 한 번 폴링, `--self-test` 동작 확인
+# =========================
+SOURCES_PATH = Path(__file__).resolve().parent / "data" / "live_sources.json"
+ENABLED = os.environ.get("APP_LIVE_STATUS", "on").strip().lower() not in ("0", "off", "false", "no")
+USER_AGENT = "Mozilla/5.0 (compatible; ski-guide-live-status)"
+FIELDS = ("open_slopes", "total_slopes", "night", "snow_cm", "condition")
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResortStatus:
+    resort: str
+    open_slopes: Optional[int] = None
+    total_slopes: Optional[int] = None
+    night: Optional[bool] = None
+    snow_cm: Optional[float] = None
+    condition: str = ""
+    fetched_at: float = 0.0
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (now or time.time()) - self.fetched_at
+
+
+@dataclass(frozen=True)
+class Source:
+    resort: str
+    url: str
+    format: str                 # json / html
+    fields: Dict[str, str]      # FIELDS → 키 경로(json) 또는 정규식(html)
+
+
+def load_sources(path: Path = SOURCES_PATH, base: Optional[str] = None) -> Dict[str, Any]:
+    """Config dict with ``sources`` resolved to ``Source`` objects (``{base}`` URLs skipped when unset)."""
+    with open(path, encoding="utf-8") as f:
+        cfg = json.load(f)
+    base = (base if base is not None else os.environ.get("APP_LIVE_STATUS_BASE") or cfg.get("base_url", "")).rstrip("/")
+    sources = []
+    for resort, s in cfg.get("sources", {}).items():
+        url = s.get("url") or ""
+        if "{base}" in url:
+            if not base:
+                continue
+            url = url.replace("{base}", base)
+        if url:
+            sources.append(Source(resort, url, s.get("format", "json"), dict(s.get("fields", {}))))
+    cfg["sources"] = sources
+    return cfg
+
+
+# =========================
+# Parsing
+# =========================
+def _dig(data: Any, path: str) -> Any:
+    for key in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+def _coerce(name: str, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        if name in ("open_slopes", "total_slopes"):
+            return int(float(value))
+        if name == "snow_cm":
+            return float(value)
+        if name == "night":
+            if isinstance(value, str):
+                return value.strip().lower() in ("1", "true", "yes", "y", "on", "open", "운영")
+            return bool(value)
+    except (TypeError, ValueError, OverflowError):  # 1e999 → inf → int() 불가
+        return None
+    return str(value).strip()
+
+
+def parse(source: Source, body: bytes, fetched_at: float) -> ResortStatus:
+    values: Dict[str, Any] = {}
+    if source.format == "json":
+        data = json.loads(body)
+        for name, path in source.fields.items():
+            values[name] = _coerce(name, _dig(data, path))
+    else:
+        text = body.decode("utf-8", errors="replace")
+        for name, pattern in source.fields.items():
+            m = re.search(pattern, text)
+            values[name] = _coerce(name, m.group(1) if m else None)
+    values["condition"] = values.get("condition") or ""
+    return ResortStatus(source.resort, fetched_at=fetched_at, **{k: v for k, v in values.items() if k in FIELDS})
+
+
+# =========================
+# Poller
+# =========================
+class LiveStatus:
+    def __init__(
+        self,
+        sources: List[Source],
+        refresh_seconds: float = 300.0,
+        ttl_seconds: float = 900.0,
+        timeout: float = 4.0,
+        per_host: int = 2,
+    ):
+        self.sources = sources
+        self.refresh_seconds = refresh_seconds
+        self.ttl_seconds = ttl_seconds
+        self.per_host = per_host
+        self._http = urllib3.PoolManager(
+            num_pools=16,
+            maxsize=per_host,
+            headers={"User-Agent": USER_AGENT, "Accept": "application/json, text/html;q=0.9"},
+            timeout=urllib3.Timeout(connect=timeout / 2, read=timeout),
+            retries=urllib3.Retry(total=1, redirect=3, raise_on_status=False),
+        )
+        self._cache: Dict[str, ResortStatus] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._started = False
+        self.polls = 0
+
+    @classmethod
+    def from_config(cls, path: Path = SOURCES_PATH, base: Optional[str] = None) -> "LiveStatus":
+        cfg = load_sources(path, base)
+        return cls(cfg["sources"], cfg.get("refresh_seconds", 300), cfg.get("ttl_seconds", 900))
+
+    # ---------- network ----------
+    def _fetch(self, source: Source) -> ResortStatus:
+        resp = self._http.request("GET", source.url)
+        if resp.status >= 400:
+            raise OSError(f"HTTP {resp.status}")
+        return parse(source, resp.data, time.time())
+
+    async def _poll_one(self, source: Source, hosts: Dict[str, asyncio.Semaphore]) -> None:
+        host = hosts.setdefault(urllib3.util.parse_url(source.url).host or "", asyncio.Semaphore(self.per_host))
+        async with host:
+            try:
+                status = await asyncio.to_thread(self._fetch, source)
+            except Exception as e:  # 네트워크·파싱·설정(정규식) 오류 모두 소스별로 기록
+                with self._lock:
+                    self._errors[source.resort] = f"{type(e).__name__}: {e}"
+                return
+        with self._lock:
+            self._cache[source.resort] = status
+            self._errors.pop(source.resort, None)
+
+    async def poll_once(self) -> None:
+        hosts: Dict[str, asyncio.Semaphore] = {}
+        await asyncio.gather(*(self._poll_one(s, hosts) for s in self.sources))
+        self.polls += 1
+
+    async def _run(self) -> None:
+        while True:
+            t0 = time.monotonic()
+            try:
+                await self.poll_once()
+            except Exception:
+                _log.exception("live status poll failed; retrying in %gs", self.refresh_seconds)
+            await asyncio.sleep(max(1.0, self.refresh_seconds - (time.monotonic() - t0)))
+
+    def start(self) -> "LiveStatus":
+        """Start the background poller once per process (no-op without sources or when disabled)."""
+        with self._lock:
+            if self._started or not ENABLED or not self.sources:
+                return self
+            self._started = True
+        threading.Thread(target=asyncio.run, args=(self._run(),), name="live-status", daemon=True).start()
+        return self
+
+    # ---------- page API (캐시만 읽음) ----------
+    def get(self, resort: str) -> Optional[ResortStatus]:
+        s = self._cache.get(resort)
+        return s if s is not None and s.age() < self.ttl_seconds else None
+
+    def errors(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(self._errors)
+
+
+def describe(s: ResortStatus) -> List[str]:
+    """Badge texts for a status (only fields the source provided)."""
+    out = []
+    if s.open_slopes is not None:
+        total = f"/{s.total_slopes}" if s.total_slopes else ""
+        out.append(f"{'🟢' if s.open_slopes else '⛔'} 운영 슬로프 {s.open_slopes}{total}면")
+    if s.night is not None:
+        out.append("🌙 야간 운영" if s.night else "🌙 야간 휴장")
+    if s.snow_cm is not None or s.condition:
+        snow = f"{s.snow_cm:g}cm" if s.snow_cm is not None else ""
+        out.append(f"❄️ {' '.join(x for x in (snow, s.condition) if x)}")
+    minutes = int(s.age() // 60)
+    out.append(f"🕒 {minutes}분 전 갱신" if minutes else "🕒 방금 갱신")
+    return out
+
+
+# =========================
+# Stand-in server / CLI
+# =========================
+def stand_in_server(port: int = 0, seed: int = 0):
+    """Local server answering every ``/<slug>.json`` with synthetic status (for dev and tests)."""
+    import random
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    rng = random.Random(seed)
+
+    class StandIn(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/down"):
+                self.send_error(503)
+                return
+            if self.path.startswith("/overflow"):
+                body = b'{"slopes": {"open": 1e999}}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+            total = rng.randint(8, 28)
+            body = json.dumps({
+                "slopes": {"open": rng.randint(0, total), "total": total},
+                "night": {"open": rng.random() < 0.6},
+                "snow": {"base_cm": round(rng.uniform(20, 120), 1), "condition": rng.choice(["습설", "건설", "강설", "아이스"])},
+            }, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", port), StandIn)
+
+
+def _self_test() -> int:
+    server = stand_in_server()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    live = LiveStatus.from_config(base=base)
+    live.sources.append(Source("down", f"{base}/down", "json", {}))
+    live.sources.append(Source("html", f"{base}/konjiam.json", "html", {"open_slopes": r'"open": (\d+)'}))
+    live.sources.append(Source("overflow", f"{base}/overflow", "json", {"open_slopes": "slopes.open"}))
+    live.sources.append(Source("bad-regex", f"{base}/konjiam.json", "html", {"open_slopes": r"(\d+"}))
+    t0 = time.perf_counter()
+    asyncio.run(live.poll_once())
+    elapsed = time.perf_counter() - t0
+    server.shutdown()
+
+    failures = []
+    for s in live.sources[:-4]:
+        st = live.get(s.resort)
+        if st is None or st.open_slopes is None or st.night is None or st.snow_cm is None:
+            failures.append(f"{s.resort}: {st}")
+    if live.get("down") is not None or "down" not in live.errors():
+        failures.append("down: 실패가 기록되지 않음")
+    if live.get("html") is None or live.get("html").open_slopes is None:
+        failures.append("html: 정규식 필드 파싱 실패")
+    if live.get("overflow") is None or live.get("overflow").open_slopes is not None:
+        failures.append("overflow: 1e999 값이 None으로 처리되지 않음")
+    if "bad-regex" not in live.errors():
+        failures.append("bad-regex: 잘못된 정규식이 기록되지 않음")
+    for line in failures:
+        print(f"❌ {line}")
+    print(f"{len(live.sources)}개 소스 · {elapsed * 1000:.0f}ms · {'통과' if not failures else '실패'}")
+    return 1 if failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="리조트 실시간 현황 폴러")
+    parser.add_argument("--stand-in", action="store_true", help="로컬 대역 서버 실행")
+    parser.add_argument("--port", type=int, default=8790)
+    parser.add_argument("--once", action="store_true", help="한 번 폴링하고 결과 출력")
+    parser.add_argument("--self-test", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.self_test:
+        return _self_test()
+    if args.stand_in:
+        print(f"대역 서버: http://127.0.0.1:{args.port} (APP_LIVE_STATUS_BASE로 지정)", file=sys.stderr)
+        stand_in_server(args.port).serve_forever()
+        return 0
+
+    live = LiveStatus.from_config()
+    if not live.sources:
+        print("활성 소스 없음: APP_LIVE_STATUS_BASE 또는 data/live_sources.json의 url을 설정하세요.", file=sys.stderr)
+        return 1
+    asyncio.run(live.poll_once())
+    for s in live.sources:
+        st = live.get(s.resort)
+        print(f"{s.resort}: {' · '.join(describe(st)) if st else live.errors().get(s.resort, '—')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
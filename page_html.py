@@ -0,0 +1,203 @@
+import html
+import textwrap
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+from theme import badge, badges
+
+# =============================
+# Page HTML (Streamlit 페이지 · 정적 내보내기 공용)
+# - 페이지 스크립트는 import하는 순간 실행되므로, 순수 HTML 조립 함수만 여기로 모음
+# - main.py / pages/01_ski.py 와 static_export.py 가 같은 마크업을 씀 → 둘이 어긋나지 않음
+# =============================
+
+
+# =============================
+# Shoulder
+# =============================
+SHOULDER_HERO = """
+<div class="hero">
+  <h1 class="hero-title">🌈 어깨 통증 이학적 검사 & 운동 가이드 🦴✨</h1>
+  <div class="hero-sub">
+    🎓 교육용 요약 도구예요. <b>증상 선택 👉 검사 방법/양성 소견 👉 기본 운동(그림)</b>을 한 번에 보여줘요.<br/>
+    ⚠️ 진단 확정은 병력·ROM·촉진·신경학적 검사 및 필요 시 영상검사를 함께 고려해야 해요.
+  </div>
+</div>
+"""
+
+# 진료가 먼저인 경우(안내 목록)
+RED_FLAGS = (
+    "🧨 외상 후 변형/탈구 의심, 팔을 거의 못 움직일 정도의 급성 통증",
+    "🌡️ 발열/오한/전신 증상 + 어깨 통증(감염 가능성)",
+    "🧠 진행성 근력저하/감각저하, 손이 차갑거나 색 변화",
+    "🧬 암 병력/원인불명 체중감소/야간에 점점 심해지는 통증",
+)
+
+def wrap(s: str) -> str:
+    return "\n".join(textwrap.wrap(s, width=88))
+
+def svg_card(svg: str) -> str:
+    return f"<div class='svgwrap'>{svg}</div>"
+
+def vote_badge(votes: Optional[Dict[str, int]], key: str) -> str:
+    # 여러 증상 선택 시: 이 항목을 추천한 증상 수
+    if not votes:
+        return ""
+    return " " + badge(f"🔁 {votes[key]}개 증상")
+
+def render_tests_section(pack, keys: List[str], votes: Optional[Dict[str, int]] = None) -> str:
+    items = []
+    for key in keys:
+        t = pack.tests[key]
+        body = [
+            f"<div><b>🧭 방법:</b> {html.escape(wrap(t.how))}</div>",
+            f"<div><b>✅ 양성:</b> {html.escape(wrap(t.positive))}</div>",
+        ]
+        if t.caution:
+            body.append(f"<div><b>⚠️ 주의:</b> {html.escape(wrap(t.caution))}</div>")
+        items.append(
+            f"<details class='test-item'><summary>{html.escape(t.name)}  |  🎯 {html.escape(t.target)}{vote_badge(votes, key)}</summary>"
+            f"<div class='test-body'>{''.join(body)}</div></details>"
+        )
+    return (
+        "<div class='card'>"
+        "<div class='section-title grad-text'>🧪 3) 이학적 검사(방법 &amp; 양성 소견)</div>"
+        "<div class='note'>💡 한 번에 여러 검사가 ‘같이’ 양성이 나올 수 있어요. 통증이 심하면 범위를 줄여요.</div>"
+        "<div class='hr'></div>"
+        f"{''.join(items)}"
+        "</div>"
+    )
+
+def render_exercises_section(pack, keys: List[str], votes: Optional[Dict[str, int]] = None) -> str:
+    rows = []
+    for key in keys:
+        ex = pack.exercises[key]
+        steps = "".join([f"<li>{html.escape(s)}</li>" for s in ex.steps])
+        cautions = f"<div><b>⚠️ 주의:</b> {html.escape(ex.cautions)}</div>" if ex.cautions else ""
+        rows.append(
+            "<div class='ex-row'>"
+            "<div class='ex-text'>"
+            f"<h3>{html.escape(ex.name)} 🌟{vote_badge(votes, key)}</h3>"
+            f"<div><b>🎯 목적:</b> {html.escape(ex.goal)}</div>"
+            f"<div><b>🪄 방법:</b></div><ul>{steps}</ul>"
+            f"<div><b>📌 권장량:</b> {html.escape(ex.dosage)}</div>"
+            f"{cautions}"
+            "</div>"
+            f"<div class='ex-figure'>{svg_card(ex.svg)}</div>"
+            "</div>"
+            "<div class='hr'></div>"
+        )
+    return (
+        "<div class='card'>"
+        "<div class='section-title grad-text'>🏋️ 4) 운동(간단 그림 포함)</div>"
+        "<div class='note'>✨ 원칙: <b>통증 범위 내</b> + <b>다음 날 통증이 확 증가하면</b> 강도/횟수를 줄이세요.</div>"
+        "<div class='hr'></div>"
+        f"{''.join(rows)}"
+        "</div>"
+    )
+
+# 요약 카드 체크(외상, 발열, 신경 증상) → 체크한 항목의 안내 문구
+RED_FLAG_CHECKS = (
+    "🧨 최근 외상(넘어짐/부딪힘/무거운 물건) 있었어요",
+    "🌡️ 발열/오한/전신 컨디션 저하가 있어요",
+    "⚡ 손 저림/감각저하/힘 빠짐이 진행 중이에요",
+)
+RED_FLAG_ALERTS = (
+    "🧨 외상 후라면 골절/탈구/파열 평가가 필요할 수 있어요.",
+    "🌡️ 발열 동반 시 감염성 원인 배제가 우선이에요.",
+    "⚡ 진행성 저림/근력저하는 신경학적 평가를 권장해요.",
+)
+
+def red_flag_alerts(flags: Sequence[bool]) -> List[str]:
+    """Alert lines for the (trauma, fever, neuro) checkboxes."""
+    return [alert for alert, on in zip(RED_FLAG_ALERTS, flags) if on]
+
+
+# =============================
+# Ski
+# =============================
+ORIGIN_DEFAULT = "서울 성동구 옥수동"
+NAME_EMOJI = (" 🏂", " 🎿", " ❄️", " 🌙", " 🌲", " 🏔️", " 🐦")
+
+def fmt_range(r: Optional[Tuple[int,int]]) -> str:
+    if not r:
+        return "—"
+    a,b = r
+    return f"{a}–{b}분" if a != b else f"{a}분"
+
+def naver_search_link(query: str) -> str:
+    return f"https://map.naver.com/p/search/{quote(query)}"
+
+def naver_directions_hint(origin: str, destination: str) -> str:
+    # 네이버지도는 검색 후 '길찾기'로 연결하는 UX가 가장 안정적
+    return naver_search_link(destination)
+
+def plain_name(name: str) -> str:
+    for e in NAME_EMOJI:
+        name = name.replace(e, "")
+    return name
+
+def fmt_minutes(minutes: int) -> str:
+    h, m = divmod(minutes, 60)
+    if not h:
+        return f"{m}분"
+    return f"{h}시간" if not m else f"{h}시간 {m}분"
+
+def ski_hero(origins: Sequence[str], max_minutes: int = 180, default: bool = False) -> str:
+    """Page hero for the resolved ``origins`` (several in group mode) and the time limit."""
+    if len(origins) > 1:
+        place = f"👥 {len(origins)}곳"
+    else:
+        # "서울 성동구 옥수동" → "옥수동" (좌표 입력은 그대로)
+        place = origins[0] if "," in origins[0] else origins[0].split()[-1]
+    names = " · ".join(html.escape(o) for o in origins)
+    return f"""
+<div class="hero">
+  <h1>⛷️ {html.escape(place)} → {fmt_minutes(max_minutes)} 이내 스키장 ❄️ + 난이도/슬로프맵</h1>
+  <p>
+    📍 출발지: <b>{names}</b>{" (기본)" if default else ""} · ⏱️ 소요시간은 교통/날씨/시간대에 따라 변동됩니다.<br/>
+    🗺️ 슬로프맵은 ‘공식 페이지/공식 PDF’를 우선 연결하며, 가능하면 이미지 프리뷰도 제공합니다.
+  </p>
+</div>
+"""
+
+def resort_card(r, rng: Optional[Tuple[int, int]], bucket: str, links, origin: str,
+                fit: Sequence[str] = (), live: Sequence[str] = (), route: str = "") -> str:
+    """Result card for resort ``r``; ``links`` is a ``LinkHealth`` (broken official links → Naver search).
+
+    Catalog text is escaped with ``html.escape`` and URLs with ``html.escape(..., quote=True)``.
+    """
+    esc = html.escape
+    mins = fmt_range(rng)
+    # 공식 링크가 응답하지 않는 것으로 확인되면 네이버지도 검색으로 대체, PDF는 숨김(점검 전이면 그대로 표시)
+    page_ok = links.usable(r.slope_map_page)
+    map_link = r.slope_map_page if page_ok else naver_search_link(r.name)
+    map_label = "슬로프맵/슬로프 안내(공식 링크)" if page_ok else "슬로프맵 찾기(네이버 검색)"
+    map_flag = " <span class='small'>⚠️ 공식 링크 응답 없음</span>" if r.slope_map_page and not page_ok else ""
+    pdf_ok = links.usable(r.slope_map_pdf)
+    live_row = f'<div style="margin-top:6px;">{badges([esc(x) for x in live])}</div>' if live else ""
+    route_row = f"<div class='small' style='margin-top:6px;'>🚄 {esc(route)}</div>" if route else ""
+    nav_link = naver_directions_hint(origin, plain_name(r.name))
+    tags = [f"📍 {r.region}", f"🎯 {bucket}"] + list(fit) + [f"✨ {h}" for h in r.highlights]
+    return f"""
+    <div style="border:1px solid rgba(15,23,42,0.10); border-radius:16px; padding:14px; background:rgba(255,255,255,0.97);
+                box-shadow: 0 10px 26px rgba(2,6,23,0.06); margin-bottom:12px;">
+      <div style="font-weight:900; font-size:16px;">
+        {esc(r.name)} <span style="font-weight:900; color:#0B63F6;">⏱️ {mins}</span>
+      </div>
+      <div style="margin-top:6px;">
+        {badges([esc(x) for x in tags])}
+      </div>
+      {live_row}
+      {route_row}
+      <div style="margin-top:8px; color: rgba(16,24,40,0.72); font-size:13px; line-height:1.5;">
+        📝 {esc(r.note) if r.note else "—"}
+      </div>
+      <div style="margin-top:10px; font-size:13px;">
+        🗺️ <a href="{esc(nav_link, quote=True)}" target="_blank" style="font-weight:900; color:#0B63F6; text-decoration:none;">네이버지도에서 검색/길찾기</a>
+        &nbsp;|&nbsp;
+        🧭 <a href="{esc(map_link, quote=True)}" target="_blank" style="font-weight:900; color:#7C3AED; text-decoration:none;">{map_label}</a>{map_flag}
+        {f"&nbsp;|&nbsp;📄 <a href='{esc(r.slope_map_pdf, quote=True)}' target='_blank' style='font-weight:900; color:#0B63F6; text-decoration:none;'>슬로프맵 PDF</a>" if pdf_ok else ""}
+      </div>
+    </div>
+    """
@@ -1,8 +1,15 @@
 import streamlit as st
 
+from static_assets import ASSETS_DIR, build_image_variants, picture_html
+
 # 1. 페이지 설정
 st.set_page_config(page_title="자기소개 페이지", page_icon="😊")
 
+# 이미지 변형본(폭별 WebP/JPEG)은 프로세스당 한 번만 생성
+@st.cache_resource(show_spinner=False)
+def avatar_variants():
+    return build_image_variants(ASSETS_DIR / "avatar.jpg")
+
 # 2. 제목 부분
 st.title("👋 안녕하세요! 저를 소개합니다")
 
@@ -11,9 +18,9 @@ col1, col2 = st.columns([1, 2])
 
 with col1:
     # 본인의 사진이나 캐릭터 이미지를 넣으세요.
-    st.image("data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxMTEhUSExMWFRUVFxgbFxcVGBcYFxUdGBYXGhcdFxcZHSggGBolGxYXITEhJSkrLi4uFx8zODMtNygtLisBCgoKDg0OGxAQGy0lICUtLS0tLS0vLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLS0tLf/AABEIAQ0AvAMBEQACEQEDEQH/xAAcAAABBAMBAAAAAAAAAAAAAAAABAUGBwECAwj/xABBEAABAwIDBAcFBgUDBAMAAAABAAIDBBEFEiEGMUFRBxMiYXGBkTKhscHwFCNCUnLRFTNiouEIkvEkQ7LCU1SC/8QAGgEBAAIDAQAAAAAAAAAAAAAAAAEDAgQFBv/EADMRAAICAQMCBQIFBAIDAQAAAAABAgMRBBIhBTETIkFRYXGRFCMygaGxwdHwM1JT4fEk/9oADAMBAAIRAxEAPwC8UAIAQAgBACAEAIAQAgBAAQAgBACAEAIAQAgBACAEAIAQAgBACAEAIDCAEAIAQBdAYY64uoTyS1g4Rv8AvCCfDX4BYp+Ysa8iaFCzKgQAgMoAQAgBACAEAIAQAgBACAEBhACAFGQYumRgLpkYMqcgCgGTA8Ta+SWG/ajd5kHj8R5Kiqay4m/q6Goxs90Jseruqma7wB4AfQWFksSLtJV4lLTH+nmDmhw4hbEZJo5s4OEmmcnVTesDL62+P/Cx3ebBmqn4e4VKwpBAZQAgBACAEAIAQAgBACAEBhAYJUNhISOqwRoq9xsKlp8iZ9WsNxaqQbWd6biXSK4am6zUjXnXg6zSgNJ5AlZOXBhGLckipIcbMGIOdclpdrc+C56sxM9RPTqyjb8Dv0g1d2B4PEeXJWXSzya+gqcU4jhsTjueENLrlvPv3XWVVnGCjW6Xz7kjXEsZDJASdzr3J793csZT5LqtNmGPdE0iqARfmttSODKto7ArNMrMqQZQAgBACAEAIAQAgBAYQAgE1TLZVSZdXHJEpsWDMwuNH2JO76+dlrb8HaWn3YfwN9djYABB3rBzL4UY7iEbUtDbX11CjeZvTJvI97NY82VoFwDqFZXM1NVpcZaH2sq7Nf3Mv+6slLhmlVVmUfqUvVNLnSO5uuOPE28OK5NlmJnqoR8orxDFTLE1hOoAB8QVsuflyURrxI54HXuheRrry5g8OawhZxkztrTNcTr3SOdwHEX58uaSs5wRCCRZmy+K9ZTxuO/KAfEafJbtc8xRxNVp8WMk1NU3V6kcyyvAsBVqZrNGVIMoAQAgBACAEAIAQGEBq8rGTJSGmulVMmb1MCpsUrnsnnaTqXHmBqO9aE57c5PR1wThHA0dZIWhmtuCpdywXqHOQgoi423Gx9yonft5MsIVRPdA5rm3G4lZ035E61JE2xPGLwtfwe1wNvDT3rflPg5tWnSm17MiuDwBzTpqbm/muBrLXGfc6M5bcDbXU5bIQOa26bVKssWGsi6TDDYuBuWi+mmu825Wv7lrR1SjJJ+pg5p8MTwUJcARqdb3HcrJ34fJLaRIdmarJni3BrgQO4gLoaSzdXk1dRWpckzoKtb0ZHIupwSClmur4s5dkMCpWooBSDKAEAIAQAgBACAwgOFS+wVcmW1rLI/iEy15M6lECu8aoc9S51xY5T33tb00965Gst8N/U7tLxXgW/wyzhp6LhfintaMfG4Or6HLJoOHyWPjOUMMxVu6JxqcPuCLXsPjy5rOGow8mcbRpkmIhMJvma67fBd+FylXktUPNuQ7bP05yX4cfkuDrrE5lOpks4N8Vw6zgbeP16LHTajhpkU3ZWBbDQ5mXI4jN81Q7cS47FUrcSwjjh1DwI57+N/8LO+7L4M7bfYS4nAYpGu4EZT8rrpdJvy5Qf1MqpKaHbC6vcu/CRTfXlEtw6dbMWcS+A9MOi2InOawzZZEGUAIAQAgBACAwUAKGBvrpFTJm1TEi+JzLWmztaeBF4xmqm66FpFvDVcfqn/Fk6EuK2SuSnGn1deWkmng5qmbyUgc4G31/wAq2MW1wYRsaWANFqRbeosqlF4/3BPjcZI5W4RaUuOh0tpcb+I5Lcr1LjDazoV6jMMDrhtKd+654AW9OC1nmbya11i7DlUYeDw+vkrLKJLlGrC9o7x0FhbuVkNHJrn2K5X85E5pS23dby5BVTqlHGf9+C1WJjRthTfcuP5S0+/VXaJOrV4ZtaGeZpe4zYXLuXqYs6FkeCZ4VLuW1BnD1MSTUztFtRZx7FydlYVmUAIAQAgBACAwUBgqGENGIu3rXkb9CIlir961Zs7unXAx4drUsHcfNczX4dePk2LuKmWEaa4BPJcqej3pSfsef8TDZuyntZXV6RRaZi7Mm74r2Vl9G7Bip4yJaqkvr5futC7TtcxL67ccHaGmAtotqjT/AByVysbFLorrelTu7FKlg3ZHZWV0bUYuWTEkFxbvUWabMMY9SY2YeRuxnDetic3mCudfp5Rasj3RtabUeHNMrzCgQS072kg+RXZqnuSZ6azDjlepMsJ4LdgcTUkqozotqBxLe4qVxSZQAgBACAEAIDCAwVDCGuviJVEkb1M0iL4lRnUrVnE7OnuXYjOz8n/XsHDUeo/4XN1XOM+6N7Vr/wDNJlsth0W6tOtmDyLnyahirVXBO4DGkqgpGskarspyiYyMxx6LKqjyiUuTqI1txpyV7jo2NXxpRi5GsrmtHaICxusopX5jSJipS7IQy4nANC5c6zXaOaxz9jZjprvYgeNYfknM8JD2Pd2mt0LSe7l3rXpnXB4i8o9FpNQ5VeHZw0iRYEwSND2G4+HjyXWq5WUc3WScJbZEnpmWC24o41kss7q0rMoAQAgBACAEAIDCA0fGCsXHJkpNDPtDG1kL3nSwK17o4ib+hnKdqiQrZnDo43ieZ1nO7TWjeL7r+S8/fdFS5ydvWXTnF11rj1LFpqxjxo4FdTT66mzjceaspnB8oUhoXQUI+hVlgWKJVIbjXq1W6ck7jZrFZCrCIbNjYKx7YrL4I5Yw41tHHECAblcPVdVcns0/3/wdHS9Pna8sr/Ftq3vJsbLQjpHN7rHlnoqOnwghhfjLz+JbcdPBehuqmtHekxp7SNf3USoXoYz00JIk2yeMZalpaezKcr28L20cO/RX6OyUJ7Wc3X6Xfp2n3jyn/Ys9d08kCAygBACAEAIAQAgBACAju3jCaRwHFzfitTWf8Z0+kvGoX0ZWG0mL5ZWtB3ALhRq8RNnpdPWlDnuzthG0bmEEH68FrzoceUV36eM1iSJ/gu0TZQNcruXjyWVWosrflZw9ToXDnuh7FaVtrqtieGaPgoz9sKPqtvoPBRzmxPKLkgBYPrFvsZQ0254RD8f2w0IabC2h4n9lrWW36riT49js6Xpii8y7kCqq+SZ+Rgc97vwtFz/hbtGmxwkdiUqtPDMngd6Lo4rpRme6OK/4T2iPHLpfzXSjpX6nHv61HOILIw7WbJ1tABK/JJCTYvbcZCdBmB3AmwupnpkkY0dVlOWHgbKSckAhajR3a5uSyP2B1JDswOo3eIVM+GmjK2KnHDLywmp6yGOT8zQSu5VLdBM8JqavCtlD2YrVhQCAEAIAQAgBACAEAIBk2yhzUkoHAX9Fr6pZrZ0Oly26mJQm2DO2H6i7WnQ937rlabs0envj+XnPZsdcJ2SmdRxz9YRI8Zg0jTKfZHO9uPeuhLSxkuDhw6tOE9s+V/JxocSkhflkBa4fVxz8lydTo2vQ7FV1d8cxeSb4btPcWcb8jx8+a5sq32ZrW6JN5iPv8XAYXkggcvh4rBOXY0vwrclEheO7QmQ8hwbfd3lbNdLZ2dPpFWseo3YHhE9fJZl2xg2dIdw5hvN3uC62n0mfoVazqENMtseZFu7N7NQUjMsTNT7Tzq95/qK6sK4xWEeVv1Fl0szY9qwoE2JULJ4nwyDMyRpa4HiCLKGiU8PKPN1TQupamaldr1TyATxba7D5tIXMvhiR6/pt3iVDthbrH4rStOpNZiXDsJUZqbL/APG4t8t49xXV0M91Z4/q8Majd7pMka3DlggBACAEAIAQAgBACAR4vHmhkHNp+CruWYMv0stt0X8lCbS0uYQtP4iW9+r7fNcTTr8xpHtLpLZN+3P8Fz/YW5GsAsGtAA7gLLvHhWRrHtjxICbX+I8CsZRUlhllVs6pboPBWdbTzUrsr75b7/3HBc2/R+qPRaTqULfLLh/wdhjxLLLn/hFuydSLjnJywKnNZUiK9mgFz3C+4EAtaeZvv4LoUUJvDNDXa91Qez6Z9i18C2ow6NzaWOeNuWzWgXycrB+4nzXRTiuDzM42S87TJwFmUmVIBAUh0v0gZiLHj/uwgnxa4j4WWlql2Z6Hok+JRGWidoNdFzLFyel9C1Oj+azpGfmYx3mNCtrps+XE8v1iGYRl7Nr+5NV1jgggBACAEAIAQAgBACAR4s60Lz/SVVc8QZfplm2K+Skcdtlgkv7MwJ00AEgP7rjUPFuT2N0XKu2K/wCv9i3ut1XdPEG9dVFkMj2i7msc4DmQ0kKG8IRWXg8uYpiUr637x73EvGZwN3EHeW8Lb7DcqISzXvbOhbBK7wVHj+fqTNmzIkAIc5ocxjiNB7bA4+G9crWavwrcJLtk6mjjN1YlJ+qFzqL7O3JFpmhkZpv1s4nxs0+qx0OolOybfdoy1lUXUvaLWfoVrSSTCqALb2f7DhdlhwI3Ftl1X4aq3I5qd8tTsfbP7YPU+wk8j6CndL7RjHmLnIf9tlfW8xTOdclGxpe4/KwrNXuAFyoBQfSfj7Kqub1XaZA0szDc8l13W5gaC/itLUTT4R6LpVMq+ZLuIKQ7h7j3rnSPSrsWNsbNaWB27MHMPpp8FGjntvXycDqUN1U17YZY69AeXBACAEAIAQAgBAavdYXUN4JSy8HCSsY0Xc4NHeVW7Uu5ZGmcuIrIlqqyKWKRrJGuOU3AIJGnJYWWRnBpMurpsqti5xa5KfxaK9MQbWDyuDFtTPaVv8/6oe9mtrWOYyOZ4bI0Bt3GwktoDc6X5hd2m+Mlh9zy/UOl20zcoLMfj0+pM4MQZbVzbd5Flecra/YgGM0mG9Zmpx10h0DGEdU3XW7wCQB+UHhbRc3UWUVLPf49DtaavVTWJcL3a5x8CzDYTludSdT4n68l5m+12WOTOk0oJRj2RyxeizDvG4jSxHHuKsotcJZRnXPjDGSkNPE/NVUznNFtYycp/VHutrwNtdy7tOppm8yXJrXaO5xxRPj2f9mTun6TKBrQMzwANB1btABwXR/EV+5yX0vU57fyhJW9LcAB6qGR5tpmLWDzOpHosXqorsi2vo9r/VJL+SEbR7eVVWCwu6qM72RkjMDwc7e4d2i17NRKXC4OppumUVPL8z+e32IvGztXsqG+DpVx8+RzpX6jx5KuRtRJ7s6+0bDf2JWn1K1U8WJnJ1azNr3i0WrmFr8F6XcsZPH4ecEE2h2tdqWP6uMGwcBdz+ZHILk3ayc5Ygei0fTILia3S9vRDHR9I4hcQ575u53ysFFV98ee/wBS6/ptNnHEX8E22f2whqQL3jcdwduPgStynWwk9s+H/BydV0yynmPmXx/gka3TmAgBACAadosbjpmXee07RrRqSfkFr6m+NUee5uaLR2aieI9l3ZV20G0LT2zJndc/d3sNO4Ljudlr54R6vT0KvyJY+fU44DjgmeWWEUoF2Fugdza4cVg4yr8yZFsFH1bXqn/VGcSjP2aS4sc9/BVp+dMtrkncsexDQy622yycpRF1FhOffqN/ctazUbexQ5yz3JPh9KyMaW3Lm2zlNlbyx2jq2j0VKgyp1tieoxEZTr/lXRqbLI0vI01GKt3HX671tQoZtR07GioqYXnSLPw7IJP9q266rPRsmTrr/XNIbagQtJBD4id2Zpt/ctjZau6yUrUaZvEZoSTQ5e8fmG4qVLJnKOPp7m8bbKGX1rAoiJuDwvdYssXcm+zz/u5G77gHwIstKzhmhql54slcmLTTQ5GEMYBZ73G3DcFtS1M3DYuxyVpaqbd75foiv9q8QaT1bLgNAAHM+v1dYVR9Tt6aLrg7Jd2MlD91dwDTI7e46nwbf6Ktn5lj0M1porzS7s4z47O64Djbw3a2RUw9TXdmH5UWF0WbUTmX7NUOc5r/AOWXW7BAvl568Ft6a1RlszwzmdU0Wa/GSw13x6//AAtddI82CAZdrsc+x07pQAXk5WA7i48+4C5VN9vhwyu5vdO0f4q5Qfbu/oUZtBtO+ZznOu9/5r7hyA3BcpQlOW6bPV/l6aOypdv9+4xSm4uPEFWLjhkWPct6+qF9I0Nc15cQ4WIy2046kqmTbTRsKrdhtkzNf9opZCQLi2v7rSw4zSKFV4V0cdiHU8OaTtHstFytucsR47l04uU8C+XH2M7LeCojpJS5Zg3VD9UkaHHb+yCe4AlWLRS9jF6nSrvNCukirJv5cDzfiRlHmXEK6OgfsUy6no4euR+wzYGolsZphG0/hZ2nep09y24aJLuaNvXv/FD7kwwrYGiisXMMp5ynN7tw9FsxohH0OVf1LUXfql+y4JBRMgghb7Ebco5NG66tUUjRbbeWRbaTafB5GOjmqqd3g4OI/wBtzdMIJ4PP7MZjbMWR5jEXEDN7jbgte6jKyu51en9QdUlXL9LH+Nul76W38wuez1kOVkzc3BtohPLZLdkqoB4B1B0tzWtavU1dbDMMoX7WV1mshbo0C5txuFjWs8lOgqy3ZLuQCaqvPvvZvzC3FHyGz4q/E7fZHSFwJudbc/esWXx8zyzSplyHR2/kpjHd6FN09j7nFtZJvDjcbjexCy2RKPGk0ejdj8RdUUVPM+xe+MF1ue4/BdWp5gmeQ1darulFdsjwrDWKP6TcdM1Q9tyGQFzGC+9wNnHzI9AuTfN2WY9Fwe06dp46bSb33ks/4RAY5L6EWPDvRrHKIhNS4kuRNNUkHqwL33dxPNWRgmtzNazUOMvCiu/8C58z22u2+mpCp2xfqb8rbYYzHPyPuy9W4smj1uWk34C2uq1tRDEoyEZ79rl3TGmtJawAaXBJV8Em8mdsnGDx6jBhmOxxEuczOb6Dh6rqxhhHi7bt8m2S/BOk2Bhd1lKWiwy5C1xJ1ve4FuHPcs8FW4UTdNcgNoqRgHDO8k+YAFkwRkiePdIddUPLmzyQMP8A24Xua0c9Qb6nhdSMjC/Gak76iY+Mjz80IOVXiM0v8yWSS353udu3bygEyAAUBNsCqc8Q5hcq+G2Z7bpd/i0r3FpdwVRvD9svJllGu75qm1ZRVes1tDjthhMjoDVxu7DHZHt5bsrhffvsQs9PDybn6HPhqHCaq5Tazn/JX4gF82Ylx9y2dzxj0MlTHdvTbkLGuygNt2uXEnibqvvybin4cVBLn+pieiFgXG54gbginjsYW6ZNbpvn+DmHAC3AfW9Th5yVpqK2l39FGJg4expDuw97dGkg63GtuTlvaeWIYPPdTqzfuT7pE6W0ckpvpd2Pexzq2EZo3EmZu8scfxD+k8eXmtO2lJ7kd3R66VkFTJ9u30KpkkJFgDfw3eaqSXdm1OcmtsU8naCENGoueawlJvsX1VKC5XJ2IvpchY9i7G7jI8bNQBr3ak3Y/ffXTdotfUTyl9SyuqNa4eXkQ4289W4/lj08gdVdTzJL5LNZxROS9n/QgNl1zwhmyEhZAFkBhCAQAgBASDZafUt+vrRaerj2Z6DoduG4EhkK0keil3HTAO1KGNGriA0X3lVzi2sLuYzmlBt9kPu1FYW/9OHDQkusezfd8jqq4xceGU6SCa8XHft9CIttfvV7ybkVHPbkHniOChEz4WUIZ8SAuL6ngFdGpvk5t2ugvLnIk65x4b7AADUnhorNqNLxZM9K7B4H9koooXWz2zv/AFP1I8t3kt6qO2JwNXd4lra+n2JErDVNJog5pa4AtcCCDuIIsQfJGskptPKKF6Q9jH0LjLGC6nedCB/KJ/C4cG77HuXPtpcXn0PR6TXq2OH+r+pCmuuq2sG2pbnyd2t9FhkvjEcsGH3zRxId/wCJ3LXvfkLX7iHGgeqk/Qfgr6P1r6k61P8ACz+jITlXWyeJ2hlQYMZUyRgxZCMGCFJDRqhiCAEAuwabLIO/5Km+OYG90+3ZciYvA5rmHspcrgm3RRhglndMRpCLDvc8H4C/qtnTwy22cbquoca1WvXv+x26Q9nXRvNQy5Y89r+g8/0n3XVdtDi8rsXdM6jCcFTPhrt8kCeVUjpSbRt9osm3I8bEeRrnmF1fGPByrbVkm/Q/s+amtE7gOrp+0QdznEEMHke15BXUxzI0NZbsrfu+EX+t04YIAQHKpp2yMcx4Ba4EEHiCoaysGUZOLTR5+2l2EnpqkxRDPHYObI4taLHgdd47loyqaeD0FetrlHe+H7HbD9j9QZpRb8ke8+Lz8goVK9SLOovtBfcfXUUULLRxgb7kDtHxcdVjqYLwZJIopvssvi5S9SvcXN4pP0u+BVFPEkel1nOmmvhkLsuqeKCyDBiykjBghCGjm4LIrZqUMTCEAgOlO+zmnkQoksposqltmn8k4hdmY33rkyWGz3FMt9aLc6IXx/ZZA0jOJXF446gZT4ZR7it3T42nnOrKXjJvtjgk+KPaQQQCDvB3FXM5kSs9otjLkvpiBzjP/qfktadCfKOxR1OcVts5+fX/ANkHr6d8ZLZGlpH5hp5HcVRscXydFXwsj5XkaX6usBc8hxVq7GlPG49MdHmAfYqJkRIL3EyPLdxLrW9Gho8luVQ2xOLq7vFsyuy4RJVYawIAQAgI7tjgBqGZ49JmDs8nj8p+RWE45LK57XyV1TVWpa7suaSHA6EEbwVQbRvW4iwtyC7jpfLuHiVVenKuSXfBbS1GxN+5BK6P+a39Q+K063+l/Q9dJbqZL3RBmrrniUbMaSQBqTuQlcvBJcO2Rc8Xebdw/dVOz2NyGkz+ocZdjoWi7nOHn8Fj4rLPwUBFHsb1h+7z277arJXMrehT7MfKLoyv7WY+Z+SeLIlaKpdzvVdGcQHFp7nH5qPFkT+CpfYgG0WAupnWvdvPirYWbjR1OldXK7DMrDUJnhMl4wfrcuXcsSPadPnvpTLi6OcM6ujEg7L5XF9+Y3NB5iwv5raoWIZOH1S3fftXZcf5F+KVxBs8WPuPgVY2aCQkhqNFGScDbidS0ggtDvEXUZM0hHgOGsmqGRtY0ZjdxAFw0au18FMVl4Jsk0ssuVjQAANANy2DQNkAIAQAgBANOO7Pw1LCHsaH72vyjMD48R3LGUUzOE3FlZ4rRPgeY3tsRu5OHAjuWtJejNuMs8ohWJmz5CefyXPUNr2+x7Km1Ojf8DlsNsbSS0wmqGFzpC8i5IAaHlrbDyJXWXY8Ra/O8e5IKXYjDI5WyW3A9nOQL6anXx9VLw+5EJTTyiVQRYcwW+63fif+5WGIIv8AF1Mu2fsOUe0dDlbnmp9w9pzOXesvEh7orWnvfaMvswm2jw3Kfv6bhucy+/uUb6/dFi0usTyoy+zNZNo8LOn2mLycfko31e5ZHTa7vsf2EddiGFPaWirjabjtCTUa62vcLF+E/UtjDXxedj+xDcc2Pw2pOuKstwAdED6k/JI7IvO4XrVWR2yqa/ZkM2p2ApYYDLTVfWOb+Eujdm/Tlt6aq3xI+5ofhbc42v7DdgFC/K2O3acQ1oPNxsFz7mpz8p6np9cqKM2cYPRNBTiOJkY3MaGjyFlvJYWDy05OUnJ+oirmhwIcARyKhkojVZQ29h5b3HUfv71iZojVSZTII2gPc4hrbE6kmw0sowZ5wWxspsoyku8uL5XCxcbAN3XDRyvxV8YYNOyxyJGsysEAIAQAgBACAa8fwVlVHldo4ew/i0/MdyxlHcjOE3FlEbZ05glLHMGbje9tNNOBB0K5lkHv5PU6K/OlwucMjxxGQgNzkACwA0AHIAcFOPkncv8AqvsjHWE7zfx1WLL4M2CxwXKTXqdLjmoLN3yal/ipwYOx5NhL3qMGSu+Tdr1GDJWGGP70aJjY/cM2iYHiPHcfdgoRLXMB1EYLz5aN959xWxRDnJyepar8vYnyy5XSgBbh50aK6ZYsziiN4nXgXHFYFqQv6McK62Z9W8dmM5Y78XH2j5AgeatrXqUXSwsFnq41gQAgBACAEAIAQAgKu6bMGEjIZ2+2MzfHiB7ite6OcM3tHe4ZXoUpPIWGzwWnvVPhs6K1UWzLJgeKwcWi+NsWdBKsdpYrEbCVRgyVgF6YDmY65TtI8XHc0NbrYankN59Fkq2yuWqUWL6fC6uT2KeTxcMo/uWSpKZa/wBh+odh53azSCMcman1OgWaqijXnrpvhEw2SoYoC5sTbAEAk6lx3m5471Yacnnlkir6zKEbMUsjNX1lmFxWGSxIh07nvcGN7UkjgGjvJsApSMm8F57PYU2mp44G/hb2j+Zx1cfM3WylhGhKW55HFSYggBACAEAIAQAgBARDpQpy6jzDfG9rviPmqrVwXUPzFXQUMVQ3UC43jkqEbTGyt2SZ+EW8FkpGP0G+swAQRB7rlz35Wg3sANXE2PeB5qcJk+JOPqbxbN9a3PFKG77B5JaSN4zgAt8wfEqNkWXO+yL5EsGG9WWPqR2C4XDXWu3NZxBGp48tyjbFMsdlkoOS4wWzT9HdA2z2xF4IBGd7nDXUaXVm1I0nfN92O8OFwxC0cMbP0saPfZSYZb7mspA1PvUEjTW1Obss9f2UGSRjDqcRjTioBzqqjM65PZb7ysWZJYI5i+LA3cfZG7vRcmXYfeh/DhPNJWPIPUnIxtwSHOFySN4s06eJ5K6EfUounxgt1WmsCAEAIAQAgBACAEAICJ9KWLilw2eQtzlwaxrTuLnuAHpv8lEllGUHh5KRw3HGkh7DldxB+BHFa7ibilkl2H4nHMLDR/Fp+XNYMkZdpqxxflaRkYMoHM/iPr8FkiBrwed+rSA5o4Ft/oo1ll9dyisLOfhi/F42Pp3Pa0NyuAtpc6a6X0CRS9Cb53cKx5zz/vCLI2HxTrqGEk6sbkP/AONPgAs8mlJcma/HIxow53f0+yPF37KMkqI0PqXPN3keA3D91Bkavq2N3kJklISzY9GBbMASoZkkRrFtog7Rly3dpx8+Z+CKLJIXiWKvkO8gD1/wsksFcpZJ/wBAeIGOukgJOWeIm39UZBHnlL/RWRZTNcZL/VhSCAEAIAQAgBACAEAICuOnprf4ZcuykTRlotfObnTu0ub9yhmUe55vLuKwLM4FMeJSMsQ4gjv3I4oy34O7cdktrYqNhPiEl2amlLOtuGtceO4gG3yVM8qRu0OuUOYtv4Fm0da10QDXAuDtbaCx0187KYyTeDGzT2Rjuxx8vIwNxyaKPq2vIYXE5AdCdxJVjRrN4AbSTnc4C3df5oooZycn7TTjTP7k2kbhLJjErt7yowN5zNSSdTdRgncdqOQjMCDbQ7uP1ZZLsZReDWRguTx9wU4IaHTZXFjS1UNRe2R4Lv0nR/8AaSpIayj1dFIHAOBuCAQeYOoVhqGyAEAIAQAgBACAEAICn/8AUcXfZqS3sdc6/j1fZ92ZQzKPcokkFQWnNzO9DHBgREkAbybDzQbSyKKmMMbWF1w1oA7Nx5c/Va+XyzfjtliMVhr5wccRrmuY6PJclpGYtsQeFhw1txWG7nJsrTTcXmX7EHnffcDv4rawcpmrWuF9yBJmTFfU+5Bj1N2MaP8AKgySQrjdbcFBmuDd0/1496BvBh77oGcQ70QhHp7owxHr8MpnXuWM6s+MfZ+ACsXY1prEiVKTAEAIAQAgBACAEAICsf8AUGY/4a3N7fXM6vxsc39t0JR5zG5YliMEoDMElnB2+xBsoaysGVc9slL2Jrhk2dgcybTi11gRz01VGxr1OhLU1Wd45FtTXNY273A8fZ3+f/Kn4KWnjdFOP7kJr6ljpHuYMrSSQOV/83VyWEazlkTGRSRk2ZKowSmdLISZa/63KBk7NchkjbMgObygL+/0/VObD5GX1ZO8WvqA5rXDThvPosolFncs5ZFYIAQAgBACAEAIAQHkfpCL/wCJ1Ye5zi2aQDMSSG5rtAvuFiFBZEjrlBJrlQjBsKZ3AXTJO1nenEkZzAEKGkyyEpweUc62oe83cUjFLsRdbOf6jgw3NrXvutv1WRUmK62hkidkkY+N1r5XgtPv4KDJc9jhZCTpE+3goZMXg7lw3qDPKMh+iDIZ0JyalCCa9DNfLHikMbHuDJS4SMv2XhsbyLjmCpTK5RWMnptZlIIAQAgBACAEAIAQFDf6i6NjJKd7KdrXSZzJOG2LyLBrC4aE2uddd3JQSimsxQnLNmvPJCVIUx1IG8FRgsU0bGcO0FyTuAuSfDmowS5odnbE4i5rXCgqSH+z9073i12+dllgrckTro66Ja9lVBVVIZCyJ4eWEh73ZTcDKLgX8eKkrLJ6Udg24nCCw5KiIExu4OvvY7uPPgUJTPM1ZRyQyOhmY6ORhs5rhYj/AB3jQrEsTOOcDiowZZRgyjhqpwRuRkTaKMDfwadcpwRvMmY80wN7Le/08GF087ZImGdgD4pSO00Hsva08N49TzRGMm2X2sjAEAIAQAgBACAEAIBNiOHxTxmKaNsjHb2vAIPkUBXuI9COGPv1fXQ/pkLgP99z70A1noEpf/tz2/TH+yE5F9D0G4ez+ZJPL4vDR/aEGSXbPbD0FFrT0zGu/O673+T3kkeAsEIJEgBACAY9pdkqOublqYGvPB47MjbfleNR4bkBRHTH0fU+HCKamc8MldlMbu1lIaTcPvfhuPqgKyaoJOt7i5+vRCTSyEG4aLBCS0OgOjLsSc8Pt1cLri3t5jbfw3AoH2PRakxBACA//9k=", 
-             caption="나를 나타내는 사진",
-             use_container_width=True)
+    # (assets/avatar.jpg) 컬럼 폭에 맞는 변형본을 브라우저가 고르도록 srcset으로 제공
+    st.html(picture_html(avatar_variants(), alt="프로필 사진", sizes="(max-width: 640px) 100vw, 230px",
+                         caption="나를 나타내는 사진"))
 
 with col2:
     st.subheader("이름: 홍길동")
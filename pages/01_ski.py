@@ -1,327 +1,168 @@
 import streamlit as st
-from dataclasses import dataclass
-from typing import List, Optional, Tuple, Dict
-from urllib.parse import quote
+import numpy as np
+import pandas as pd
+from datetime import time, timedelta
+from typing import Optional, Tuple
+
+from core.difficulty_mix import MIX_LABELS, format_mix
+from core.resort_catalog import DIFFICULTY_BUCKETS, MODES, mode_index
+from core.service import RANKINGS, SkiPlanner, SkiQuery
+from core.traffic_profile import BUCKET_MINUTES, DAY_LABELS, N_BUCKETS, bucket_label, bucket_of
+from core.transit_router import NO_ROUTE, TRANSIT_MODE
+from instrumentation import section
+from link_health import LinkHealth, catalog_urls
+from live_status import LiveStatus, describe
+from page_html import ORIGIN_DEFAULT, naver_directions_hint, naver_search_link, plain_name, resort_card, ski_hero
+from profiler import begin, end
+from slope_map_cache import SlopeMapCache
+from theme import use_theme
 
 # =========================
 # Page
 # =========================
+PAGE_NAME = "ski"  # 테마 범위 + 계측 라벨
 st.set_page_config(
     page_title="⛷️ 옥수동 3시간 이내 스키장 + 난이도/슬로프맵",
     page_icon="❄️",
     layout="wide",
 )
+# 세션이 요청한 경우에만(APP_PROFILE) 이번 실행을 프로파일링 — 기본은 None
+capture = begin(PAGE_NAME)
 
 # =========================
-# Styling (white + blue, but still pretty)
+# Styling (white + blue — theme.py 공통 스타일 그대로, 세션당 한 번 주입)
 # =========================
-CSS = """
-<style>
-.stApp { background:#ffffff; color:#101828; }
-html, body, [class*="css"]{
-  font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, "Noto Sans KR",
-               "Apple SD Gothic Neo", "Malgun Gothic", sans-serif;
-}
-.hero{
-  border-radius: 18px;
-  padding: 18px 20px;
-  background:
-    radial-gradient(circle at 12% 20%, rgba(255, 88, 174, 0.22), transparent 40%),
-    radial-gradient(circle at 88% 20%, rgba(0, 209, 255, 0.20), transparent 42%),
-    radial-gradient(circle at 30% 90%, rgba(0, 255, 187, 0.14), transparent 45%),
-    linear-gradient(90deg, #0B63F6 0%, #2EA8FF 55%, #7C3AED 100%);
-  color: white;
-  box-shadow: 0 16px 44px rgba(12, 74, 255, 0.18);
-}
-.hero h1{
-  margin:0;
-  font-size: 28px;
-  font-weight: 900;
-  letter-spacing: -0.4px;
-  text-shadow: 0 10px 28px rgba(0,0,0,0.25);
-}
-.hero p{
-  margin: 6px 0 0 0;
-  font-size: 13.5px;
-  opacity: 0.95;
-  line-height: 1.5;
-}
-.card{
-  background: rgba(255,255,255,0.95);
-  border: 1px solid rgba(15, 23, 42, 0.10);
-  border-radius: 18px;
-  padding: 16px 16px 12px 16px;
-  box-shadow: 0 14px 40px rgba(2, 6, 23, 0.08);
-}
-.card + .card { margin-top: 14px; }
-.section-title{
-  font-size: 15px;
-  font-weight: 900;
-  margin: 0 0 10px 0;
-}
-.grad-text{
-  background: linear-gradient(90deg, #0B63F6, #2EA8FF, #7C3AED);
-  -webkit-background-clip: text;
-  -webkit-text-fill-color: transparent;
-}
-.badge{
-  display:inline-block;
-  padding: 6px 10px;
-  border-radius: 999px;
-  background: rgba(11, 99, 246, 0.08);
-  border: 1px solid rgba(11, 99, 246, 0.14);
-  color: #0B63F6;
-  margin-right: 6px;
-  margin-bottom: 6px;
-  font-size: 13px;
-  font-weight: 800;
-}
-.hr{
-  height: 1px;
-  margin: 12px 0;
-  background: linear-gradient(90deg, transparent, rgba(11,99,246,0.25), rgba(124,58,237,0.22), transparent);
-}
-.note{
-  color: rgba(16,24,40,0.72);
-  font-size: 13px;
-  line-height: 1.55;
-}
-.small{
-  color: rgba(16,24,40,0.62);
-  font-size: 12.5px;
-  line-height: 1.5;
-}
-div.stButton > button{
-  background: linear-gradient(90deg, #0B63F6 0%, #2EA8FF 45%, #7C3AED 100%);
-  color: white;
-  font-weight: 900;
-  border: none;
-  border-radius: 14px;
-  padding: 0.78rem 1.0rem;
-  box-shadow: 0 16px 36px rgba(11,99,246,0.22);
-}
-div.stButton > button:hover{
-  filter: brightness(1.03);
-  transform: translateY(-1px);
-}
-[data-baseweb="select"] > div{
-  background:#ffffff !important;
-  border-radius:14px !important;
-  border: 1px solid rgba(11, 99, 246, 0.18) !important;
-  box-shadow: 0 10px 22px rgba(2, 6, 23, 0.05);
-}
-</style>
-"""
-st.markdown(CSS, unsafe_allow_html=True)
+with section(PAGE_NAME, "theme"):
+    use_theme(PAGE_NAME)
 
 # =========================
-# Models
+# Slope map image cache (process-wide)
 # =========================
-@dataclass
-class Resort:
-    name: str
-    region: str
-    highlights: List[str]
-    car_min: Optional[Tuple[int, int]] = None
-    public_min: Optional[Tuple[int, int]] = None
-    ktx_min: Optional[Tuple[int, int]] = None
-    note: str = ""
-
-    # Difficulty profile: values are percentages 0-100; can be None if unknown
-    beginner: Optional[int] = None
-    intermediate: Optional[int] = None
-    advanced: Optional[int] = None
-    difficulty_note: str = ""
-
-    # Slope map resources
-    slope_map_page: Optional[str] = None   # official page
-    slope_map_pdf: Optional[str] = None    # official pdf
-    slope_map_image: Optional[str] = None  # direct image if available
-
-def badge(text: str) -> str:
-    return f"<span class='badge'>{text}</span>"
-
-def badges(items: List[str]) -> str:
-    return "".join([badge(x) for x in items])
-
-def fmt_range(r: Optional[Tuple[int,int]]) -> str:
-    if not r:
-        return "—"
-    a,b = r
-    return f"{a}–{b}분" if a != b else f"{a}분"
-
-def naver_search_link(query: str) -> str:
-    return f"https://map.naver.com/p/search/{quote(query)}"
-
-def naver_directions_hint(origin: str, destination: str) -> str:
-    # 네이버지도는 검색 후 '길찾기'로 연결하는 UX가 가장 안정적
-    return naver_search_link(destination)
-
-def get_range_by_mode(r: Resort, mode: str) -> Optional[Tuple[int,int]]:
-    if mode.startswith("자가용"):
-        return r.car_min
-    if mode.startswith("대중교통"):
-        return r.public_min
-    return r.ktx_min
-
-def within_minutes(rng: Optional[Tuple[int,int]], max_minutes: int) -> bool:
-    if not rng:
-        return False
-    # 보수적으로 상한(최대) 기준
-    return rng[1] <= max_minutes
-
-def difficulty_bucket(r: Resort) -> str:
-    # 사용자가 빠르게 이해할 수 있도록 “성향”을 라벨로
-    if r.beginner is None or r.intermediate is None or r.advanced is None:
-        return "정보 제한(정성 요약)"
-    b,i,a = r.beginner, r.intermediate, r.advanced
-    if b >= 50:
-        return "초급 친화 🟢"
-    if a >= 35:
-        return "상급 비중 ↑ 🔥"
-    if i >= 45:
-        return "중급 중심 🟦"
-    return "균형형 ⚖️"
+PREVIEW_WAIT_SECONDS = 1.5  # 느린 서버 때문에 페이지가 멈추지 않도록 대기 상한
+PAGE_SIZE = 5  # 카드 보기 한 페이지 리조트 수 — 결과가 많아도 첫 화면 렌더링 비용은 이만큼
+
+@st.cache_resource(show_spinner=False)
+def slope_map_cache() -> SlopeMapCache:
+    return SlopeMapCache(cache_dir=".cache/slope_maps")
+
+maps = slope_map_cache()
+
+# 공식 링크(페이지/PDF/이미지) 상태: 백그라운드 점검 + TTL 캐시, 알려진 불량 링크만 대체/숨김
+@st.cache_resource(show_spinner=False)
+def link_health() -> LinkHealth:
+    return LinkHealth()
+
+links = link_health()
+
+# 실시간 현황(운영 슬로프/야간/적설): 프로세스당 폴러 하나가 채우는 공유 캐시만 읽음 — 네트워크 대기 없음
+@st.cache_resource(show_spinner=False)
+def live_status() -> LiveStatus:
+    return LiveStatus.from_config().start()
+
+live = live_status()
 
 # =========================
-# Resorts (3h-ish from Oksu)
+# Resorts (3h-ish from Oksu) — data/resorts.json
 # Notes:
 # - 일부 리조트는 공식 페이지 접근 제한/타임아웃 가능성이 있어, 맵은 '공식 링크' 중심으로 제공
 # =========================
-ORIGIN_DEFAULT = "서울 성동구 옥수동"
-
-resorts: List[Resort] = [
-    Resort(
-        name="곤지암리조트 스키장 🏂",
-        region="경기 광주",
-        highlights=["수도권 최접근", "초·중급 다양", "당일치기 강력"],
-        car_min=(50, 80),
-        public_min=(70, 110),
-        note="주말/퇴근 정체 시 체감시간↑",
-        # Konjiam: 공식 슬로프 표에 초급/초중급/중급/중상급/상급 구성 (정량화: 초급+초중급=초급비중, 중급+중상급=중급, 상급=상급)
-        beginner=33, intermediate=44, advanced=23,
-        difficulty_note="공식 슬로프 표(수준 분류) 기반으로 대략 비율화(초급+초중급 / 중급+중상급 / 상급).",
-        slope_map_page="https://m.konjiamresort.co.kr/ski/skiLift.dev",
-        slope_map_image="https://m.konjiamresort.co.kr/common/images/ski/img-slope-keyvisual.jpg",
-    ),
-    Resort(
-        name="지산 포레스트 리조트 🎿",
-        region="경기 이천",
-        highlights=["서울 근교", "초급~상급", "당일치기"],
-        car_min=(55, 90),
-        public_min=(90, 140),
-        note="정체 영향 큼(특히 주말 오전/야간 귀가)",
-        # VisitKorea에 경사/슬로프수 소개는 있으나 '난이도별 수'가 명시적으로 정리돼 있지 않아 정성 요약
-        beginner=None, intermediate=None, advanced=None,
-        difficulty_note="공공 관광정보에 ‘10면/경사 7~30도’ 등 스펙은 확인되나 난이도별 비율은 공식 표로 재확인이 필요.",
-        slope_map_page="https://korean.visitkorea.or.kr/detail/ms_detail.do?cotid=1abed7cc-ef27-4004-9b63-474a5d1dd6ec",
-    ),
-    Resort(
-        name="엘리시안 강촌 ❄️",
-        region="강원 춘천",
-        highlights=["수도권 당일", "초급~최상급", "철도/셔틀 연계"],
-        car_min=(80, 130),
-        public_min=(90, 150),
-        note="서울→춘천 구간 정체 민감",
-        beginner=None, intermediate=None, advanced=None,
-        difficulty_note="공식 소개에 ‘초급부터 최상급까지’ 안내(비율은 공식 맵/슬로프 현황에서 확인 권장).",
-        slope_map_page="https://www.elysian.co.kr/about-gangchon/sky",
-    ),
-    Resort(
-        name="비발디파크 스키월드 🌙",
-        region="강원 홍천",
-        highlights=["슬로프 다양", "야간 운영(시즌 정책 변동)", "리조트형"],
-        car_min=(90, 140),
-        public_min=(100, 160),
-        note="성수기/주말 상한 기준으로 보는 것이 안전",
-        beginner=None, intermediate=None, advanced=None,
-        difficulty_note="가이드맵(조감도/시설 지도) 제공. 난이도 비율은 운영/슬로프 안내 페이지에서 보강 가능.",
-        slope_map_page="https://www.sonohotelsresorts.com/skiboard/guidemap",
-        # 가이드맵 이미지가 API 형태로 내려오는 구조라 환경에 따라 로딩이 안 될 수 있어 '페이지 링크'를 기본으로 제공
-    ),
-    Resort(
-        name="오크밸리 스키장 🌲",
-        region="강원 원주",
-        highlights=["가족형", "초급 친화", "규모는 소형"],
-        car_min=(80, 110),
-        public_min=(110, 170),
-        note="총 슬로프 수가 많지 않아 ‘가볍게’ 즐기기 좋음",
-        # 공식 소개에 총 3면 + 초급자용 I 코스 등(초급 친화로 정성 라벨)
-        beginner=67, intermediate=33, advanced=0,
-        difficulty_note="공식 소개(총 3면, 초급자 코스 명시) 기반으로 ‘초급 친화’로 단순화.",
-        slope_map_page="https://oakvalley.co.kr/ski/introduction/slope",
-    ),
-    Resort(
-        name="모나 용평 리조트 🏔️",
-        region="강원 평창",
-        highlights=["대형", "상급/최상급 포함", "코스 다양"],
-        car_min=(135, 165),
-        public_min=(160, 200),
-        ktx_min=(110, 150),
-        note="동절기 기상/노면/정체에 따라 편차 큼",
-        # 용평은 난이도 레벨이 폭넓고 상급/최상급 코스도 다수. 정확 비율은 시즌별 오픈현황/슬로프 분류로 재집계 필요 → 여기선 정성 + 라벨
-        beginner=None, intermediate=None, advanced=None,
-        difficulty_note="공식 슬로프맵/오픈현황에서 초급~최상급까지 폭넓게 운영됨을 확인 가능(비율은 시즌별로 변동).",
-        slope_map_page="https://www.yongpyong.co.kr/kor/skiNboard/slope/slopeMap.do",
-        slope_map_pdf="https://www.yongpyong.co.kr/upload/kor/%EC%8A%AC%EB%A1%9C%ED%94%84%EB%A7%B5.pdf",
-    ),
-    Resort(
-        name="휘닉스 파크(휘닉스 평창) 🐦",
-        region="강원 평창",
-        highlights=["올림픽급 파크/코스", "리조트형", "철도 연계"],
-        car_min=(140, 180),
-        ktx_min=(110, 150),
-        note="KTX 연계 시 체감 시간 개선 가능",
-        beginner=None, intermediate=None, advanced=None,
-        difficulty_note="공식 안내에 ‘총 18면’ 등 규모/특성 명시(난이도별 비율은 공식 맵에서 확인 권장).",
-        slope_map_page="https://phoenixhnr.co.kr/static/pyeongchang/snowpark/slope-lift",
-    ),
-]
+# 카탈로그 · 출발지 사전 · 소요시간 모델 · 정체 프로필은 core.service.SkiPlanner 하나로 묶음
+# (CLI `python -m core ski`, 로컬 JSON API와 같은 로직) — 이 페이지는 입력/표시만 담당
+@st.cache_resource(show_spinner=False)
+def load_planner() -> SkiPlanner:
+    return SkiPlanner.load()
+
+planner = load_planner()
+catalog = planner.catalog
+# 점검은 프로세스당 TTL마다 한 번만 시작됨(그 사이 재실행에서는 바로 반환)
+links.refresh(catalog_urls(catalog.resorts))
 
 # =========================
 # Hero
 # =========================
-st.markdown(
-    f"""
-<div class="hero">
-  <h1>⛷️ 옥수동 → 3시간 이내 스키장 ❄️ + 난이도/슬로프맵</h1>
-  <p>
-    📍 출발지: <b>{ORIGIN_DEFAULT}</b> (기본) · ⏱️ 소요시간은 교통/날씨/시간대에 따라 변동됩니다.<br/>
-    🗺️ 슬로프맵은 ‘공식 페이지/공식 PDF’를 우선 연결하며, 가능하면 이미지 프리뷰도 제공합니다.
-  </p>
-</div>
-""",
-    unsafe_allow_html=True
-)
-
+# 출발지/최대 소요시간은 아래 필터에서 정해지므로 자리만 잡아 두고, 필터 뒤 "hero" 구간에서 채움
+hero = st.empty()
 st.write("")
 
 left, right = st.columns([0.35, 0.65], gap="large")
 
-with left:
+with left, section(PAGE_NAME, "filters"):
     st.markdown("<div class='card'>", unsafe_allow_html=True)
     st.markdown("<div class='section-title grad-text'>🧭 필터</div>", unsafe_allow_html=True)
 
     origin = st.text_input("출발지(수정 가능) 📌", value=ORIGIN_DEFAULT)
+    resolved, found = planner.resolve(origin)
+    if not found:
+        st.caption(f"⚠️ 출발지를 찾지 못해 기본 출발지({resolved.name}) 기준으로 보여줘요. 구/동 이름이나 '위도, 경도'로 입력해 보세요.")
+    elif resolved.name != planner.default_origin.name:
+        st.caption(f"📍 {resolved.name} 기준으로 소요시간을 다시 계산했어요(거리 기반 추정).")
+
+    # 그룹 모드: 여러 출발지 × 리조트를 한 번에 계산해 "모두가 max_minutes 이내"인 곳만
+    group_lines, ranking, group_names = (), "worst", []
+    if st.toggle("👥 그룹 모드(여러 출발지)"):
+        group_text = st.text_area("출발지 목록(한 줄에 하나) 👥", value="서울 성동구 옥수동\n잠실\n마포구", height=110)
+        ranking = st.radio("순위 기준 🏁", list(RANKINGS), format_func=RANKINGS.get)
+        group_lines = tuple(line.strip() for line in group_text.splitlines() if line.strip())
+        members = [(line, planner.gazetteer.resolve(line)) for line in group_lines]
+        unresolved = [line for line, o in members if o is None]
+        group_names = [o.name for _, o in members if o is not None]
+        if unresolved:
+            st.caption(f"⚠️ 찾지 못해 제외한 출발지: {', '.join(unresolved)}")
+        if group_lines and not group_names:
+            # 하나도 못 찾으면 그룹 질의는 오류 → 위 단일 출발지 기준으로 보여 줌
+            st.caption("⚠️ 그룹 출발지를 하나도 찾지 못해 위 출발지 하나 기준으로 보여줘요.")
+            group_lines = ()
 
     mode = st.selectbox(
         "이동수단 🚗🚌🚄",
-        ["자가용(운전)", "대중교통(버스/지하철)", "KTX/철도 연계"],
+        MODES,
         index=0
     )
 
     max_minutes = st.slider("최대 소요시간(분) ⏱️", min_value=60, max_value=240, value=180, step=10)
 
+    # 출발 시각을 정하면 범위(하한~상한) 대신 그 시각의 예상 소요시간으로 필터
+    # KTX/철도 연계는 정체 프로필 대신 시간표 경로(열차·전철·버스·셔틀 환승), 도착 시각 기준도 가능
+    day = depart = None
+    arrive_by = False
+    if st.toggle("🕒 출발 시각 반영(정체 프로필)"):
+        day = DAY_LABELS.index(st.radio("요일 📅", DAY_LABELS, horizontal=True))
+        timetable = mode_index(mode) == TRANSIT_MODE and not group_lines
+        if timetable:
+            arrive_by = st.radio("기준 🏁", ["출발 시각", "도착 시각"], horizontal=True) == "도착 시각"
+        if arrive_by:
+            depart = st.time_input("도착 희망 시각 🏁", value=time(10, 0), step=timedelta(minutes=BUCKET_MINUTES))
+        else:
+            depart = st.time_input("출발 시각 🕒", value=time(7, 0), step=timedelta(minutes=BUCKET_MINUTES))
+        if timetable:
+            st.caption("🚄 시간표 기준으로 계산해요(거점역 접근 · 환승 · 리조트 셔틀 포함, 단일 출발지).")
+
     st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
 
     diff_pref = st.multiselect(
         "선호 난이도 성향(선택) 🎯",
-        ["초급 친화 🟢", "중급 중심 🟦", "상급 비중 ↑ 🔥", "균형형 ⚖️", "정보 제한(정성 요약)"],
-        default=["초급 친화 🟢", "중급 중심 🟦", "상급 비중 ↑ 🔥", "균형형 ⚖️", "정보 제한(정성 요약)"]
+        DIFFICULTY_BUCKETS,
+        default=DIFFICULTY_BUCKETS
     )
 
-    show_map_preview = st.checkbox("슬로프맵 미리보기(가능한 경우) 👀", value=True)
-    show_notes = st.checkbox("난이도/맵 근거 메모 보기 📝", value=False)
+    # 목표 비율(예: 20/50/30)에 가까운 순으로 정렬 — 소요시간/난이도 필터는 그대로 적용
+    mix = None
+    if st.toggle("🎚️ 목표 난이도 비율로 정렬"):
+        cols = st.columns(3)
+        mix = tuple(
+            col.number_input(f"{label}(%)", min_value=0, max_value=100, value=v, step=5)
+            for col, label, v in zip(cols, MIX_LABELS, (20, 50, 30))
+        )
+        if sum(mix) == 0:
+            st.caption("⚠️ 비율이 모두 0이라 정렬하지 않아요.")
+            mix = None
+        else:
+            st.caption(f"🎚️ {format_mix(mix)} 에 가까운 순 · 비율 정보가 없는 곳은 뒤쪽에 기존 순서대로 보여줘요.")
+
+    # 표 보기: 카드(리조트당 요소 10여 개) 대신 결과 전체를 표 하나로 — 헤더 클릭으로 정렬
+    table_view = st.toggle("📊 결과를 표 하나로 보기(간단히)")
+    show_map_preview = st.checkbox("슬로프맵 미리보기(가능한 경우) 👀", value=True, disabled=table_view)
+    show_notes = st.checkbox("난이도/맵 근거 메모 보기 📝", value=False, disabled=table_view)
 
     st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
     st.markdown(
@@ -330,25 +171,81 @@ with left:
     )
     st.markdown("</div>", unsafe_allow_html=True)
 
+with section(PAGE_NAME, "hero"):
+    hero.markdown(
+        ski_hero(group_names or [resolved.name], max_minutes,
+                 default=not group_names and resolved.name == planner.default_origin.name),
+        unsafe_allow_html=True,
+    )
+
 # =========================
 # Filtering
 # =========================
-candidates = []
-for r in resorts:
-    rng = get_range_by_mode(r, mode)
-    if not within_minutes(rng, max_minutes):
-        continue
-    bucket = difficulty_bucket(r)
-    if bucket not in diff_pref:
-        continue
-    candidates.append((rng, r, bucket))
-
-candidates.sort(key=lambda x: (x[0][1], x[0][0], x[1].name))
+# 단일 출발지: 정렬 인덱스 이진탐색 + 난이도 마스크 / 그룹: [origin, mode, resort] 요약 → 순위
+with section(PAGE_NAME, "query"):
+    result = planner.query(SkiQuery(origin, mode, max_minutes, tuple(diff_pref), day, depart, group_lines, ranking, mix, arrive_by))
+    hits, group, timed, m = result.hits, result.grouped, result.query.timed, mode_index(mode)
+    candidates = [
+        (rng, catalog.resorts[i], DIFFICULTY_BUCKETS[catalog.bucket[i]])
+        for rng, i in zip(result.ranges, hits)
+    ]
+
+# =========================
+# Compact table (표 보기)
+# - 후보 전체를 DataFrame 하나로 → st.dataframe 요소 1개(Arrow 컬럼 페이로드 하나)
+# - 난이도 비율/목표 일치도는 ProgressColumn, 공식 페이지·PDF·네이버는 LinkColumn
+# - 정렬은 브라우저에서(헤더 클릭) → 정렬 바꿔도 스크립트 재실행 없음
+# =========================
+def results_frame(candidates, mix_match: Optional[np.ndarray], routes: Optional[list]) -> Tuple[pd.DataFrame, dict]:
+    resorts = [r for _, r, _ in candidates]
+
+    def share(attr: str) -> list:
+        return [getattr(r, attr) if r.beginner is not None and r.intermediate is not None
+                and r.advanced is not None else None for r in resorts]
+
+    table = {
+        "스키장": [r.name for r in resorts],
+        "지역": [r.region for r in resorts],
+        "최소(분)": [rng[0] for rng, _, _ in candidates],
+        "최대(분)": [rng[1] for rng, _, _ in candidates],
+        "난이도 성향": [bucket for _, _, bucket in candidates],
+        "초급": share("beginner"),
+        "중급": share("intermediate"),
+        "상급": share("advanced"),
+    }
+    if mix_match is not None:
+        table["목표 일치"] = mix_match
+    if routes is not None:
+        table["경로"] = routes
+    now = [live.get(r.name) for r in resorts]
+    if any(now):
+        table["실시간"] = [" · ".join(describe(s)) if s else None for s in now]
+    # 응답 없는 공식 링크는 네이버 검색으로 대체(표시 텍스트=호스트라 대체 여부가 보임), PDF는 비움
+    table["슬로프맵"] = [r.slope_map_page if links.usable(r.slope_map_page) else naver_search_link(r.name) for r in resorts]
+    table["PDF"] = [r.slope_map_pdf if links.usable(r.slope_map_pdf) else None for r in resorts]
+    table["네이버지도"] = [naver_directions_hint(origin, plain_name(r.name)) for r in resorts]
+
+    percent = dict(min_value=0, max_value=100, format="%d%%", width="small")
+    config = {
+        "최소(분)": st.column_config.NumberColumn("⏱️ 최소", format="%d분", width="small"),
+        "최대(분)": st.column_config.NumberColumn("⏱️ 최대", format="%d분", width="small"),
+        "난이도 성향": st.column_config.TextColumn("🎯 성향"),
+        "초급": st.column_config.ProgressColumn("🟢 초급", **percent),
+        "중급": st.column_config.ProgressColumn("🟦 중급", **percent),
+        "상급": st.column_config.ProgressColumn("🔥 상급", **percent),
+        "목표 일치": st.column_config.ProgressColumn("🎚️ 목표 일치", **percent),
+        "경로": st.column_config.TextColumn("🚄 경로", width="large"),
+        "실시간": st.column_config.TextColumn("📡 실시간"),
+        "슬로프맵": st.column_config.LinkColumn("🧭 슬로프맵", display_text=r"https?://(?:www\.)?([^/]+)"),
+        "PDF": st.column_config.LinkColumn("📄 PDF", display_text="PDF 열기", width="small"),
+        "네이버지도": st.column_config.LinkColumn("🗺️ 길찾기", display_text="네이버지도", width="small"),
+    }
+    return pd.DataFrame(table), config
 
 # =========================
 # Rendering
 # =========================
-with right:
+with right, section(PAGE_NAME, "render"):
     st.markdown("<div class='card'>", unsafe_allow_html=True)
     st.markdown("<div class='section-title grad-text'>📋 결과</div>", unsafe_allow_html=True)
 
@@ -356,77 +253,155 @@ with right:
         st.info("조건에 맞는 스키장이 없습니다. 최대 소요시간을 늘리거나 난이도 필터를 조정해보세요.")
         st.markdown("</div>", unsafe_allow_html=True)
     else:
-        st.markdown(f"✅ **{mode} 기준 {max_minutes}분 이내:** **{len(candidates)}곳**")
+        when = f" · {DAY_LABELS[day]} {depart:%H:%M} {'도착' if result.query.arrive_by else '출발'}" if timed else ""
+        journeys = result.journeys
+        who = f"출발지 {len(result.group_origins)}곳 모두 " if group else ""
+        st.markdown(f"✅ **{mode} 기준 {who}{max_minutes}분 이내{when}:** **{len(candidates)}곳**")
+
+        if group:
+            summary = result.summary
+            st.caption(f"👥 {RANKINGS[ranking]} 순서예요. 카드의 ⏱️는 그룹 내 최단–최장 소요시간이에요.")
+            table = {
+                "스키장": [catalog.resorts[i].name for i in hits],
+                "최장(분)": summary.worst[m, hits],
+                "평균(분)": np.round(summary.mean[m, hits], 1),
+                "편차(분)": np.round(summary.std[m, hits], 1),
+                "공정성 점수": np.round(summary.fairness[m, hits], 1),
+            }
+            for k, o in enumerate(result.group_origins):
+                table[f"{k + 1}. {o.name}"] = result.group_times[k, hits]
+            st.dataframe(pd.DataFrame(table), hide_index=True, width="stretch")
+
+        # 하루 전체(15분 단위)를 한 번에 계산 → 리조트별 가장 빠른 출발 시간대
+        if timed and not group:
+            with st.expander("🕒 최적 출발 시간대 보기"):
+                w = planner.best_windows(result)
+                names = [catalog.resorts[i].name for i in hits]
+                st.dataframe(
+                    pd.DataFrame({
+                        "스키장": names,
+                        "추천 출발": [f"{bucket_label(w.start[i])}–{bucket_label(w.end[i])}" for i in hits],
+                        "최단 예상(분)": w.best_eta[hits],
+                        **({} if result.query.arrive_by else {f"{depart:%H:%M} 출발(분)": w.eta[hits, bucket_of(depart)]}),
+                    }),
+                    hide_index=True,
+                    width="stretch",
+                )
+                # 시간표 경로는 막차 이후 등 경로 없는 시간대가 있음 → 차트에서 비움
+                eta = np.where(w.eta[hits] >= NO_ROUTE, np.nan, w.eta[hits])
+                st.line_chart(
+                    pd.DataFrame(eta.T, index=[bucket_label(b) for b in range(N_BUCKETS)], columns=names),
+                    x_label="출발 시각",
+                    y_label="예상 소요시간(분)",
+                )
+                basis = "시간표 기준, 거점역에서 기다리는 시간 포함" if journeys is not None else "프로필, 거리 기반 추정"
+                st.caption(f"📈 최단 예상 +10분 이내인 연속 시간대를 추천해요({DAY_LABELS[day]} {basis}).")
+
         st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
 
-        for rng, r, bucket in candidates:
-            mins = fmt_range(rng)
-            map_link = r.slope_map_page or naver_search_link(r.name)
-            nav_link = naver_directions_hint(origin, r.name.replace(" 🏂","").replace(" 🎿","").replace(" ❄️","").replace(" 🌙","").replace(" 🌲","").replace(" 🏔️","").replace(" 🐦",""))
-
-            st.markdown(
-                f"""
-<div style="border:1px solid rgba(15,23,42,0.10); border-radius:16px; padding:14px; background:rgba(255,255,255,0.97);
-            box-shadow: 0 10px 26px rgba(2,6,23,0.06); margin-bottom:12px;">
-  <div style="font-weight:900; font-size:16px;">
-    {r.name} <span style="font-weight:900; color:#0B63F6;">⏱️ {mins}</span>
-  </div>
-  <div style="margin-top:6px;">
-    {badges([f"📍 {r.region}", f"🎯 {bucket}"] + [f"✨ {h}" for h in r.highlights])}
-  </div>
-  <div style="margin-top:8px; color: rgba(16,24,40,0.72); font-size:13px; line-height:1.5;">
-    📝 {r.note if r.note else "—"}
-  </div>
-  <div style="margin-top:10px; font-size:13px;">
-    🗺️ <a href="{nav_link}" target="_blank" style="font-weight:900; color:#0B63F6; text-decoration:none;">네이버지도에서 검색/길찾기</a>
-    &nbsp;|&nbsp;
-    🧭 <a href="{map_link}" target="_blank" style="font-weight:900; color:#7C3AED; text-decoration:none;">슬로프맵/슬로프 안내(공식 링크)</a>
-    {f"&nbsp;|&nbsp;📄 <a href='{r.slope_map_pdf}' target='_blank' style='font-weight:900; color:#0B63F6; text-decoration:none;'>슬로프맵 PDF</a>" if r.slope_map_pdf else ""}
-  </div>
-</div>
-""",
-                unsafe_allow_html=True
-            )
-
-            # Difficulty bars (if numeric available)
-            if r.beginner is not None and r.intermediate is not None and r.advanced is not None:
-                c1, c2, c3 = st.columns(3)
-                with c1:
-                    st.caption("🟢 초급")
-                    st.progress(r.beginner / 100)
-                    st.write(f"**{r.beginner}%**")
-                with c2:
-                    st.caption("🟦 중급")
-                    st.progress(r.intermediate / 100)
-                    st.write(f"**{r.intermediate}%**")
-                with c3:
-                    st.caption("🔥 상급")
-                    st.progress(r.advanced / 100)
-                    st.write(f"**{r.advanced}%**")
-            else:
-                st.caption("🎚️ 난이도 비율은 공식 슬로프 현황/맵에서 확인 권장(앱은 정성 요약 제공).")
-
-            # Slope map preview (best-effort)
+        if table_view:
+            routes = None if journeys is None else [journeys[i].describe() for i in hits]
+            frame, config = results_frame(candidates, result.mix_match, routes)
+            st.dataframe(frame, column_config=config, hide_index=True, width="stretch")
+            st.caption("📊 열 제목을 눌러 정렬할 수 있어요. 슬로프맵 열에 map.naver.com이 보이면 공식 링크가 응답하지 않아 검색으로 대체한 거예요.")
+
+        else:
+            # 정렬된 후보를 서버에서 페이지 단위로 잘라 보이는 페이지만 렌더링(카드/난이도 막대/미리보기)
+            n_pages = -(-len(candidates) // PAGE_SIZE)
+            page = 1
+            if n_pages > 1:
+                # 결과 목록이 바뀌면 key도 바뀌어 1페이지부터 다시
+                signature = hash(tuple(r.name for _, r, _ in candidates))
+                page = st.radio(
+                    "페이지 📄",
+                    range(1, n_pages + 1),
+                    horizontal=True,
+                    key=f"result_page_{signature}",
+                    format_func=lambda p: f"{(p - 1) * PAGE_SIZE + 1}–{min(p * PAGE_SIZE, len(candidates))}위",
+                )
+            start = (page - 1) * PAGE_SIZE
+
+            # 보이는 페이지 + 다음 페이지 슬로프맵을 백그라운드로 미리 받아둠(보이는 페이지가 먼저 큐에 들어감)
             if show_map_preview:
-                if r.slope_map_image:
-                    try:
-                        st.image(r.slope_map_image, caption="🗺️ 슬로프맵(이미지 프리뷰)", use_container_width=True)
-                    except Exception:
-                        st.caption("⚠️ 이 환경에서는 이미지 프리뷰를 불러오지 못했습니다. 상단 ‘공식 링크’를 이용해 주세요.")
-                elif r.slope_map_pdf:
-                    st.caption("📄 슬로프맵이 PDF로 제공됩니다. 상단 PDF 링크로 열어보세요.")
+                preview_urls = [r.slope_map_image for _, r, _ in candidates[start:start + 2 * PAGE_SIZE]
+                                if links.usable(r.slope_map_image)]
+                if st.session_state.get("prefetched_maps") != preview_urls:
+                    maps.prefetch(preview_urls)
+                    st.session_state["prefetched_maps"] = preview_urls
+
+            for k, (rng, r, bucket) in enumerate(candidates[start:start + PAGE_SIZE], start=start):
+                fit = []
+                if result.mix_match is not None:
+                    fit = ["🎚️ 비율 정보 없음"] if np.isnan(result.mix_match[k]) else [f"🎚️ 목표 비율 {result.mix_match[k]:.0f}% 일치"]
+                page_ok = links.usable(r.slope_map_page)
+                pdf_ok = links.usable(r.slope_map_pdf)
+                now = live.get(r.name)
+                st.markdown(
+                    resort_card(r, rng, bucket, links, origin, fit,
+                                live=describe(now) if now else (),
+                                route=journeys[hits[k]].describe() if journeys else ""),
+                    unsafe_allow_html=True
+                )
+
+                # Difficulty bars (if numeric available)
+                if r.beginner is not None and r.intermediate is not None and r.advanced is not None:
+                    c1, c2, c3 = st.columns(3)
+                    with c1:
+                        st.caption("🟢 초급")
+                        st.progress(r.beginner / 100)
+                        st.write(f"**{r.beginner}%**")
+                    with c2:
+                        st.caption("🟦 중급")
+                        st.progress(r.intermediate / 100)
+                        st.write(f"**{r.intermediate}%**")
+                    with c3:
+                        st.caption("🔥 상급")
+                        st.progress(r.advanced / 100)
+                        st.write(f"**{r.advanced}%**")
                 else:
-                    st.caption("🧭 슬로프맵은 상단 ‘공식 링크’에서 확인해 주세요.")
-
-            if show_notes and (r.difficulty_note or r.slope_map_page):
-                st.markdown(f"<div class='small'>📝 메모: {r.difficulty_note if r.difficulty_note else '—'}</div>", unsafe_allow_html=True)
-
-            st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
+                    st.caption("🎚️ 난이도 비율은 공식 슬로프 현황/맵에서 확인 권장(앱은 정성 요약 제공).")
+
+                # Slope map preview (best-effort)
+                if show_map_preview:
+                    if links.usable(r.slope_map_image):
+                        # 미리보기 하나 때문에 페이지 전체가 멈추지 않도록(예상 못 한 오류는 안내 문구로)
+                        try:
+                            thumb = maps.thumbnail(r.slope_map_image, wait=PREVIEW_WAIT_SECONDS)
+                            if thumb:
+                                st.image(thumb, caption="🗺️ 슬로프맵(이미지 프리뷰)", use_container_width=True)
+                                if st.checkbox("🔍 원본 해상도로 보기", key=f"full_map_{r.name}"):
+                                    full = maps.full(r.slope_map_image, wait=PREVIEW_WAIT_SECONDS * 4)
+                                    if full:
+                                        st.image(full, caption="🗺️ 슬로프맵(원본)", use_container_width=True)
+                                    else:
+                                        st.caption("⚠️ 원본 이미지를 불러오지 못했습니다. 상단 ‘공식 링크’를 이용해 주세요.")
+                            else:
+                                st.caption("⚠️ 이미지 프리뷰를 불러오는 중이거나 서버 응답이 없습니다. 상단 ‘공식 링크’를 이용해 주세요.")
+                        except Exception:
+                            st.caption("⚠️ 이 환경에서는 이미지 프리뷰를 불러오지 못했습니다. 상단 ‘공식 링크’를 이용해 주세요.")
+                    elif pdf_ok:
+                        st.caption("📄 슬로프맵이 PDF로 제공됩니다. 상단 PDF 링크로 열어보세요.")
+                    elif not page_ok:
+                        st.caption("⚠️ 공식 슬로프맵 링크가 응답하지 않아요. 상단 네이버 검색으로 찾아보세요.")
+                    else:
+                        st.caption("🧭 슬로프맵은 상단 ‘공식 링크’에서 확인해 주세요.")
+
+                if show_notes and (r.difficulty_note or r.slope_map_page):
+                    st.markdown(f"<div class='small'>📝 메모: {r.difficulty_note if r.difficulty_note else '—'}</div>", unsafe_allow_html=True)
+
+                st.markdown("<div class='hr'></div>", unsafe_allow_html=True)
 
         st.markdown("</div>", unsafe_allow_html=True)
 
-st.write("")
-st.markdown(
-    "<div class='note' style='text-align:center;'>❄️ 실제 출발 전에는 실시간 교통(지도앱 ETA)으로 최종 확인을 권장합니다.</div>",
-    unsafe_allow_html=True
-)
+with section(PAGE_NAME, "footer"):
+    st.write("")
+    st.markdown(
+        "<div class='note' style='text-align:center;'>❄️ 실제 출발 전에는 실시간 교통(지도앱 ETA)으로 최종 확인을 권장합니다.</div>",
+        unsafe_allow_html=True
+    )
+
+end(capture, {
+    "origin": origin, "mode": mode, "max_minutes": max_minutes, "diff_pref": diff_pref,
+    "day": day, "depart": depart, "arrive_by": arrive_by, "group_lines": len(group_lines), "ranking": ranking,
+    "mix": mix, "table_view": table_view, "previews": show_map_preview, "notes": show_notes,
+})
@@ -0,0 +1,194 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# =============================
+# Per-session profiler (느리다는 제보 재현용)
+# - APP_PROFILE 미설정(기본): begin()은 None만 돌려줌 → 페이지에 추가 비용 없음
+#   APP_PROFILE=query  → URL에 ?profile=N 을 붙인 세션의 다음 N번 전체 실행을 기록
+#   APP_PROFILE=admin  → 위 + 사이드바 토글(켜 둔 동안 그 세션의 모든 전체 실행 기록)
+# - 실행마다 cProfile(결정적) + 스크립트 스레드 스택 샘플링(APP_PROFILE_INTERVAL_MS, 기본 2ms)
+#   → APP_PROFILE_DIR(기본 .cache/profiles)/<시각>-<페이지>-<세션>-<시간>ms.{pstats,collapsed,json}
+#   .collapsed는 "frame;frame;... count" 형식(speedscope, flamegraph.pl 등에서 바로 열림)
+#   .json에는 페이지, 위젯/필터 상태, 소요시간, 샘플 수, 완료 여부(중간에 끊긴 실행은 interrupted)
+# - fragment만 다시 실행되는 경우(체크박스 등)는 페이지 스크립트를 거치지 않으므로 기록 대상 아님
+# - `python profiler.py` 기록 목록, `--top 20 <파일>` pstats 상위 함수
+# =============================
+MODE = os.environ.get("APP_PROFILE", "").strip().lower()
+ENABLED = MODE in ("query", "admin")
+PROFILE_DIR = Path(os.environ.get("APP_PROFILE_DIR", ".cache/profiles"))
+INTERVAL = float(os.environ.get("APP_PROFILE_INTERVAL_MS", "2")) / 1000
+MAX_RUNS = 20  # ?profile=N 상한
+
+_RUNS_KEY = "_profiler_runs"
+_ADMIN_KEY = "_profiler_admin"
+_active: Dict[str, "Capture"] = {}  # 세션 → 진행 중인 기록
+_lock = threading.Lock()
+
+
+class Capture:
+    def __init__(self, page: str, session: str, script: str, interval: float = INTERVAL):
+        self.page = page
+        self.session = session
+        self.script = script  # 이 파일의 프레임에서 스택을 자름(Streamlit 실행기 프레임 제외)
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="profiler-sampler", daemon=True)
+        self._profile = cProfile.Profile()
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self._sampler.start()
+        self._profile.enable()
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                if code.co_filename == self.script:
+                    break
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def finish(self, state: Optional[Dict[str, Any]] = None, status: str = "ok") -> Path:
+        """Stop profiling and write ``.pstats``, ``.collapsed`` and ``.json``; returns the file stem."""
+        self._profile.disable()
+        elapsed_ms = (time.perf_counter() - self._t0) * 1000
+        self._stop.set()
+        self._sampler.join()
+        with _lock:
+            if _active.get(self.session) is self:
+                del _active[self.session]
+
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self.started_at))
+        millis = int(self.started_at * 1000) % 1000
+        session = "".join(c for c in self.session if c.isalnum())[:8]
+        stem = PROFILE_DIR / f"{stamp}.{millis:03d}-{self.page}-{session}-{elapsed_ms:.0f}ms"
+        self._profile.dump_stats(f"{stem}.pstats")
+        Path(f"{stem}.collapsed").write_text(
+            "".join(f"{s} {n}\n" for s, n in self.samples.most_common()), encoding="utf-8"
+        )
+        meta = {
+            "page": self.page,
+            "session": self.session,
+            "status": status,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started_at)),
+            "duration_ms": round(elapsed_ms, 2),
+            "interval_ms": self.interval * 1000,
+            "samples": sum(self.samples.values()),
+            "state": state or {},
+        }
+        Path(f"{stem}.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+        return stem
+
+
+def _armed() -> bool:
+    raw = st.query_params.get("profile")
+    if raw is not None:
+        # 한 번 읽으면 URL에서 지움 → 새로고침해도 다시 켜지지 않음
+        del st.query_params["profile"]
+        try:
+            runs = int(raw or 1)
+        except ValueError:
+            runs = 1
+        st.session_state[_RUNS_KEY] = max(0, min(runs, MAX_RUNS))
+    if MODE == "admin" and st.sidebar.toggle("🔬 이 세션 프로파일링", key=_ADMIN_KEY):
+        return True
+    runs = st.session_state.get(_RUNS_KEY, 0)
+    if runs > 0:
+        st.session_state[_RUNS_KEY] = runs - 1
+        return True
+    return False
+
+
+def begin(page: str) -> Optional[Capture]:
+    """Start profiling this run if the session asked for it; ``None`` otherwise (always when disabled)."""
+    if not ENABLED:
+        return None
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return None
+    with _lock:
+        stale = _active.pop(ctx.session_id, None)
+    if stale is not None:
+        # 직전 실행이 위젯 변경 등으로 중간에 끊김 → 끊긴 그대로 기록
+        stale.finish(status="interrupted")
+    if not _armed():
+        return None
+    capture = Capture(page, ctx.session_id, sys._getframe(1).f_code.co_filename)
+    with _lock:
+        _active[ctx.session_id] = capture
+    return capture
+
+
+def end(capture: Optional[Capture], state: Dict[str, Any]) -> None:
+    """Finish ``capture`` (from ``begin``) tagging it with the page's widget/filter ``state``."""
+    if capture is None:
+        return
+    stem = capture.finish(state)
+    st.toast(f"🔬 프로파일 저장: {stem.name}")
+
+
+# =============================
+# CLI
+# =============================
+def list_captures(directory: Path = PROFILE_DIR) -> List[Dict[str, Any]]:
+    rows = []
+    for path in sorted(directory.glob("*.json"), reverse=True):
+        try:
+            meta = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        meta["stem"] = str(path.with_suffix(""))
+        rows.append(meta)
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    import pstats
+
+    parser = argparse.ArgumentParser(description="세션 프로파일 기록 보기")
+    parser.add_argument("--dir", type=Path, default=PROFILE_DIR)
+    parser.add_argument("--slowest", action="store_true", help="소요시간 긴 순")
+    parser.add_argument("--top", type=int, metavar="N", help="pstats 상위 N개 함수(누적 시간 순)")
+    parser.add_argument("stem", nargs="?", help="기록 이름(확장자 없이 또는 .pstats)")
+    args = parser.parse_args(argv)
+
+    if args.top:
+        if not args.stem:
+            parser.error("--top에는 기록 이름이 필요해요")
+        path = args.stem if args.stem.endswith(".pstats") else f"{args.stem}.pstats"
+        pstats.Stats(path).sort_stats("cumulative").print_stats(args.top)
+        return 0
+
+    rows = list_captures(args.dir)
+    if args.slowest:
+        rows.sort(key=lambda r: -r.get("duration_ms", 0))
+    if not rows:
+        print(f"기록 없음: {args.dir} (APP_PROFILE=query 로 실행하고 URL에 ?profile=1)", file=sys.stderr)
+        return 1
+    for r in rows:
+        state = ", ".join(f"{k}={v}" for k, v in r.get("state", {}).items())
+        print(f"{r['started_at']}  {r['page']:<9} {r['duration_ms']:8.1f}ms  {r['samples']:5d} samples  "
+              f"{r['status']:<11} {Path(r['stem']).name}\n    {state}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,414 @@
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from http.client import HTTPException
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from PIL import Image
+
+# =========================
+# Slope map image cache
+# - 원격 슬로프맵 이미지를 한 번만 받아 디스크에 저장(용량 상한 LRU)
+# - TTL이 지나면 ETag/Last-Modified로 재검증, 실패 시 기존 파일 그대로 사용
+# - 미리보기는 축소 썸네일, 원본은 요청할 때만
+# - 실패/시간 초과한 URL은 짧은 TTL(fail_ttl_seconds) 동안 기억 → 그동안은 기다리지 않고 바로 None(또는 기존 사본)
+# - max_bytes보다 큰 이미지는 저장하지 않음(저장 직후 스스로 축출되는 것 방지)
+# - `python slope_map_cache.py --self-test` 로컬 대역 서버로 동작 확인
+# =========================
+USER_AGENT = "Mozilla/5.0 (compatible; ski-guide-slope-map-cache)"
+
+
+class SlopeMapCache:
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 6 * 3600,
+        timeout: float = 5.0,
+        thumb_width: int = 640,
+        max_workers: int = 4,
+        fail_ttl_seconds: float = 120,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self.thumb_width = thumb_width
+        self.fail_ttl_seconds = fail_ttl_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="slope-map")
+        self._inflight: Dict[str, Future] = {}
+        self._failed: Dict[str, float] = {}  # url → 이 시각까지 다시 기다리지 않음(negative cache)
+        self._lock = threading.Lock()
+
+    # ---------- paths / metadata ----------
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _data_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.img"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _thumb_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.w{self.thumb_width}.jpg"
+
+    def _load_meta(self, key: str) -> Optional[dict]:
+        try:
+            return json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _save_meta(self, key: str, meta: dict) -> None:
+        self._write_atomic(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def _is_fresh(self, meta: Optional[dict]) -> bool:
+        return bool(meta) and time.time() - meta.get("fetched_at", 0) < self.ttl_seconds
+
+    def _touch(self, path: Path) -> None:
+        # LRU 기준은 mtime(마지막 사용 시각)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _read(self, path: Path) -> Optional[bytes]:
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self._touch(path)
+        return data
+
+    # ---------- negative cache ----------
+    def _mark_failed(self, url: str) -> None:
+        with self._lock:
+            self._failed[url] = time.time() + self.fail_ttl_seconds
+
+    def _clear_failed(self, url: str) -> None:
+        with self._lock:
+            self._failed.pop(url, None)
+
+    def _recently_failed(self, url: str) -> bool:
+        with self._lock:
+            until = self._failed.get(url)
+            if until is None:
+                return False
+            if until > time.time():
+                return True
+            del self._failed[url]
+            return False
+
+    # ---------- network ----------
+    def _fetch(self, url: str) -> Optional[Path]:
+        key = self._key(url)
+        data_path = self._data_path(key)
+        meta = self._load_meta(key)
+        have_copy = meta is not None and data_path.exists()
+        if have_copy and self._is_fresh(meta):
+            return data_path
+
+        headers = {"User-Agent": USER_AGENT}
+        if have_copy:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            with urlopen(Request(url, headers=headers), timeout=self.timeout) as resp:
+                # 상한보다 큰 이미지는 끝까지 받지 않음(max_bytes + 1 바이트면 초과 판정)
+                body = resp.read(self.max_bytes + 1)
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+        except HTTPError as e:
+            if e.code == 304 and have_copy:
+                meta["fetched_at"] = time.time()
+                self._save_meta(key, meta)
+                self._clear_failed(url)
+                return data_path
+            # 재검증 실패 시에는 오래된 사본이라도 사용(stale-if-error)
+            return self._failed_fetch(url, data_path if have_copy else None)
+        except (URLError, OSError, TimeoutError, HTTPException):
+            # HTTPException: 깨진 응답(BadStatusLine, 중간에 끊긴 본문 IncompleteRead 등)
+            return self._failed_fetch(url, data_path if have_copy else None)
+
+        # 캐시 전체보다 큰 이미지는 저장하자마자 축출되므로 쓰지 않음
+        if len(body) > self.max_bytes:
+            return self._failed_fetch(url, data_path if have_copy else None)
+
+        # 이미지가 아닌 응답(차단 페이지 등)은 저장하지 않음
+        try:
+            Image.open(io.BytesIO(body)).verify()
+        except Exception:
+            return self._failed_fetch(url, data_path if have_copy else None)
+
+        for old in self.cache_dir.glob(f"{key}.w*.jpg"):
+            old.unlink(missing_ok=True)
+        self._write_atomic(data_path, body)
+        self._save_meta(key, {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        })
+        self._clear_failed(url)
+        self._evict()
+        return data_path
+
+    def _failed_fetch(self, url: str, fallback: Optional[Path]) -> Optional[Path]:
+        self._mark_failed(url)
+        return fallback
+
+    def _make_thumbnail(self, url: str) -> Optional[bytes]:
+        data_path = self._fetch(url)
+        if data_path is None:
+            return None
+        thumb_path = self._thumb_path(self._key(url))
+        if thumb_path.exists():
+            return self._read(thumb_path)
+        try:
+            with Image.open(data_path) as img:
+                img = img.convert("RGB")
+                img.thumbnail((self.thumb_width, self.thumb_width * 4))
+                buf = io.BytesIO()
+                img.save(buf, format="JPEG", quality=82, optimize=True)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            self._mark_failed(url)
+            return None
+        data = buf.getvalue()
+        self._write_atomic(thumb_path, data)
+        return data
+
+    # ---------- eviction ----------
+    def _evict(self) -> None:
+        with self._lock:
+            groups: Dict[str, list] = {}
+            for p in self.cache_dir.iterdir():
+                if p.name.endswith(".tmp"):
+                    continue
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                g = groups.setdefault(p.name.split(".", 1)[0], [0, 0.0, []])
+                g[0] += st.st_size
+                g[1] = max(g[1], st.st_mtime)
+                g[2].append(p)
+
+            total = sum(g[0] for g in groups.values())
+            for size, _, paths in sorted(groups.values(), key=lambda g: g[1]):
+                if total <= self.max_bytes:
+                    break
+                for p in paths:
+                    p.unlink(missing_ok=True)
+                total -= size
+
+    # ---------- public API ----------
+    def _submit(self, url: str) -> Future:
+        with self._lock:
+            fut = self._inflight.get(url)
+            if fut is None:
+                fut = self._pool.submit(self._make_thumbnail, url)
+                self._inflight[url] = fut
+                fut.add_done_callback(lambda _f, u=url: self._forget(u))
+            return fut
+
+    def _forget(self, url: str) -> None:
+        with self._lock:
+            self._inflight.pop(url, None)
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """Warm thumbnails for ``urls`` in the background (non-blocking)."""
+        for url in dict.fromkeys(u for u in urls if u):
+            key = self._key(url)
+            if self._thumb_path(key).exists() and self._is_fresh(self._load_meta(key)):
+                continue
+            if self._recently_failed(url):
+                continue
+            self._submit(url)
+
+    def thumbnail(self, url: str, wait: Optional[float] = None) -> Optional[bytes]:
+        """Return thumbnail bytes, waiting at most ``wait`` seconds for a fetch."""
+        key = self._key(url)
+        thumb_path = self._thumb_path(key)
+        if thumb_path.exists() and self._is_fresh(self._load_meta(key)):
+            return self._read(thumb_path)
+        if self._recently_failed(url):
+            return self._read(thumb_path) if thumb_path.exists() else None
+        try:
+            return self._submit(url).result(timeout=wait)
+        except FutureTimeout:
+            # 받는 중인 요청은 계속 진행(성공하면 표시가 풀림), 그동안 다음 실행은 기다리지 않음
+            self._mark_failed(url)
+            return self._read(thumb_path) if thumb_path.exists() else None
+
+    def full(self, url: str, wait: Optional[float] = None) -> Optional[bytes]:
+        """Return the original image bytes, waiting at most ``wait`` seconds."""
+        key = self._key(url)
+        data_path = self._data_path(key)
+        if data_path.exists() and self._is_fresh(self._load_meta(key)):
+            return self._read(data_path)
+        if self._recently_failed(url):
+            return self._read(data_path) if data_path.exists() else None
+        try:
+            self._submit(url).result(timeout=wait)
+        except FutureTimeout:
+            self._mark_failed(url)
+        return self._read(data_path) if data_path.exists() else None
+
+
+# =========================
+# CLI / self-test against a local stand-in server
+# =========================
+def _self_test() -> int:
+    import tempfile
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    def png(size: int, noise: bool = False) -> bytes:
+        if noise:
+            img = Image.frombytes("RGB", (size, size), os.urandom(size * size * 3))
+        else:
+            img = Image.new("RGB", (size, size), (11, 99, 246))
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+        return buf.getvalue()
+
+    small, huge = png(800), png(160, noise=True)
+    hits: Dict[str, int] = {}
+    lock = threading.Lock()
+
+    class StandIn(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                hits[self.path] = hits.get(self.path, 0) + 1
+            if self.path.startswith("/slow"):
+                time.sleep(1.0)
+            if self.path.startswith("/missing"):
+                self.send_error(404)
+                return
+            if self.path.startswith("/garbage"):
+                self.wfile.write(b"NOT HTTP AT ALL\r\n\r\n")
+                self.close_connection = True
+                return
+            if self.path.startswith("/truncated"):
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(small)))
+                self.end_headers()
+                self.wfile.write(small[:10])
+                self.close_connection = True
+                return
+            if self.path.startswith("/map") and self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            body = {"/huge": huge, "/html": b"<html>blocked</html>"}.get(self.path, small)
+            self.send_response(200)
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    failures: List[str] = []
+
+    def check(ok: bool, what: str) -> None:
+        if not ok:
+            failures.append(what)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SlopeMapCache(Path(tmp), max_bytes=len(huge) - 1, timeout=0.5, thumb_width=64)
+
+        thumb = cache.thumbnail(f"{base}/map", wait=2)
+        check(bool(thumb) and Image.open(io.BytesIO(thumb)).width == 64, "정상 이미지 썸네일")
+        check(cache.thumbnail(f"{base}/map", wait=2) == thumb and hits["/map"] == 1, "두 번째 썸네일은 디스크에서")
+
+        # TTL 만료 → ETag 재검증(304)이면 기존 파일 그대로
+        stale = SlopeMapCache(Path(tmp), max_bytes=len(huge) - 1, ttl_seconds=0, timeout=0.5, thumb_width=64)
+        check(stale.full(f"{base}/map", wait=2) is not None and hits["/map"] == 2, "304 재검증")
+
+        for path, what in (("/missing", "404"), ("/html", "이미지 아닌 응답"), ("/huge", "max_bytes 초과"),
+                           ("/garbage", "HTTP가 아닌 응답"), ("/truncated", "중간에 끊긴 본문")):
+            check(cache.thumbnail(f"{base}{path}", wait=2) is None, f"{what} → None")
+            t0 = time.perf_counter()
+            again = cache.thumbnail(f"{base}{path}", wait=2)
+            check(again is None and hits[path] == 1 and time.perf_counter() - t0 < 0.05, f"{what} → 실패 기억(재요청 없음)")
+        check(not cache._data_path(cache._key(f"{base}/huge")).exists(), "max_bytes 초과 이미지는 저장하지 않음")
+
+        # 압축 폭탄(픽셀 수 상한 초과) → 예외 대신 None + 실패 기억
+        saved, Image.MAX_IMAGE_PIXELS = Image.MAX_IMAGE_PIXELS, 1000
+        try:
+            check(cache.thumbnail(f"{base}/map?bomb", wait=2) is None, "압축 폭탄 → None")
+            check(cache._recently_failed(f"{base}/map?bomb"), "압축 폭탄 → 실패 기억")
+        finally:
+            Image.MAX_IMAGE_PIXELS = saved
+
+        t0 = time.perf_counter()
+        check(cache.thumbnail(f"{base}/slow", wait=0.2) is None, "느린 서버 → 대기 상한 후 None")
+        first = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        check(cache.full(f"{base}/slow", wait=2) is None, "느린 서버 원본 → None")
+        second = time.perf_counter() - t0
+        check(second < 0.05 and hits["/slow"] == 1, f"시간 초과 기억 → 다음 요청은 바로 반환({second * 1000:.0f}ms)")
+
+        cache.prefetch([f"{base}/missing", f"{base}/slow"])
+        time.sleep(0.1)
+        check(hits["/missing"] == 1 and hits["/slow"] == 1, "실패 기억 중인 URL은 prefetch 안 함")
+
+        expired = SlopeMapCache(Path(tmp), max_bytes=len(huge) - 1, timeout=0.5, fail_ttl_seconds=0)
+        expired.thumbnail(f"{base}/missing", wait=2)
+        expired.thumbnail(f"{base}/missing", wait=2)
+        check(hits["/missing"] == 3, "실패 TTL이 지나면 다시 요청")
+    server.shutdown()
+
+    for line in failures:
+        print(f"❌ {line}")
+    print(f"요청 {sum(hits.values())}회 · 느린 서버 첫 대기 {first:.2f}s → 다음 {second * 1000:.0f}ms · "
+          f"{'통과' if not failures else '실패'}")
+    return 1 if failures else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="슬로프맵 이미지 캐시")
+    parser.add_argument("--self-test", action="store_true", help="로컬 대역 서버로 캐시 동작 확인")
+    parser.add_argument("--dir", type=Path, default=Path(".cache/slope_maps"))
+    parser.add_argument("urls", nargs="*", help="썸네일을 받아 둘 이미지 URL")
+    args = parser.parse_args(argv)
+    if args.self_test:
+        return _self_test()
+    if not args.urls:
+        parser.error("URL 또는 --self-test 가 필요해요")
+
+    cache = SlopeMapCache(args.dir)
+    missing = 0
+    for url in args.urls:
+        thumb = cache.thumbnail(url)
+        missing += thumb is None
+        print(f"{'✅' if thumb else '❌'} {len(thumb or b''):8,d} B  {url}")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
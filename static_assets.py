@@ -0,0 +1,118 @@
+import hashlib
+import io
+import os
+from dataclasses import dataclass
+from html import escape
+from pathlib import Path
+from typing import List, Sequence
+
+from PIL import Image
+
+# =========================
+# Static image assets
+# - 원본은 assets/ 에 파일로 한 번만 저장
+# - 폭별 WebP/JPEG 변형본을 static/ 에 "내용 해시" 파일명으로 생성
+#   (<picture>에서 WebP가 먼저, JPEG는 대체용)
+# - 원본 대비 MIN_SAVING 이상 작아지지 않는 변형본은 만들지 않음
+#   (원본과 같은 형식이면 원본 바이트를 그대로 씀 → 재압축 화질 손실만 있고 이득 없는 파일 방지)
+# - static/ 은 Streamlit static serving(/app/static/...)으로 제공 → 브라우저/프록시 캐시 가능
+# =========================
+ROOT_DIR = Path(__file__).resolve().parent
+ASSETS_DIR = ROOT_DIR / "assets"
+STATIC_DIR = ROOT_DIR / "static"
+STATIC_URL = "app/static"
+
+FORMATS = {"webp": ("WEBP", "image/webp"), "jpeg": ("JPEG", "image/jpeg")}
+# 작은 아바타/사진 기준: q80은 원본 JPEG와 거의 같은 크기였음(188px JPEG 8,715 B vs 원본 9,626 B)
+SAVE_OPTIONS = {
+    "webp": {"quality": 70, "method": 6},
+    "jpeg": {"quality": 70, "optimize": True, "progressive": True},
+}
+MIN_SAVING = 0.15  # 원본 대비 최소 절감 비율
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    width: int
+    fmt: str
+    url: str
+    size: int
+
+
+def _encode(img: Image.Image, width: int, fmt: str) -> bytes:
+    if width < img.width:
+        height = round(img.height * width / img.width)
+        img = img.resize((width, height), Image.LANCZOS)
+    buf = io.BytesIO()
+    img.save(buf, format=FORMATS[fmt][0], **SAVE_OPTIONS[fmt])
+    return buf.getvalue()
+
+
+def build_image_variants(
+    source: Path,
+    widths: Sequence[int] = (96, 144, 188),
+    formats: Sequence[str] = ("webp", "jpeg"),
+) -> List[ImageVariant]:
+    """Decode ``source`` once and write downscaled, content-hashed variants.
+
+    Variants that are not at least ``MIN_SAVING`` smaller than the source file are
+    skipped, or replaced by the source bytes when they share its format. If nothing
+    survives (e.g. a PNG source), the source itself is returned as the only variant.
+    """
+    STATIC_DIR.mkdir(parents=True, exist_ok=True)
+    original = source.read_bytes()
+    limit = len(original) * (1 - MIN_SAVING)
+    with Image.open(source) as img:
+        source_fmt = next((f for f, (pil, _) in FORMATS.items() if pil == img.format), None)
+        img = img.convert("RGB")
+
+    def write(data: bytes, w: int, fmt: str) -> ImageVariant:
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        name = f"{source.stem}.{digest}.w{w}.{fmt}"
+        path = STATIC_DIR / name
+        if not path.exists():
+            tmp = path.with_name(f"{name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        return ImageVariant(width=w, fmt=fmt, url=f"{STATIC_URL}/{name}", size=len(data))
+
+    # 원본보다 큰 폭은 만들지 않음(업스케일 방지)
+    widths = sorted({min(w, img.width) for w in widths})
+    variants = []
+    for fmt in formats:
+        for w in widths:
+            data = _encode(img, w, fmt)
+            if len(data) > limit:
+                if fmt != source_fmt or w != img.width:
+                    continue
+                data = original
+            variants.append(write(data, w, fmt))
+    if not variants:
+        # 어떤 변형본도 충분히 작지 않음(PNG 원본 등) → 원본 파일 그대로 하나
+        variants.append(write(original, img.width, source.suffix.lstrip(".").lower() or "img"))
+    return variants
+
+
+def picture_html(variants: List[ImageVariant], alt: str, sizes: str, caption: str = "") -> str:
+    """``<picture>`` with per-format srcset so the browser picks the variant that fits.
+
+    The ``<img>`` fallback is the widest variant of the last format in ``FORMATS``,
+    or the last variant if none is in ``FORMATS`` (the source itself).
+    """
+    sources = []
+    fallback = None
+    for fmt in FORMATS:
+        vs = [v for v in variants if v.fmt == fmt]
+        if not vs:
+            continue
+        srcset = ", ".join(f"{v.url} {v.width}w" for v in vs)
+        sources.append(f"<source type='{FORMATS[fmt][1]}' srcset='{srcset}' sizes='{sizes}'>")
+        fallback = vs[-1]
+    fallback = fallback or variants[-1]
+    cap = f"<figcaption style='font-size:14px; color:rgba(49,51,63,0.6); text-align:center;'>{escape(caption)}</figcaption>" if caption else ""
+    return (
+        "<figure style='margin:0;'>"
+        f"<picture>{''.join(sources)}"
+        f"<img src='{fallback.url}' alt='{escape(alt)}' loading='lazy' decoding='async' style='width:100%; height:auto;'>"
+        f"</picture>{cap}</figure>"
+    )
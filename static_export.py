@@ -0,0 +1,399 @@
+import argparse
+import hashlib
+import html
+import itertools
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from core.resort_catalog import DIFFICULTY_BUCKETS, MODES
+from core.service import ShoulderGuide, SkiPlanner, SkiQuery
+from link_health import LinkHealth
+from page_html import (
+    ORIGIN_DEFAULT, RED_FLAG_CHECKS, RED_FLAGS, SHOULDER_HERO, red_flag_alerts,
+    render_exercises_section, render_tests_section, resort_card, ski_hero,
+)
+from theme import PAGE_ATTR, STYLESHEET, badges, minify_css, page_css, scope_css
+
+# =========================
+# Static export (읽기 전용 사이트, 요청당 Python 없음)
+# - 상태 공간이 작은 조합을 전부 미리 렌더링
+#   shoulder: 증상 8개 × 레드플래그 체크 8조합 / ski: 이동수단 3 × 최대 소요시간 19단계 × 난이도 성향 32부분집합
+#   (기본 출발지, 출발 시각/그룹/목표 비율/검색/여러 증상 같은 자유 입력은 앱에서만)
+# - 앱의 fragment처럼 페이지를 영역(region)으로 나눠, 영역 HTML을 "내용 해시" 조각 파일로 한 번씩만 저장
+#   (검사/운동 섹션은 증상별 8개, 스키장 카드는 이동수단 × 리조트별 1개 → 상태가 늘어도 조각은 거의 안 늘어남)
+# - 페이지마다 셸(index.html, 기본 상태를 미리 채움) + 상태 목록(states.<hash>.json: 상태 키 → 영역별 조각)
+#   + 공용 router.<hash>.js: 폼이 바뀌면 상태 키(?mode=0&max=180&d=01234)를 만들어 바뀐 영역만 교체, URL 갱신
+# - 공용 CSS(theme.py 스타일시트 + 페이지 override)·SVG 스프라이트는 셸에서 한 번만 → 모든 상태가 공유
+# - 출력: dist/ (정적 호스팅 그대로). assets/·fragments/ 는 파일명에 해시가 있어 영구 캐시 가능:
+#     location ~ ^/(assets|fragments)/ { add_header Cache-Control "public, max-age=31536000, immutable"; }
+# - `python static_export.py [--out dist] [--pages shoulder,ski]`
+# =========================
+ROOT_DIR = Path(__file__).resolve().parent
+OUT_DIR = ROOT_DIR / "dist"
+MARKER = ".static-export"  # 이 표시가 있는 디렉터리만 통째로 교체(다른 폴더를 지우지 않도록)
+
+MAX_STEPS = range(60, 241, 10)
+FLAG_VALUES = "tfn"  # 외상, 발열, 신경 증상 체크박스 value
+
+STATIC_CSS = """
+/* --- Streamlit 밖에서 필요한 레이아웃/입력 요소 --- */
+body{ margin: 0; background: #ffffff; color: #101828; }
+.page{ max-width: 1200px; margin: 0 auto; padding: 20px 20px 40px 20px; }
+.nav{ display: flex; gap: 16px; margin-bottom: 14px; font-size: 14px; font-weight: 800; }
+.nav a{ color: #0B63F6; text-decoration: none; }
+.nav a[aria-current]{ color: #101828; }
+.layout{ display: grid; grid-template-columns: 36fr 64fr; gap: 32px; margin-top: 16px; align-items: start; }
+@media (max-width: 820px){ .layout{ grid-template-columns: 1fr; } }
+.control{ display: block; margin: 10px 0; font-size: 14px; }
+.control select, .control input[type=range]{ display: block; width: 100%; margin-top: 6px; }
+select{ padding: 8px 10px; border-radius: 14px; border: 1px solid rgba(11, 99, 246, 0.18); background: #ffffff; font: inherit; }
+.check{ display: flex; gap: 8px; align-items: flex-start; margin: 8px 0; font-size: 14px; }
+.alert{ padding: 12px 14px; border-radius: 10px; background: rgba(255, 189, 69, 0.2); color: #926c05; font-size: 14px; }
+.info{ padding: 12px 14px; border-radius: 10px; background: rgba(28, 131, 225, 0.1); color: #0054a3; font-size: 14px; }
+.caption{ color: rgba(49, 51, 63, 0.6); font-size: 13px; }
+.bars{ display: grid; grid-template-columns: repeat(3, 1fr); gap: 12px; margin: 4px 0 8px 0; font-size: 14px; }
+.bars progress{ width: 100%; accent-color: #0B63F6; }
+details.card summary{ cursor: pointer; font-weight: 900; }
+"""
+
+# 시작 시 주소의 상태(공유 링크) 또는 브라우저가 복원한 폼 값을 반영, 이후 입력마다 바뀐 영역만 교체
+# (줄을 이어 붙여 내보내므로 JS 안에 // 주석을 쓰지 않음)
+ROUTER_JS = """
+(function(){
+  var form=document.querySelector("form[data-states]");
+  if(!form)return;
+  var root=form.getAttribute("data-root"),cache={},manifest=null;
+  function key(){
+    var parts=[],seen={};
+    Array.prototype.forEach.call(form.elements,function(el){
+      if(!el.name||seen[el.name])return;
+      seen[el.name]=1;
+      var v=el.value;
+      if(el.type==="checkbox"){
+        v="";
+        form.querySelectorAll('input[name="'+el.name+'"]').forEach(function(c){if(c.checked)v+=c.value;});
+      }
+      parts.push(el.name+"="+v);
+    });
+    return parts.join("&");
+  }
+  function restore(){
+    new URLSearchParams(location.search).forEach(function(v,name){
+      form.querySelectorAll('[name="'+name+'"]').forEach(function(el){
+        if(el.type==="checkbox")el.checked=v.indexOf(el.value)>=0;else el.value=v;
+      });
+    });
+  }
+  function labels(){
+    form.querySelectorAll("output[for]").forEach(function(o){o.value=document.getElementById(o.htmlFor).value;});
+  }
+  function fragment(id){
+    return cache[id]||(cache[id]=fetch(root+"fragments/"+id+".html").then(function(r){
+      if(!r.ok)throw new Error(r.status);
+      return r.text();
+    }));
+  }
+  function render(e){
+    var k=key(),state=manifest.states[k];
+    labels();
+    if(!state)return;
+    if(e)history.replaceState(null,"","?"+k);
+    manifest.regions.forEach(function(name,i){
+      var el=document.querySelector('[data-region="'+name+'"]'),want=state[i].join(",");
+      if(el.getAttribute("data-ids")===want)return;
+      el.setAttribute("data-ids",want);
+      Promise.all(state[i].map(function(n){return fragment(manifest.fragments[n]);})).then(function(parts){
+        if(el.getAttribute("data-ids")===want)el.innerHTML=parts.join("");
+      });
+    });
+  }
+  form.addEventListener("submit",function(e){e.preventDefault();});
+  fetch(form.getAttribute("data-states")).then(function(r){return r.json();}).then(function(m){
+    manifest=m;
+    restore();
+    render();
+    form.addEventListener("input",render);
+  });
+})();
+"""
+
+
+# =========================
+# Site (content-hashed files)
+# =========================
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+class Site:
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+
+    def asset(self, name: str, ext: str, text: str) -> str:
+        data = text.encode("utf-8")
+        path = f"assets/{name}.{_digest(data)}.{ext}"
+        self.files[path] = data
+        return path
+
+    def fragment(self, markup: str) -> str:
+        data = markup.encode("utf-8")
+        fid = _digest(data)
+        self.files.setdefault(f"fragments/{fid}.html", data)
+        return fid
+
+    def size(self, prefix: str = "") -> int:
+        return sum(len(d) for p, d in self.files.items() if p.startswith(prefix))
+
+
+class StateTable:
+    """State key → fragment ids per region (serialised as indices into one fragment list)."""
+
+    def __init__(self, regions: Sequence[str]):
+        self.regions = list(regions)
+        self.fragments: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.states: Dict[str, List[List[int]]] = {}
+
+    def add(self, key: str, regions: Sequence[Sequence[str]]) -> None:
+        row = []
+        for ids in regions:
+            for fid in ids:
+                if fid not in self._index:
+                    self._index[fid] = len(self.fragments)
+                    self.fragments.append(fid)
+            row.append([self._index[fid] for fid in ids])
+        self.states[key] = row
+
+    def to_json(self) -> str:
+        return json.dumps({"regions": self.regions, "fragments": self.fragments, "states": self.states},
+                          separators=(",", ":"))
+
+
+def state_key(**params: str) -> str:
+    # router.js key()와 같은 규칙: 폼 요소 순서대로 name=value, 체크박스 묶음은 체크된 value를 이어 붙임
+    return "&".join(f"{k}={v}" for k, v in params.items())
+
+
+def regions(site: Site, table: StateTable, key: str) -> str:
+    # 셸에 미리 채우는 기본 상태(data-ids가 같으면 router.js는 다시 받지 않음)
+    out = []
+    for name, row in zip(table.regions, table.states[key]):
+        body = "".join(site.files[f"fragments/{table.fragments[n]}.html"].decode("utf-8") for n in row)
+        out.append(f"<div data-region='{name}' data-ids='{','.join(map(str, row))}'>{body}</div>")
+    return "".join(out)
+
+
+def state_form(root: str, states: str) -> str:
+    # router.js는 이 폼의 요소로 상태 키를 만들고, data-states의 상태 목록에서 조각을 찾음
+    return f"<form class='card' data-states='{root}{states}' data-root='{root}'>"
+
+
+def shell(page: str, title: str, icon: str, root: str, css: List[str], router: str, body: str) -> str:
+    links = "".join(f"<link rel='stylesheet' href='{root}{href}'>" for href in css)
+    nav = "".join(
+        f"<a href='{root}{href}'{' aria-current=page' if name == page else ''}>{label}</a>"
+        for name, href, label in (("shoulder", "", "🦴 어깨 가이드"), ("ski", "ski/", "⛷️ 스키장"))
+    )
+    favicon = f"data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>{icon}</text></svg>"
+    return (
+        "<!doctype html><html lang='ko'><head><meta charset='utf-8'>"
+        "<meta name='viewport' content='width=device-width, initial-scale=1'>"
+        f"<title>{html.escape(title)}</title><link rel='icon' href=\"{favicon}\">{links}"
+        f"<script defer src='{root}{router}'></script></head>"
+        f"<body {PAGE_ATTR}='{page}'><div class='page'><nav class='nav'>{nav}</nav>{body}"
+        "<noscript><div class='small'>자바스크립트를 켜면 선택에 따라 결과가 바뀌어요.</div></noscript>"
+        "</div></body></html>"
+    )
+
+
+def checkbox(name: str, value: str, label: str, checked: bool = False) -> str:
+    return (f"<label class='check'><input type='checkbox' name='{name}' value='{value}'"
+            f"{' checked' if checked else ''}> {html.escape(label)}</label>")
+
+
+# =========================
+# Shoulder
+# =========================
+def export_shoulder(site: Site, base_css: str, router: str) -> StateTable:
+    guide = ShoulderGuide.load()
+    pack = guide.pack
+    names = list(pack.symptoms)
+    table = StateTable(["summary", "tests", "exercises"])
+
+    sections = {}
+    for name in names:
+        ranked = guide.recommend((name,))
+        sections[name] = (
+            site.fragment(render_tests_section(pack, [k for k, _, _ in ranked["tests"]])),
+            site.fragment(render_exercises_section(pack, [k for k, _, _ in ranked["exercises"]])),
+        )
+    for s, name in enumerate(names):
+        for flags in itertools.product((False, True), repeat=len(RED_FLAG_CHECKS)):
+            alerts = red_flag_alerts(flags)
+            summary = (
+                "<div class='card'><div class='section-title grad-text'>✨ 요약 카드</div>"
+                f"<p><b>선택한 증상:</b> {html.escape(name)}</p><p><b>관련 키워드:</b></p>"
+                f"{badges(guide.index.selected_tags((name,)))}"
+                + (f"<div class='hr'></div><div class='alert'>{html.escape(' '.join(alerts))}</div>" if alerts else "")
+                + "</div>"
+            )
+            rf = "".join(v for v, on in zip(FLAG_VALUES, flags) if on)
+            tests, exercises = sections[name]
+            table.add(state_key(s=str(s), rf=rf), [[site.fragment(summary)], [tests], [exercises]])
+
+    states = site.asset("shoulder-states", "json", table.to_json())
+    options = "".join(f"<option value='{i}'>{html.escape(n)}</option>" for i, n in enumerate(names))
+    checks = "".join(checkbox("rf", v, label) for v, label in zip(FLAG_VALUES, RED_FLAG_CHECKS))
+    body = (
+        SHOULDER_HERO
+        + "<details class='card' style='margin-top:14px;'><summary>🚨 레드플래그(이 경우 ‘자가검사’보다 ‘진료’가 먼저예요!)</summary>"
+        + f"<ul>{''.join(f'<li>{html.escape(x)}</li>' for x in RED_FLAGS)}</ul></details>"
+        + "<div class='layout'>" + state_form("", states)
+        + "<div class='section-title grad-text'>🧩 1) 증상 선택</div>"
+        + f"<label class='control'>어떤 증상이 가장 주된가요? 🤔<select name='s'>{options}</select></label>"
+        + "<div class='hr'></div><div class='section-title grad-text'>🧷 2) 체크(선택)</div>"
+        + checks
+        + "<div class='hr'></div><div class='small'>📝 이 앱은 교육용이에요. 검사 중 통증이 과하면 즉시 중단하세요.</div>"
+        + "</form><div>"
+        + regions(site, table, state_key(s="0", rf=""))
+        + "</div></div>"
+        + "<div class='note' style='text-align:center; margin-top:16px;'>💙 Made with Streamlit | 🌼 White background + colorful accents | 🧠 Educational use only</div>"
+        # 운동 그림 공용 스프라이트(<symbol>/<style>) — 셸에 한 번, 모든 상태의 그림이 <use>로 참조
+        + pack.sprite
+    )
+    css = [base_css]
+    overrides = page_css(ROOT_DIR / "main.py")
+    if overrides:
+        css.append(site.asset("shoulder", "css", scope_css(overrides, "shoulder")))
+    site.files["index.html"] = shell("shoulder", "🌈 어깨 통증 검사 & 운동 가이드", "🦴", "",
+                                     css, router, body).encode("utf-8")
+    return table
+
+
+# =========================
+# Ski
+# =========================
+def difficulty_bars(r) -> str:
+    # 앱의 st.progress 세 칸과 같은 내용
+    if r.beginner is None or r.intermediate is None or r.advanced is None:
+        return "<div class='caption'>🎚️ 난이도 비율은 공식 슬로프 현황/맵에서 확인 권장(앱은 정성 요약 제공).</div>"
+    cells = "".join(
+        f"<div><div class='caption'>{label}</div><progress max='100' value='{v}'></progress><div><b>{v}%</b></div></div>"
+        for label, v in (("🟢 초급", r.beginner), ("🟦 중급", r.intermediate), ("🔥 상급", r.advanced))
+    )
+    return f"<div class='bars'>{cells}</div>"
+
+
+def export_ski(site: Site, base_css: str, router: str) -> StateTable:
+    planner = SkiPlanner.load()
+    catalog = planner.catalog
+    links = LinkHealth()  # 마지막 점검 결과(캐시)만 사용 — 알려진 불량 링크는 앱과 똑같이 대체
+    table = StateTable(["summary", "cards"])
+
+    cards: Dict[tuple, str] = {}
+    subsets = [c for n in range(len(DIFFICULTY_BUCKETS) + 1)
+               for c in itertools.combinations(range(len(DIFFICULTY_BUCKETS)), n)]
+    for m, mode in enumerate(MODES):
+        for max_minutes in MAX_STEPS:
+            for subset in subsets:
+                result = planner.query(SkiQuery("", mode, max_minutes, tuple(DIFFICULTY_BUCKETS[b] for b in subset)))
+                ids = []
+                for rng, i in zip(result.ranges, result.hits):
+                    # 카드 내용은 (이동수단, 리조트)에만 의존 → 상태가 달라도 같은 조각
+                    if (m, i) not in cards:
+                        r = catalog.resorts[i]
+                        markup = resort_card(r, rng, DIFFICULTY_BUCKETS[catalog.bucket[i]], links, ORIGIN_DEFAULT)
+                        cards[m, i] = site.fragment(markup + difficulty_bars(r) + "<div class='hr'></div>")
+                    ids.append(cards[m, i])
+                if ids:
+                    summary = (f"<p>✅ <b>{mode} 기준 {max_minutes}분 이내:</b> <b>{len(ids)}곳</b></p>"
+                               "<div class='hr'></div>")
+                else:
+                    summary = ("<div class='info'>조건에 맞는 스키장이 없습니다. "
+                               "최대 소요시간을 늘리거나 난이도 필터를 조정해보세요.</div>")
+                d = "".join(str(b) for b in subset)
+                table.add(state_key(mode=str(m), max=str(max_minutes), d=d), [[site.fragment(summary)], ids])
+
+    states = site.asset("ski-states", "json", table.to_json())
+    options = "".join(f"<option value='{i}'>{html.escape(mode)}</option>" for i, mode in enumerate(MODES))
+    checks = "".join(checkbox("d", str(b), label, checked=True) for b, label in enumerate(DIFFICULTY_BUCKETS))
+    body = (
+        ski_hero([ORIGIN_DEFAULT], default=True)
+        + "<div class='layout'>" + state_form("../", states)
+        + "<div class='section-title grad-text'>🧭 필터</div>"
+        + f"<div class='small'>📌 출발지: {html.escape(ORIGIN_DEFAULT)} (정적 페이지는 기본 출발지 기준)</div>"
+        + f"<label class='control'>이동수단 🚗🚌🚄<select name='mode'>{options}</select></label>"
+        + f"<label class='control'>최대 소요시간(분) ⏱️ <output for='max'>180</output>"
+        + f"<input type='range' id='max' name='max' min='{MAX_STEPS.start}' max='{MAX_STEPS[-1]}' step='{MAX_STEPS.step}' value='180'></label>"
+        + "<div class='hr'></div><div class='control'>선호 난이도 성향(선택) 🎯</div>"
+        + checks
+        + "<div class='hr'></div><div class='note'>💡 팁: 주말에는 ‘상한(최대 소요시간)’ 기준으로 보는 것이 안전합니다.</div>"
+        + "</form><div class='card'><div class='section-title grad-text'>📋 결과</div>"
+        + regions(site, table, state_key(mode="0", max="180", d="".join(map(str, range(len(DIFFICULTY_BUCKETS))))))
+        + "</div></div>"
+        + "<div class='note' style='text-align:center; margin-top:16px;'>❄️ 실제 출발 전에는 실시간 교통(지도앱 ETA)으로 최종 확인을 권장합니다.</div>"
+    )
+    site.files["ski/index.html"] = shell("ski", "⛷️ 옥수동 3시간 이내 스키장 + 난이도/슬로프맵", "❄️", "../",
+                                         [base_css], router, body).encode("utf-8")
+    return table
+
+
+PAGES = {"shoulder": export_shoulder, "ski": export_ski}
+
+
+# =========================
+# Write
+# =========================
+def write_site(site: Site, out: Path) -> None:
+    """Write into a sibling temp dir, then swap it in (a half-written site is never served)."""
+    if out.exists() and any(out.iterdir()) and not (out / MARKER).exists():
+        raise SystemExit(f"{out} 는 정적 내보내기 폴더가 아니에요({MARKER} 없음) — 다른 --out 을 지정하세요")
+    tmp = out.with_name(f"{out.name}.{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    for rel, data in site.files.items():
+        path = tmp / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    (tmp / MARKER).write_text("")
+    old = out.with_name(f"{out.name}.{os.getpid()}.old")
+    if out.exists():
+        os.replace(out, old)
+    os.replace(tmp, out)
+    shutil.rmtree(old, ignore_errors=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="페이지 상태 전체를 정적 HTML로 내보내기")
+    parser.add_argument("--out", type=Path, default=OUT_DIR)
+    parser.add_argument("--pages", default=",".join(PAGES), help="쉼표 구분: " + ",".join(PAGES))
+    args = parser.parse_args(argv)
+
+    site = Site()
+    base_css = site.asset("theme", "css", STYLESHEET + minify_css(STATIC_CSS))
+    router = site.asset("router", "js", "".join(line.strip() for line in ROUTER_JS.splitlines()))
+    tables = {}
+    for page in args.pages.split(","):
+        page = page.strip()
+        if page not in PAGES:
+            parser.error(f"알 수 없는 페이지: {page}")
+        tables[page] = PAGES[page](site, base_css, router)
+
+    sizes = {fid: len(site.files[f"fragments/{fid}.html"]) for t in tables.values() for fid in t.fragments}
+    for page, t in tables.items():
+        # 상태마다 완성 페이지를 따로 만들었다면(셸 제외) 필요했을 bytes와 비교
+        naive = sum(sizes[t.fragments[n]] for row in t.states.values() for ids in row for n in ids)
+        unique = sum(sizes[fid] for fid in t.fragments)
+        print(f"{page:<9} 상태 {len(t.states):5,}개 · 조각 {len(t.fragments):4,}개 {unique:10,} bytes "
+              f"(상태별로 저장했다면 {naive:12,} bytes)")
+    write_site(site, args.out)
+    print(f"✅ {args.out}: 파일 {len(site.files) + 1:,}개 · {site.size():,} bytes "
+          f"(assets {site.size('assets/'):,} · fragments {site.size('fragments/'):,})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,273 @@
+import ast
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List
+
+import streamlit as st
+
+# =============================
+# Shared theme (white + blue, candy accents)
+# - 페이지마다 복사되던 공통 CSS(.hero/.card/.badge/.hr/버튼/셀렉트)를 한 곳에 모음
+# - 최소화 + 내용 해시로 버전을 붙여 세션당 한 번만 <head>에 주입 → 재실행마다 다시 보내지 않음
+# - 페이지별 차이는 overrides로: body[data-theme-page="…"] 아래로 범위를 좁혀
+#   다른 페이지로 이동해도 서로 섞이지 않음 (이동할 때만 작은 스크립트로 속성 변경)
+# - 강조색(그라데이션)은 CSS 변수로 두고 페이지 override에서 변수만 바꿈
+# =============================
+BASE_CSS = """
+/* --- 강조색 변수(페이지 override에서 교체) --- */
+:root{
+  --accent-grad: linear-gradient(90deg, #0B63F6, #2EA8FF, #7C3AED);
+  --button-grad: linear-gradient(90deg, #0B63F6 0%, #2EA8FF 45%, #7C3AED 100%);
+  --hr-grad: linear-gradient(90deg, transparent, rgba(11,99,246,0.25), rgba(124,58,237,0.22), transparent);
+}
+
+/* --- 전체: 화이트 배경 --- */
+.stApp{
+  background: #ffffff;
+  color: #101828;
+}
+
+/* --- 폰트 --- */
+html, body, [class*="css"]{
+  font-family: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, "Noto Sans KR",
+               "Apple SD Gothic Neo", "Malgun Gothic", sans-serif;
+}
+
+/* --- 상단 히어로(그라데이션) --- */
+.hero{
+  border-radius: 18px;
+  padding: 18px 20px;
+  background:
+    radial-gradient(circle at 10% 20%, rgba(255, 88, 174, 0.20), transparent 40%),
+    radial-gradient(circle at 90% 20%, rgba(0, 209, 255, 0.18), transparent 40%),
+    radial-gradient(circle at 30% 90%, rgba(0, 255, 187, 0.14), transparent 45%),
+    linear-gradient(90deg, #0B63F6 0%, #2EA8FF 45%, #7C3AED 100%);
+  box-shadow: 0 16px 40px rgba(12, 74, 255, 0.18);
+  color: white;
+}
+.hero-title, .hero h1{
+  margin: 0;
+  font-size: 28px;
+  font-weight: 900;
+  letter-spacing: -0.4px;
+  text-shadow: 0 10px 30px rgba(0,0,0,0.25);
+}
+.hero-sub, .hero p{
+  margin: 6px 0 0 0;
+  font-size: 13.5px;
+  opacity: 0.95;
+  line-height: 1.5;
+}
+
+/* --- 카드 --- */
+.card{
+  background: rgba(255,255,255,0.95);
+  border: 1px solid rgba(15, 23, 42, 0.10);
+  border-radius: 18px;
+  padding: 16px 16px 12px 16px;
+  box-shadow: 0 14px 40px rgba(2, 6, 23, 0.08);
+}
+.card + .card{ margin-top: 14px; }
+
+.section-title{
+  font-size: 15px;
+  font-weight: 900;
+  margin: 0 0 10px 0;
+  letter-spacing: -0.2px;
+}
+
+/* --- 섹션 라벨(그라데이션 텍스트) --- */
+.grad-text{
+  background: var(--accent-grad);
+  -webkit-background-clip: text;
+  -webkit-text-fill-color: transparent;
+}
+
+/* --- 배지(칩) --- */
+.badge{
+  display: inline-block;
+  padding: 6px 10px;
+  border-radius: 999px;
+  background: rgba(11, 99, 246, 0.08);
+  border: 1px solid rgba(11, 99, 246, 0.14);
+  color: #0B63F6;
+  margin-right: 6px;
+  margin-bottom: 6px;
+  font-size: 13px;
+  font-weight: 800;
+}
+
+/* --- 구분선 --- */
+.hr{
+  height: 1px;
+  margin: 12px 0;
+  background: var(--hr-grad);
+}
+
+/* --- 안내문 --- */
+.note{
+  color: rgba(16, 24, 40, 0.72);
+  font-size: 13px;
+  line-height: 1.55;
+}
+.small{
+  color: rgba(16, 24, 40, 0.65);
+  font-size: 12.5px;
+  line-height: 1.5;
+}
+
+/* --- 버튼 --- */
+div.stButton > button{
+  background: var(--button-grad);
+  color: white;
+  font-weight: 900;
+  border: none;
+  border-radius: 14px;
+  padding: 0.78rem 1.0rem;
+  box-shadow: 0 16px 36px rgba(11,99,246,0.22);
+}
+div.stButton > button:hover{
+  filter: brightness(1.03);
+  transform: translateY(-1px);
+}
+
+/* --- 셀렉트 박스 --- */
+[data-baseweb="select"] > div{
+  background: #ffffff !important;
+  border-radius: 14px !important;
+  border: 1px solid rgba(11, 99, 246, 0.18) !important;
+  box-shadow: 0 10px 22px rgba(2, 6, 23, 0.05);
+}
+"""
+
+PAGE_ATTR = "data-theme-page"
+
+
+def minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def scope_css(css: str, page: str) -> str:
+    """Prefix every rule with ``body[data-theme-page=page]`` (flat rules only, no @media)."""
+    scope = f'body[{PAGE_ATTR}="{page}"]'
+    out = []
+    for rule in minify_css(css).split("}"):
+        if "{" not in rule:
+            continue
+        selectors, body = rule.split("{", 1)
+        scoped = []
+        for sel in selectors.split(","):
+            sel = sel.strip()
+            if sel in (":root", "body", "html"):
+                scoped.append(scope)
+            else:
+                scoped.append(f"{scope} {sel}")
+        out.append(f"{','.join(scoped)}{{{body}}}")
+    return "".join(out)
+
+
+STYLESHEET = minify_css(BASE_CSS)
+VERSION = hashlib.sha1(STYLESHEET.encode("utf-8")).hexdigest()[:8]
+
+
+@lru_cache(maxsize=16)
+def _page_stylesheet(page: str, overrides: str) -> str:
+    return scope_css(overrides, page)
+
+
+# =============================
+# Injection
+# =============================
+def inject_once(key: str, markup: str, family: str = "") -> None:
+    # 세션(브라우저 탭)당 한 번만 문서 <body>에 붙여 두고, 이후 재실행에서는 다시 보내지 않음
+    # family: 같은 family의 이전 버전(key가 다른 것)은 지우고 붙임 → 버전이 바뀐 마크업이 옛 것과 섞이지 않음
+    flag = f"_injected_{key}"
+    if st.session_state.get(flag):
+        return
+    st.html(
+        "<script>(function(){"
+        f"if(document.getElementById({json.dumps(key)}))return;"
+        f"var f={json.dumps(family)};"
+        "if(f)document.querySelectorAll('[data-inject-family]').forEach(function(o){"
+        "if(o.getAttribute('data-inject-family')===f)o.remove();});"
+        f"var d=document.createElement('div');d.id={json.dumps(key)};d.innerHTML={json.dumps(markup)};"
+        "if(f)d.setAttribute('data-inject-family',f);"
+        "document.body.appendChild(d);})();</script>",
+        unsafe_allow_javascript=True,
+    )
+    st.session_state[flag] = True
+
+
+def _inject_style_once(key: str, css: str) -> None:
+    flag = f"_injected_{key}"
+    if st.session_state.get(flag):
+        return
+    st.html(
+        "<script>(function(){"
+        f"if(document.getElementById({json.dumps(key)}))return;"
+        f"var s=document.createElement('style');s.id={json.dumps(key)};s.textContent={json.dumps(css)};"
+        "document.head.appendChild(s);})();</script>",
+        unsafe_allow_javascript=True,
+    )
+    st.session_state[flag] = True
+
+
+def use_theme(page: str, overrides: str = "") -> None:
+    """Shared stylesheet once per session + this page's scoped overrides."""
+    _inject_style_once(f"theme-{VERSION}", STYLESHEET)
+    if overrides:
+        css = _page_stylesheet(page, overrides)
+        digest = hashlib.sha1(css.encode("utf-8")).hexdigest()[:8]
+        _inject_style_once(f"theme-{page}-{digest}", css)
+    # 페이지가 바뀐 경우에만 body 속성을 갱신(같은 페이지 재실행에서는 아무것도 보내지 않음)
+    if st.session_state.get("_theme_page") != page:
+        st.html(
+            f"<script>document.body.setAttribute({json.dumps(PAGE_ATTR)},{json.dumps(page)});</script>",
+            unsafe_allow_javascript=True,
+        )
+        st.session_state["_theme_page"] = page
+
+
+# =============================
+# Components
+# =============================
+def badge(text: str) -> str:
+    return f"<span class='badge'>{text}</span>"
+
+
+def badges(items: List[str]) -> str:
+    return "".join([badge(x) for x in items])
+
+
+def byte_report(pages: Dict[str, str]) -> List[str]:
+    """Per-rerun bytes: inline <style> every rerun vs. shared stylesheet injected once."""
+    lines = [f"공통 스타일시트 v{VERSION}: 원본 {len(BASE_CSS.encode('utf-8')):,} → 최소화 {len(STYLESHEET.encode('utf-8')):,} bytes"]
+    for page, overrides in pages.items():
+        before = len(f"<style>{BASE_CSS}{overrides}</style>".encode("utf-8"))
+        first = len((STYLESHEET + _page_stylesheet(page, overrides)).encode("utf-8"))
+        lines.append(
+            f"  {page:<10} 재실행당 {before:,} → 0 bytes "
+            f"(세션 첫 실행 시 {first:,} bytes)"
+        )
+    return lines
+
+
+def page_css(path: Path) -> str:
+    """A page script's ``PAGE_CSS`` read via AST (the script itself is not executed); "" if none."""
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "PAGE_CSS" for t in node.targets):
+            return ast.literal_eval(node.value)
+    return ""
+
+
+if __name__ == "__main__":
+    # 각 페이지의 PAGE_CSS만 읽어 와 비교(페이지 스크립트는 실행하지 않음)
+    root = Path(__file__).resolve().parent
+    pages = {page: page_css(path) for page, path in (("shoulder", root / "main.py"), ("ski", root / "pages" / "01_ski.py"))}
+    print("\n".join(byte_report(pages)))